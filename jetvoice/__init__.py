@@ -1,3 +1,17 @@
-from jetvoice.stt import transcribe
-from jetvoice.llm import JetVoiceLLM
-from jetvoice.tts import JetVoiceTTS
+import importlib
+
+# Resolved on first access, so importing a submodule (e.g. jetvoice.vad.sweep)
+# doesn't load the Vosk model, the TTS engine or the OpenAI client
+_EXPORTS = {
+    "transcribe": "jetvoice.stt",
+    "JetVoiceLLM": "jetvoice.llm",
+    "JetVoiceTTS": "jetvoice.tts",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        return getattr(importlib.import_module(_EXPORTS[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
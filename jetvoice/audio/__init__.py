@@ -0,0 +1,3 @@
+from .frontend import AudioFrontend
+from .frontend import load_wav
+from .monitor import CaptureMonitor
@@ -0,0 +1,280 @@
+import math
+import sys
+import time
+import wave
+from typing import Optional
+
+import numpy as np
+
+
+# Scale factors mapping each supported input format to [-1.0, 1.0)
+DTYPE_SCALES = {
+    "uint8": 128.0,
+    "int16": 32768.0,
+    "int32": 2147483648.0,
+    "float32": 1.0,
+}
+
+# WAV sample width (bytes) -> dtype name
+WAV_DTYPES = {1: "uint8", 2: "int16", 4: "int32"}
+
+
+# Resampler filter spec: flat to PASSBAND_EDGE of the lower Nyquist, at least
+# STOPBAND_DB down from that Nyquist on (8 kHz for a 16 kHz pipeline)
+PASSBAND_EDGE = 0.875
+STOPBAND_DB = 70.0
+
+
+def polyphase_taps(up: int, down: int, stopband_db: float = STOPBAND_DB) -> int:
+    """
+    Input samples per output sample needed for the Kaiser design in
+    design_polyphase(); grows with max(up, down) / up, i.e. with how far below
+    the input Nyquist the output Nyquist sits.
+    """
+    # Transition band in cycles per upsampled sample
+    width = (1.0 - PASSBAND_EDGE) * 0.5 / max(up, down)
+    n_taps = (stopband_db - 8.0) / (2.285 * 2 * math.pi * width)
+    return int(math.ceil(n_taps / up))
+
+
+def design_polyphase(up: int, down: int, taps_per_phase: Optional[int] = None,
+                     stopband_db: float = STOPBAND_DB) -> np.ndarray:
+    """
+    Kaiser-windowed sinc anti-aliasing filter split into `up` polyphase branches.
+
+    The passband reaches PASSBAND_EDGE of the lower Nyquist and the stopband
+    starts at that Nyquist, `stopband_db` down. `taps_per_phase` defaults to
+    polyphase_taps(up, down, stopband_db).
+
+    Returns:
+        np.ndarray of shape (up, taps_per_phase); row p holds the taps used
+        for output samples that land on phase p of the upsampled grid.
+    """
+    taps_per_phase = taps_per_phase or polyphase_taps(up, down, stopband_db)
+    n_taps = up * taps_per_phase
+    # Cutoff in cycles per upsampled sample, centred in the transition band
+    cutoff = 0.5 / max(up, down) * (1.0 + PASSBAND_EDGE) / 2.0
+    beta = 0.1102 * (stopband_db - 8.7)
+    n = np.arange(n_taps) - (n_taps - 1) / 2.0
+    h = 2 * cutoff * np.sinc(2 * cutoff * n) * np.kaiser(n_taps, beta)
+    h *= up / h.sum()  # unity DC gain after zero-stuffing
+    return h.reshape(taps_per_phase, up).T.copy()
+
+
+class AudioFrontend:
+    """
+    Converts device-native audio to the pipeline format (mono int16 at out_rate).
+
+    Every step is vectorized with NumPy, no per-sample Python loops:
+        1. Format conversion to float (uint8/int16/int32/float32).
+        2. Channel downmix (mean of interleaved channels).
+        3. DC removal (running mean, updated once per block).
+        4. Polyphase resampling by up/down = out_rate/in_rate (reduced).
+        5. float -> int16 with clipping.
+
+    The resampler keeps its history between calls, so it can be fed
+    arbitrarily sized blocks from a live stream.
+
+    Usage:
+        frontend = AudioFrontend(in_rate=48000, channels=2, dtype="float32")
+        pcm16 = frontend.process(raw_bytes)
+    """
+
+    def __init__(
+        self,
+        in_rate: int,
+        channels: int = 1,
+        dtype: str = "int16",
+        out_rate: int = 16000,
+        dc_removal: bool = True,
+        dc_time_constant_s: float = 0.5,
+        taps_per_phase: Optional[int] = None,
+    ) -> None:
+        """
+        Args:
+            in_rate: Device sample rate in Hz (e.g. 44100, 48000).
+            channels: Interleaved channel count of the input.
+            dtype: Input sample format, one of DTYPE_SCALES.
+            out_rate: Output sample rate in Hz.
+            dc_removal: Subtract a running estimate of the DC offset.
+            dc_time_constant_s: Time constant of the DC estimate.
+            taps_per_phase: Filter length per polyphase branch; None sizes it for
+                STOPBAND_DB of rejection above the output Nyquist.
+        """
+        if dtype not in DTYPE_SCALES:
+            raise ValueError(f"dtype must be one of {', '.join(DTYPE_SCALES)}")
+        if in_rate <= 0 or out_rate <= 0 or channels < 1:
+            raise ValueError("in_rate, out_rate and channels must be positive")
+
+        self.in_rate = in_rate
+        self.out_rate = out_rate
+        self.channels = channels
+        self.dtype = dtype
+        self.dc_removal = dc_removal
+        self.dc_time_constant_s = dc_time_constant_s
+
+        g = math.gcd(in_rate, out_rate)
+        self.up = out_rate // g
+        self.down = in_rate // g
+        self._poly = design_polyphase(self.up, self.down, taps_per_phase) if self.up != self.down else None
+        self._taps = self._poly.shape[1] if self._poly is not None else 1
+
+        self._dc: Optional[float] = None
+        self._pending = b""
+        self.reset()
+
+    @property
+    def passthrough(self) -> bool:
+        """
+        True when the input is already the output format and nothing needs doing.
+        """
+        return (self.up == self.down and self.channels == 1
+                and self.dtype == "int16" and not self.dc_removal)
+
+    def reset(self) -> None:
+        """
+        Clears resampler history and the DC estimate (e.g. after a stream restart).
+        """
+        self._history = np.zeros(self._taps - 1, dtype=np.float64)
+        self._history_start = -(self._taps - 1)  # global input index of _history[0]
+        self._next_out = 0
+        self._dc = None
+        self._pending = b""
+
+    def _to_float(self, data: bytes) -> np.ndarray:
+        frame_bytes = np.dtype(self.dtype).itemsize * self.channels
+        usable = len(data) - len(data) % frame_bytes
+        # Keep a partial trailing frame for the next call
+        self._pending = data[usable:]
+
+        x = np.frombuffer(data[:usable], dtype=self.dtype).astype(np.float64)
+        if self.dtype == "uint8":
+            x -= 128.0
+        x /= DTYPE_SCALES[self.dtype]
+
+        if self.channels > 1:
+            x = x.reshape(-1, self.channels).mean(axis=1)
+        return x
+
+    def _remove_dc(self, x: np.ndarray) -> np.ndarray:
+        if not len(x):
+            return x
+        mean = float(x.mean())
+        if self._dc is None:
+            self._dc = mean
+        else:
+            alpha = 1.0 - math.exp(-len(x) / (self.in_rate * self.dc_time_constant_s))
+            self._dc += alpha * (mean - self._dc)
+        return x - self._dc
+
+    def _resample(self, x: np.ndarray) -> np.ndarray:
+        buf = np.concatenate((self._history, x))
+        end = self._history_start + len(buf)  # one past the last global input index
+
+        # Output k uses input base = (k * down) // up, which must be < end
+        k_end = (end * self.up + self.down - 1) // self.down
+        ks = np.arange(self._next_out, k_end)
+
+        pos = ks * self.down
+        base = pos // self.up
+        phase = pos % self.up
+
+        idx = (base - self._history_start)[:, None] - np.arange(self._taps)[None, :]
+        y = np.einsum("ij,ij->i", buf[idx], self._poly[phase])
+
+        self._next_out = k_end
+        keep_from = (k_end * self.down) // self.up - (self._taps - 1)
+        self._history = buf[keep_from - self._history_start:]
+        self._history_start = keep_from
+        return y
+
+    def process_float(self, data: bytes) -> np.ndarray:
+        """
+        Same as process() but returns float64 samples in [-1, 1) at out_rate.
+        """
+        x = self._to_float(self._pending + data)
+        if self.dc_removal:
+            x = self._remove_dc(x)
+        if self._poly is not None:
+            x = self._resample(x)
+        return x
+
+    def process(self, data: bytes) -> bytes:
+        """
+        Converts a block of raw device audio to PCM16 mono bytes at out_rate.
+        """
+        if self.passthrough:
+            return data
+        y = self.process_float(data)
+        return np.clip(np.round(y * 32768.0), -32768, 32767).astype("<i2").tobytes()
+
+
+def load_wav(path: str, out_rate: int = 16000, dc_removal: bool = False) -> bytes:
+    """
+    Reads a PCM WAV file of any rate/channel count and returns PCM16 mono bytes at out_rate.
+
+    Raises:
+        TypeError: If the WAV is compressed or uses an unsupported sample width.
+    """
+    with wave.open(path, "rb") as wf:
+        if wf.getcomptype() != "NONE" or wf.getsampwidth() not in WAV_DTYPES:
+            raise TypeError(
+                f"Unsupported WAV: {wf.getsampwidth() * 8}-bit, compression {wf.getcomptype()}"
+            )
+        frontend = AudioFrontend(
+            in_rate=wf.getframerate(),
+            channels=wf.getnchannels(),
+            dtype=WAV_DTYPES[wf.getsampwidth()],
+            out_rate=out_rate,
+            dc_removal=dc_removal,
+        )
+        return frontend.process(wf.readframes(wf.getnframes()))
+
+
+def benchmark(seconds: float = 60.0, in_rate: int = 48000, channels: int = 2,
+              dtype: str = "float32", block_ms: int = 20) -> dict:
+    """
+    Measures front-end throughput on synthetic audio, both streamed in
+    live-sized blocks and converted in a single call.
+
+    Returns:
+        dict with seconds of audio processed per second of wall time.
+    """
+    rng = np.random.default_rng(0)
+    n = int(seconds * in_rate)
+    audio = (0.1 * rng.standard_normal(n * channels)).astype(np.float32)
+    if dtype != "float32":
+        scale = DTYPE_SCALES[dtype]
+        audio = (audio * (scale - 1)).astype(dtype)
+    raw = audio.tobytes()
+
+    block = int(in_rate * block_ms / 1000) * channels * np.dtype(dtype).itemsize
+
+    frontend = AudioFrontend(in_rate=in_rate, channels=channels, dtype=dtype)
+    start = time.perf_counter()
+    for offset in range(0, len(raw), block):
+        frontend.process(raw[offset:offset + block])
+    streamed = time.perf_counter() - start
+
+    frontend = AudioFrontend(in_rate=in_rate, channels=channels, dtype=dtype)
+    start = time.perf_counter()
+    frontend.process(raw)
+    bulk = time.perf_counter() - start
+
+    return {
+        "audio_seconds": seconds,
+        "streamed_x_realtime": seconds / streamed,
+        "bulk_x_realtime": seconds / bulk,
+    }
+
+
+if __name__ == "__main__":
+    # This block runs when you execute: python -m jetvoice.audio.frontend [in_rate] [channels] [dtype]
+    in_rate = int(sys.argv[1]) if len(sys.argv) > 1 else 48000
+    channels = int(sys.argv[2]) if len(sys.argv) > 2 else 2
+    dtype = sys.argv[3] if len(sys.argv) > 3 else "float32"
+
+    result = benchmark(in_rate=in_rate, channels=channels, dtype=dtype)
+    print(f"--- Audio front-end: {in_rate} Hz, {channels} ch, {dtype} -> 16000 Hz mono int16 ---")
+    print(f"Streamed (20 ms blocks): {result['streamed_x_realtime']:.1f}x real time")
+    print(f"Bulk                   : {result['bulk_x_realtime']:.1f}x real time")
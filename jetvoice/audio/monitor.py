@@ -0,0 +1,244 @@
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+
+DROP_OLDEST = "drop_oldest"
+SKIP_TO_LIVE = "skip_to_live"
+FAIL = "fail"
+POLICIES = (DROP_OLDEST, SKIP_TO_LIVE, FAIL)
+
+
+class CaptureLagError(RuntimeError):
+    """
+    Raised by CaptureMonitor.get() under the "fail" policy.
+    """
+
+
+@dataclass
+class CaptureStats:
+    """
+    Capture health metrics. Overflow/underflow counts come from PortAudio's
+    callback status; lag is how far the consumer is behind real time.
+    """
+    chunks: int = 0
+    overflows: int = 0
+    underflows: int = 0
+    dropped_chunks: int = 0
+    skips: int = 0
+    queue_full: int = 0
+    depth: int = 0
+    max_depth: int = 0
+    lag_s: float = 0.0
+    max_lag_s: float = 0.0
+
+    def __str__(self) -> str:
+        return (
+            f"chunks={self.chunks}, overflows={self.overflows}, underflows={self.underflows}, "
+            f"dropped={self.dropped_chunks}, skips={self.skips}, queue_full={self.queue_full}, "
+            f"depth={self.depth} (max {self.max_depth}), "
+            f"lag={self.lag_s * 1000:.0f} ms (max {self.max_lag_s * 1000:.0f} ms)"
+        )
+
+
+class CaptureMonitor:
+    """
+    Bounded queue between the PortAudio callback and the processing loop
+    that also tracks capture health.
+
+    put() is called from the audio callback and never blocks. get() returns
+    the next chunk and applies the lag policy once the oldest queued chunk
+    is more than `max_lag_s` behind real time:
+
+        drop_oldest  - discard stale chunks and continue with the freshest ones
+        skip_to_live - discard the whole backlog; get() reports a resync so the
+                       caller can reset its state machine
+        fail         - raise CaptureLagError
+
+    The same policy applies when the queue reaches `max_queue` items.
+
+    Lag only counts while the loop is consuming: between pause() and resume()
+    (e.g. a blocking STT/LLM call) chunks are still queued, but on resume their
+    capture times are shifted forward by the paused interval, and a full queue
+    just drops the oldest chunk.
+
+    Usage:
+        monitor = CaptureMonitor(max_queue=250, max_lag_s=1.0, policy="skip_to_live")
+        # in the callback
+        monitor.put(bytes(indata), status)
+        # in the loop
+        chunk, resynced = monitor.get()
+        monitor.pause()
+        ...  # deliberate blocking work
+        monitor.resume()
+    """
+
+    def __init__(
+        self,
+        max_queue: int = 250,
+        max_lag_s: float = 1.0,
+        policy: str = DROP_OLDEST,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Args:
+            max_queue: Maximum queued chunks (250 x 20 ms = 5 s of audio).
+            max_lag_s: Lag behind real time that triggers the policy.
+            policy: One of "drop_oldest", "skip_to_live", "fail".
+            clock: Monotonic time source (injectable for tests).
+        """
+        if policy not in POLICIES:
+            raise ValueError(f"policy must be one of {', '.join(POLICIES)}")
+        if max_queue < 1 or max_lag_s <= 0:
+            raise ValueError("max_queue and max_lag_s must be positive")
+
+        self.max_queue = max_queue
+        self.max_lag_s = max_lag_s
+        self.policy = policy
+        self.stats = CaptureStats()
+
+        self._clock = clock
+        self._queue = deque()
+        self._cond = threading.Condition()
+        self._resync = False
+        self._error: Optional[str] = None
+        self._paused_at: Optional[float] = None
+
+    def put(self, item, status=None) -> None:
+        """
+        Queues a captured chunk with its capture time. Safe to call from the audio callback.
+        """
+        now = self._clock()
+        with self._cond:
+            self.stats.chunks += 1
+            if status:
+                if getattr(status, "input_overflow", False):
+                    self.stats.overflows += 1
+                if getattr(status, "input_underflow", False):
+                    self.stats.underflows += 1
+
+            if len(self._queue) >= self.max_queue:
+                self.stats.queue_full += 1
+                if self._paused_at is not None:
+                    self._queue.popleft()
+                    self.stats.dropped_chunks += 1
+                elif self.policy == SKIP_TO_LIVE:
+                    self._skip()
+                else:
+                    if self.policy == FAIL:
+                        self._error = f"capture queue full ({self.max_queue} chunks)"
+                    self._queue.popleft()
+                    self.stats.dropped_chunks += 1
+
+            self._queue.append((now, item))
+            self.stats.depth = len(self._queue)
+            self.stats.max_depth = max(self.stats.max_depth, self.stats.depth)
+            self._cond.notify()
+
+    def _skip(self) -> None:
+        self.stats.dropped_chunks += len(self._queue)
+        self.stats.skips += 1
+        self._queue.clear()
+        self._resync = True
+
+    def get(self, timeout: Optional[float] = None):
+        """
+        Returns (chunk, resynced). `resynced` is True if audio was skipped since
+        the previous call and the caller should drop partial utterances.
+
+        Raises:
+            CaptureLagError: Under the "fail" policy when lag exceeds the limit.
+            TimeoutError: If no chunk arrives within `timeout` seconds.
+        """
+        with self._cond:
+            if not self._cond.wait_for(lambda: self._queue, timeout):
+                raise TimeoutError("no audio captured")
+            if self._error:
+                raise CaptureLagError(self._error)
+
+            now = self._clock()
+            captured_at, item = self._queue.popleft()
+            lag = now - captured_at
+
+            if lag > self.max_lag_s:
+                if self.policy == FAIL:
+                    raise CaptureLagError(f"capture lag {lag:.2f}s > {self.max_lag_s:.2f}s")
+                if self.policy == SKIP_TO_LIVE:
+                    if self._queue:
+                        captured_at, item = self._queue.pop()
+                        self._skip()
+                        self.stats.dropped_chunks += 1  # the stale chunk popped above
+                    self._resync = True
+                else:
+                    while self._queue and lag > self.max_lag_s:
+                        captured_at, item = self._queue.popleft()
+                        self.stats.dropped_chunks += 1
+                        lag = now - captured_at
+                lag = now - captured_at
+
+            self.stats.lag_s = lag
+            self.stats.max_lag_s = max(self.stats.max_lag_s, lag)
+            self.stats.depth = len(self._queue)
+
+            resynced, self._resync = self._resync, False
+            return item, resynced
+
+    def get_batch(self, timeout: Optional[float] = None, window_s: float = 0.0):
+        """
+        Like get(), but returns every chunk that is ready as a list, so the
+        caller can process (e.g. VAD-classify) them in one call. With
+        `window_s`, waits that long after the first chunk for more to arrive.
+
+        Returns:
+            (chunks, resynced)
+        """
+        item, resynced = self.get(timeout)
+        chunks = [item]
+        # Real time, not self._clock: this is an actual wait for the callback
+        deadline = time.monotonic() + window_s
+        with self._cond:
+            while True:
+                while self._queue:
+                    chunks.append(self._queue.popleft()[1])
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._cond.wait(remaining)
+            self.stats.depth = 0
+            resynced = resynced or self._resync
+            self._resync = False
+        return chunks, resynced
+
+    def pause(self) -> None:
+        """
+        Stops lag accounting while the loop deliberately blocks.
+        """
+        with self._cond:
+            if self._paused_at is None:
+                self._paused_at = self._clock()
+
+    def resume(self) -> None:
+        """
+        Resumes lag accounting; time spent paused is not counted as lag.
+        """
+        with self._cond:
+            if self._paused_at is None:
+                return
+            now = self._clock()
+            paused_for = now - self._paused_at
+            self._paused_at = None
+            self._queue = deque(
+                (min(captured_at + paused_for, now), item) for captured_at, item in self._queue
+            )
+
+    def clear(self) -> None:
+        """
+        Drops queued audio on purpose (e.g. echo captured around TTS playback).
+        Not counted as dropped or as a resync.
+        """
+        with self._cond:
+            self._queue.clear()
+            self.stats.depth = 0
+            self._resync = False
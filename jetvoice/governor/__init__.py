@@ -0,0 +1,3 @@
+from .governor import Governor
+from .governor import SystemProbe
+from .governor import apply_level
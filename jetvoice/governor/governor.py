@@ -0,0 +1,257 @@
+import glob
+import os
+from dataclasses import dataclass
+from typing import Callable, List, Optional
+
+
+@dataclass
+class QualityLevel:
+    """
+    One rung of the degradation ladder. None means "leave as configured".
+    """
+    name: str
+    vosk_model: Optional[str] = None
+    vad_aggressiveness: Optional[int] = None
+    llm_max_tokens: Optional[int] = None
+    tts_online: Optional[bool] = None
+
+
+def default_levels(fallback_model: Optional[str] = None) -> List[QualityLevel]:
+    """
+    full -> reduced -> minimal. The smaller Vosk model is only used if one is configured.
+    """
+    return [
+        QualityLevel("full"),
+        QualityLevel("reduced", vad_aggressiveness=3, llm_max_tokens=150),
+        QualityLevel(
+            "minimal",
+            vosk_model=fallback_model,
+            vad_aggressiveness=3,
+            llm_max_tokens=60,
+            tts_online=False,
+        ),
+    ]
+
+
+@dataclass
+class Transition:
+    from_level: str
+    to_level: str
+    reason: str
+
+    def __str__(self) -> str:
+        return f"{self.from_level} -> {self.to_level}: {self.reason}"
+
+
+class SystemProbe:
+    """
+    Reads CPU utilization and temperature from /proc and sysfs.
+
+    `root` points at the filesystem root, so tests can use a stub directory
+    tree containing proc/stat and sys/class/thermal/thermal_zone*/temp.
+    """
+
+    def __init__(self, root: str = "/") -> None:
+        self.root = root
+        self._last_cpu = None
+
+    def _read(self, *parts) -> Optional[str]:
+        try:
+            with open(os.path.join(self.root, *parts)) as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def cpu_load(self) -> Optional[float]:
+        """
+        Fraction of CPU time busy (0-1) since the previous call, from /proc/stat.
+        None on the first call or if /proc/stat is unavailable.
+        """
+        stat = self._read("proc", "stat")
+        if not stat:
+            return None
+        fields = [int(v) for v in stat.splitlines()[0].split()[1:]]
+        idle = fields[3] + (fields[4] if len(fields) > 4 else 0)  # idle + iowait
+        total = sum(fields)
+
+        last, self._last_cpu = self._last_cpu, (idle, total)
+        if last is None or total == last[1]:
+            return None
+        return 1.0 - (idle - last[0]) / (total - last[1])
+
+    def temperature_c(self) -> Optional[float]:
+        """
+        Hottest thermal zone in degrees Celsius, None if no zone is readable.
+        """
+        temps = []
+        pattern = os.path.join(self.root, "sys", "class", "thermal", "thermal_zone*", "temp")
+        for path in glob.glob(pattern):
+            try:
+                with open(path) as f:
+                    temps.append(int(f.read().strip()) / 1000.0)
+            except (OSError, ValueError):
+                continue
+        return max(temps) if temps else None
+
+
+@dataclass
+class Thresholds:
+    """
+    A reading above `*_high` is pressure; all readings below `*_low` is clear.
+    The gap between the two is the hysteresis band.
+    """
+    rtf_high: float = 0.8
+    rtf_low: float = 0.5
+    lag_high_s: float = 0.5
+    lag_low_s: float = 0.1
+    cpu_high: float = 0.9
+    cpu_low: float = 0.6
+    temp_high_c: float = 80.0
+    temp_low_c: float = 70.0
+
+
+class Governor:
+    """
+    Steps the pipeline down to cheaper modes under CPU/thermal pressure and
+    back up when it clears.
+
+    Signals: STT real-time factor (reported per turn), capture queue lag and
+    CPU load / temperature from SystemProbe. A step down needs `down_after`
+    consecutive pressured polls, a step up `up_after` consecutive clear ones,
+    so the level doesn't flap.
+
+    Usage:
+        governor = Governor(default_levels("vosk-model-tiny"))
+        governor.observe_stt(stt_seconds / audio_seconds)
+        transition = governor.poll(lag_s=monitor.stats.lag_s)
+        if transition:
+            apply_level(governor.level, ...)
+    """
+
+    def __init__(
+        self,
+        levels: List[QualityLevel],
+        probe: Optional[SystemProbe] = None,
+        thresholds: Optional[Thresholds] = None,
+        down_after: int = 2,
+        up_after: int = 5,
+    ) -> None:
+        if not levels:
+            raise ValueError("at least one quality level is required")
+
+        self.levels = levels
+        self.probe = probe or SystemProbe()
+        self.thresholds = thresholds or Thresholds()
+        self.down_after = down_after
+        self.up_after = up_after
+        self.index = 0
+        self.transitions: List[Transition] = []
+
+        self._stt_rtf: Optional[float] = None
+        self._pressured = 0
+        self._clear = 0
+
+    @property
+    def level(self) -> QualityLevel:
+        return self.levels[self.index]
+
+    def observe_stt(self, rtf: float) -> None:
+        """
+        Records the latest STT real-time factor (decode seconds per audio second).
+        """
+        self._stt_rtf = rtf
+
+    def poll(self, lag_s: float = 0.0) -> Optional[Transition]:
+        """
+        Reads all signals and moves at most one level.
+
+        Returns:
+            Transition if the level changed, otherwise None.
+        """
+        t = self.thresholds
+        cpu = self.probe.cpu_load()
+        temp = self.probe.temperature_c()
+        rtf = self._stt_rtf
+
+        high = []
+        if rtf is not None and rtf > t.rtf_high:
+            high.append(f"stt_rtf={rtf:.2f}>{t.rtf_high}")
+        if lag_s > t.lag_high_s:
+            high.append(f"capture_lag={lag_s:.2f}s>{t.lag_high_s}s")
+        if cpu is not None and cpu > t.cpu_high:
+            high.append(f"cpu={cpu:.0%}>{t.cpu_high:.0%}")
+        if temp is not None and temp > t.temp_high_c:
+            high.append(f"temp={temp:.1f}C>{t.temp_high_c}C")
+
+        clear = (
+            (rtf is None or rtf < t.rtf_low)
+            and lag_s < t.lag_low_s
+            and (cpu is None or cpu < t.cpu_low)
+            and (temp is None or temp < t.temp_low_c)
+        )
+
+        if high:
+            self._pressured += 1
+            self._clear = 0
+            if self._pressured >= self.down_after and self.index < len(self.levels) - 1:
+                return self._move(+1, "pressure: " + ", ".join(high))
+        elif clear:
+            self._clear += 1
+            self._pressured = 0
+            if self._clear >= self.up_after and self.index > 0:
+                readings = [f"stt_rtf={rtf:.2f}" if rtf is not None else "stt_rtf=n/a",
+                            f"capture_lag={lag_s:.2f}s"]
+                if cpu is not None:
+                    readings.append(f"cpu={cpu:.0%}")
+                if temp is not None:
+                    readings.append(f"temp={temp:.1f}C")
+                return self._move(-1, "pressure cleared: " + ", ".join(readings))
+        else:
+            # Inside the hysteresis band: hold the current level
+            self._pressured = 0
+            self._clear = 0
+        return None
+
+    def _move(self, step: int, reason: str) -> Transition:
+        previous = self.level.name
+        self.index += step
+        self._pressured = 0
+        self._clear = 0
+        # A fresh RTF reading is needed at the new level
+        self._stt_rtf = None
+        transition = Transition(previous, self.level.name, reason)
+        self.transitions.append(transition)
+        return transition
+
+
+def apply_level(
+    level: QualityLevel,
+    base: QualityLevel,
+    vad=None,
+    llm=None,
+    tts=None,
+    use_model: Optional[Callable[[Optional[str]], None]] = None,
+) -> None:
+    """
+    Applies a level to the running components. Fields left as None fall back
+    to `base`, the configuration the process started with.
+    """
+    if use_model is not None:
+        try:
+            use_model(level.vosk_model or base.vosk_model)
+        except RuntimeError as e:
+            # Keep running on the current model rather than stopping the loop
+            print(f"[Governor] Model switch failed: {e}")
+
+    aggressiveness = level.vad_aggressiveness
+    if aggressiveness is None:
+        aggressiveness = base.vad_aggressiveness
+    if vad is not None and aggressiveness is not None and hasattr(vad, "set_aggressiveness"):
+        vad.set_aggressiveness(aggressiveness)
+
+    if llm is not None:
+        llm.max_tokens = level.llm_max_tokens or base.llm_max_tokens
+
+    online = level.tts_online if level.tts_online is not None else base.tts_online
+    if tts is not None and online is not None and online != tts.use_online:
+        tts.set_online(online)
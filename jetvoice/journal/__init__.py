@@ -0,0 +1,2 @@
+from .journal import UtteranceJournal
+from .journal import JournalReader
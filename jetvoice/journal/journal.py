@@ -0,0 +1,326 @@
+import glob
+import json
+import mmap
+import os
+import queue
+import struct
+import sys
+import threading
+import time
+import wave
+from collections import deque
+from typing import Optional
+
+
+# Segment record: magic, metadata length, PCM length, then JSON metadata and PCM.
+RECORD_MAGIC = b"JVU1"
+RECORD_HEADER = struct.Struct("<4sII")
+
+# Index entry: timestamp, record offset, metadata length, PCM length, sample rate.
+INDEX_ENTRY = struct.Struct("<dQIII")
+
+SEGMENT_SUFFIX = ".jvs"
+INDEX_SUFFIX = ".idx"
+
+
+def _segment_paths(directory: str):
+    """
+    Sorted (sequence, segment path, index path) tuples found in the directory.
+    """
+    paths = []
+    for seg_path in glob.glob(os.path.join(directory, "seg-*" + SEGMENT_SUFFIX)):
+        name = os.path.basename(seg_path)[len("seg-"):-len(SEGMENT_SUFFIX)]
+        if name.isdigit():
+            paths.append((int(name), seg_path, seg_path[:-len(SEGMENT_SUFFIX)] + INDEX_SUFFIX))
+    return sorted(paths)
+
+
+def _file_bytes(*paths) -> int:
+    return sum(os.path.getsize(p) for p in paths if os.path.exists(p))
+
+
+class UtteranceJournal:
+    """
+    Optional append-only journal of utterances for replaying production failures.
+
+    record() only enqueues; a background thread does all disk I/O, so the capture
+    loop never blocks. If the writer falls behind and the queue is full the record
+    is dropped and counted instead.
+
+    On disk, records go into numbered segment files (seg-000001.jvs) with a
+    fixed-size entry per record in a sibling index (seg-000001.idx). Before each
+    write, the oldest segments are deleted until the total, including the
+    segment being written, stays within the quota.
+
+    Usage:
+        journal = UtteranceJournal("/data/journal")
+        journal.record(pcm, 16000, transcript="hi", response="hello", timings={"stt": 0.2})
+        ...
+        journal.close()
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        segment_bytes: int = 64 * 1024 * 1024,
+        quota_bytes: int = 1024 * 1024 * 1024,
+        queue_size: int = 64,
+    ) -> None:
+        """
+        Args:
+            directory: Where segment and index files are written.
+            segment_bytes: Roll to a new segment once the current one reaches this size.
+            quota_bytes: Total on-disk budget; oldest segments are deleted beyond it.
+            queue_size: Records that may wait for the writer before new ones are dropped.
+        """
+        if segment_bytes <= 0 or quota_bytes < segment_bytes:
+            raise ValueError("need 0 < segment_bytes <= quota_bytes")
+
+        self.directory = directory
+        self.segment_bytes = segment_bytes
+        self.quota_bytes = quota_bytes
+        self.dropped = 0
+        self.written = 0
+
+        os.makedirs(directory, exist_ok=True)
+        existing = _segment_paths(directory)
+        self._next_seq = existing[-1][0] + 1 if existing else 1
+        self._segment = None
+        self._index = None
+        self._active = None
+        # Finished segments, oldest first, as (segment path, index path, bytes)
+        self._closed = deque((seg, idx, _file_bytes(seg, idx)) for _, seg, idx in existing)
+        self._closed_bytes = sum(size for _, _, size in self._closed)
+        self._closing = False
+
+        self._queue: "queue.Queue[Optional[tuple]]" = queue.Queue(maxsize=queue_size)
+        self._thread = threading.Thread(target=self._run, name="jetvoice-journal", daemon=True)
+        self._thread.start()
+
+    def record(
+        self,
+        pcm: bytes,
+        sample_rate: int,
+        transcript: str = "",
+        response: Optional[str] = None,
+        timings: Optional[dict] = None,
+    ) -> bool:
+        """
+        Queues one utterance for writing. Never blocks.
+
+        Returns:
+            bool: False if the record was dropped because the writer is behind.
+        """
+        meta = {
+            "time": time.time(),
+            "sample_rate": sample_rate,
+            "transcript": transcript,
+            "response": response,
+            "timings": timings or {},
+        }
+        try:
+            self._queue.put_nowait((meta, bytes(pcm)))
+            return True
+        except queue.Full:
+            self.dropped += 1
+            return False
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """
+        Flushes queued records and stops the writer thread. Never blocks on a
+        full queue: the writer then stops once it has drained it.
+        """
+        self._closing = True
+        try:
+            self._queue.put_nowait(None)
+        except queue.Full:
+            pass
+        self._thread.join(timeout)
+
+    # ------- Writer thread -------
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is None:
+                break
+            try:
+                self._write(*item)
+                self.written += 1
+            except Exception as e:
+                print(f"[Journal Error]: {e}")
+            if self._closing and self._queue.empty():
+                break
+        self._close_segment()
+
+    def _open_segment(self) -> None:
+        base = os.path.join(self.directory, f"seg-{self._next_seq:06d}")
+        self._next_seq += 1
+        self._active = (base + SEGMENT_SUFFIX, base + INDEX_SUFFIX)
+        self._segment = open(self._active[0], "ab")
+        self._index = open(self._active[1], "ab")
+
+    def _close_segment(self) -> None:
+        if self._segment:
+            size = self._segment.tell() + self._index.tell()
+            self._closed.append((*self._active, size))
+            self._closed_bytes += size
+        for f in (self._segment, self._index):
+            if f:
+                f.close()
+        self._segment = None
+        self._index = None
+        self._active = None
+
+    def _write(self, meta: dict, pcm: bytes) -> None:
+        meta_bytes = json.dumps(meta, separators=(",", ":")).encode("utf-8")
+        size = RECORD_HEADER.size + len(meta_bytes) + len(pcm)
+        if size + INDEX_ENTRY.size > self.quota_bytes:
+            raise ValueError(f"record of {size} bytes does not fit the journal quota")
+
+        if self._segment is None or (
+            self._segment.tell() > 0 and self._segment.tell() + size > self.segment_bytes
+        ):
+            self._close_segment()
+            self._open_segment()
+        self._enforce_quota(size + INDEX_ENTRY.size)
+
+        offset = self._segment.tell()
+        self._segment.write(RECORD_HEADER.pack(RECORD_MAGIC, len(meta_bytes), len(pcm)))
+        self._segment.write(meta_bytes)
+        self._segment.write(pcm)
+        self._segment.flush()
+
+        # The index entry goes last so readers never see a half-written record
+        self._index.write(INDEX_ENTRY.pack(
+            meta["time"], offset, len(meta_bytes), len(pcm), meta["sample_rate"]
+        ))
+        self._index.flush()
+
+    def _enforce_quota(self, incoming: int) -> None:
+        """
+        Deletes the oldest segments until `incoming` more bytes fit in the quota.
+        Sizes are tracked in memory, so this costs no filesystem calls unless
+        something has to go.
+        """
+        while True:
+            active = self._segment.tell() + self._index.tell()
+            if self._closed_bytes + active + incoming <= self.quota_bytes:
+                return
+            if not self._closed:
+                # Only the active segment is left; roll so it can be deleted too
+                self._close_segment()
+                self._open_segment()
+                continue
+            seg, idx, size = self._closed.popleft()
+            self._closed_bytes -= size
+            for path in (seg, idx):
+                if os.path.exists(path):
+                    os.remove(path)
+
+
+class JournalReader:
+    """
+    Random access over journal segments via memory maps.
+
+    Usage:
+        reader = JournalReader("/data/journal")
+        meta, pcm = reader[0]
+        reader.export_wav("/tmp/replay")
+        reader.close()
+    """
+
+    def __init__(self, directory: str) -> None:
+        self.directory = directory
+        self._maps = []
+        self._entries = []  # (map index, timestamp, offset, meta_len, pcm_len, sample_rate)
+
+        for _, seg_path, idx_path in _segment_paths(directory):
+            if not os.path.exists(idx_path) or os.path.getsize(seg_path) == 0:
+                continue
+            with open(idx_path, "rb") as f:
+                raw = f.read()
+            with open(seg_path, "rb") as f:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+            map_id = len(self._maps)
+            self._maps.append(mapped)
+            usable = len(raw) - len(raw) % INDEX_ENTRY.size
+            for ts, offset, meta_len, pcm_len, rate in INDEX_ENTRY.iter_unpack(raw[:usable]):
+                # Skip entries past the mapped size (segment still being appended)
+                if offset + RECORD_HEADER.size + meta_len + pcm_len <= len(mapped):
+                    self._entries.append((map_id, ts, offset, meta_len, pcm_len, rate))
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __getitem__(self, i: int):
+        """
+        Returns (metadata dict, PCM bytes) for the i-th utterance, oldest first.
+        """
+        map_id, _, offset, meta_len, pcm_len, _ = self._entries[i]
+        mapped = self._maps[map_id]
+
+        magic, _, _ = RECORD_HEADER.unpack_from(mapped, offset)
+        if magic != RECORD_MAGIC:
+            raise ValueError(f"Corrupt journal record at offset {offset}")
+
+        start = offset + RECORD_HEADER.size
+        meta = json.loads(mapped[start:start + meta_len].decode("utf-8"))
+        pcm = mapped[start + meta_len:start + meta_len + pcm_len]
+        return meta, pcm
+
+    def find(self, since: float = 0.0, until: Optional[float] = None):
+        """
+        Indices of utterances recorded within [since, until], using only the index.
+        """
+        return [
+            i for i, entry in enumerate(self._entries)
+            if entry[1] >= since and (until is None or entry[1] <= until)
+        ]
+
+    def export_wav(self, out_dir: str, indices=None) -> list:
+        """
+        Writes utterances as mono 16-bit WAV files plus a JSON sidecar each.
+
+        Returns:
+            list: Paths of the written WAV files.
+        """
+        os.makedirs(out_dir, exist_ok=True)
+        paths = []
+        for i in (range(len(self)) if indices is None else indices):
+            meta, pcm = self[i]
+            path = os.path.join(out_dir, f"utt-{i:06d}.wav")
+            with wave.open(path, "wb") as wf:
+                wf.setnchannels(1)
+                wf.setsampwidth(2)
+                wf.setframerate(meta["sample_rate"])
+                wf.writeframes(pcm)
+            with open(path[:-len(".wav")] + ".json", "w") as f:
+                json.dump(meta, f, indent=2)
+            paths.append(path)
+        return paths
+
+    def close(self) -> None:
+        for mapped in self._maps:
+            mapped.close()
+        self._maps = []
+        self._entries = []
+
+
+if __name__ == "__main__":
+    # This block runs when you execute: python -m jetvoice.journal.journal <dir> [out_dir]
+    if len(sys.argv) < 2:
+        print("Usage: python -m jetvoice.journal.journal <journal_dir> [wav_out_dir]")
+        sys.exit(1)
+
+    reader = JournalReader(sys.argv[1])
+    print(f"--- {len(reader)} utterances in {sys.argv[1]} ---")
+    for i in range(len(reader)):
+        meta, pcm = reader[i]
+        print(f"{i}: {len(pcm) / 2 / meta['sample_rate']:.2f}s '{meta['transcript']}'")
+
+    if len(sys.argv) > 2:
+        written = reader.export_wav(sys.argv[2])
+        print(f"Exported {len(written)} WAV files to {sys.argv[2]}")
+    reader.close()
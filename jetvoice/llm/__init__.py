@@ -1 +1,5 @@
-from .llm import JetVoiceLLM
\ No newline at end of file
+from .llm import JetVoiceLLM
+from .speculative import SpeculativeLLM
+from .gate import ConfidenceGate
+from .singleflight import SingleFlightLLM
+from .shaping import ResponseShaper
@@ -0,0 +1,105 @@
+from dataclasses import dataclass
+
+
+PASS = "pass"
+DROP = "drop"
+REPROMPT = "reprompt"
+
+# Short replies that are meaningful on their own and must not be gated by length
+SHORT_COMMANDS = frozenset({
+    "yes", "no", "stop", "cancel", "pause", "resume", "continue", "thanks", "help",
+})
+
+
+@dataclass
+class GateStats:
+    """
+    Counters for the confidence gate. A non-pass is an LLM call avoided,
+    unless a speculative request for the turn was already sent
+    (`after_prefetch`).
+    """
+    passed: int = 0
+    dropped: int = 0
+    reprompted: int = 0
+    after_prefetch: int = 0
+
+    @property
+    def llm_calls_avoided(self) -> int:
+        return self.dropped + self.reprompted - self.after_prefetch
+
+    def __str__(self) -> str:
+        return (
+            f"passed={self.passed}, dropped={self.dropped}, reprompted={self.reprompted}, "
+            f"after_prefetch={self.after_prefetch}, llm_calls_avoided={self.llm_calls_avoided}"
+        )
+
+
+class ConfidenceGate:
+    """
+    Decides whether a transcript is worth an LLM round trip.
+
+    Noise often decodes as a single low-confidence word ("the", "huh"); such
+    transcripts are either dropped silently or answered with a re-prompt.
+
+    Usage:
+        gate = ConfidenceGate(min_confidence=0.6, min_words=2, action="drop")
+        verdict, reason = gate.check(transcript.text, transcript.confidence)
+        if verdict == "pass":
+            llm.ask(transcript.text)
+    """
+
+    def __init__(
+        self,
+        min_confidence: float = 0.6,
+        min_words: int = 2,
+        action: str = DROP,
+        reprompt_text: str = "Sorry, I didn't catch that.",
+    ) -> None:
+        """
+        Args:
+            min_confidence: Mean word confidence required to pass (0-1).
+            min_words: Minimum word count, except for SHORT_COMMANDS.
+            action: What to do with a rejected transcript, "drop" or "reprompt".
+            reprompt_text: Spoken back to the user when action is "reprompt".
+        """
+        if not 0.0 <= min_confidence <= 1.0:
+            raise ValueError("min_confidence must be between 0 and 1")
+        if action not in (DROP, REPROMPT):
+            raise ValueError("action must be 'drop' or 'reprompt'")
+
+        self.min_confidence = min_confidence
+        self.min_words = min_words
+        self.action = action
+        self.reprompt_text = reprompt_text
+        self.stats = GateStats()
+
+    def check(self, text: str, confidence: float, prefetched: bool = False):
+        """
+        Args:
+            text: Final transcript.
+            confidence: Mean word confidence of the transcript.
+            prefetched: True if a speculative LLM request was already sent for
+                this turn, so rejecting it doesn't save a call.
+
+        Returns:
+            tuple: (verdict, reason) where verdict is "pass", "drop" or "reprompt".
+        """
+        words = (text or "").lower().split()
+
+        if not words:
+            reason = "empty transcript"
+        elif confidence < self.min_confidence:
+            reason = f"confidence {confidence:.2f} < {self.min_confidence:.2f}"
+        elif len(words) < self.min_words and " ".join(words) not in SHORT_COMMANDS:
+            reason = f"{len(words)} word(s) < {self.min_words}"
+        else:
+            self.stats.passed += 1
+            return PASS, ""
+
+        if self.action == REPROMPT:
+            self.stats.reprompted += 1
+        else:
+            self.stats.dropped += 1
+        if prefetched:
+            self.stats.after_prefetch += 1
+        return self.action, reason
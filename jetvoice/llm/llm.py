@@ -3,11 +3,32 @@ from dotenv import load_dotenv
 import os
 import sys
 
+from jetvoice.llm.shaping import drop_unfinished_sentence
+from jetvoice.trace import tracer
+
+# Reasoning-era models reject max_tokens and take max_completion_tokens instead
+_COMPLETION_TOKEN_MODELS = ("gpt-5", "o1", "o3", "o4")
+
+
+def token_param_for(model: str) -> str:
+    """
+    Name of the reply-length parameter the chat completions API expects for `model`.
+    """
+    if (model or "").startswith(_COMPLETION_TOKEN_MODELS):
+        return "max_completion_tokens"
+    return "max_tokens"
+
+
 class JetVoiceLLM:
-    def __init__(self, system_prompt: str = None, model: str = "gpt-5.1"):
+    def __init__(self, system_prompt: str = None, model: str = "gpt-5.1", token_param: str = None):
         load_dotenv()
         self.api_key = os.getenv("OPENAI_API_KEY")
         self.model = model
+
+        # Optional cap on the reply length; None leaves it to the model
+        self.max_tokens = None
+        # Overrides the parameter name the cap is sent as; None picks it from the model
+        self.token_param = token_param
         
         # Default system prompt if none provided
         self.system_prompt = system_prompt or (
@@ -19,27 +40,43 @@ class JetVoiceLLM:
         if self.api_key:
             openai.api_key = self.api_key
 
-    def ask(self, user_prompt: str) -> str | None:
+    def ask(self, user_prompt: str, max_tokens: int | None = None, cancel=None) -> str | None:
         """
         Sends a prompt to the LLM and returns the response string.
+
+        `max_tokens` is a per-call budget; it can only tighten self.max_tokens.
+        If the `cancel` event is already set, no request is made.
         """
         if not self.api_key or self.api_key == "your_api_key_here":
             print("[LLM Warning] Invalid or missing OPENAI_API_KEY")
             return None
+        if cancel is not None and cancel.is_set():
+            return None
 
         try:
             # Using getattr to support openai==0.28.1 structure safely
             chat_completion = getattr(openai, "ChatCompletion")
+
+            options = {}
+            caps = [cap for cap in (self.max_tokens, max_tokens) if cap]
+            if caps:
+                options[self.token_param or token_param_for(self.model)] = min(caps)
+
+            with tracer.span("openai.request", cat="llm", model=self.model):
+                response = chat_completion.create(
+                    model=self.model,
+                    messages=[
+                        {"role": "system", "content": self.system_prompt},
+                        {"role": "user", "content": user_prompt}
+                    ],
+                    **options
+                )
             
-            response = chat_completion.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": self.system_prompt},
-                    {"role": "user", "content": user_prompt}
-                ]
-            )
-            
-            content = response.choices[0].message["content"].strip()
+            choice = response.choices[0]
+            content = choice.message["content"].strip()
+            if getattr(choice, "finish_reason", None) == "length":
+                # Cut at the token cap; don't speak the half sentence
+                content = drop_unfinished_sentence(content)
             return content
 
         except Exception as e:
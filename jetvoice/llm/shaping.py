@@ -0,0 +1,208 @@
+import re
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+
+COMMAND = "command"
+YES_NO = "yes_no"
+FACTUAL = "factual"
+EXPLAIN = "explain"
+CHAT = "chat"
+
+# Reply token budgets per question type, before the spoken-duration cap
+TOKEN_BUDGETS = {
+    COMMAND: 40,
+    YES_NO: 50,
+    FACTUAL: 80,
+    CHAT: 100,
+    EXPLAIN: 200,
+}
+
+TOKENS_PER_WORD = 1.4
+
+_EXPLAIN_PREFIXES = ("why", "explain", "describe", "tell me about", "what is the difference",
+                     "what's the difference")
+_FACTUAL_PREFIXES = ("what", "who", "when", "where", "which", "whose", "how many", "how much",
+                     "how old", "how far", "how long")
+_YES_NO_WORDS = frozenset({"is", "are", "am", "was", "were", "do", "does", "did", "can", "could",
+                           "will", "would", "should", "have", "has", "shall"})
+_COMMAND_WORDS = frozenset({"turn", "set", "start", "stop", "play", "pause", "open", "close",
+                            "switch", "remind", "call", "please"})
+_AFFIRMATIVE = frozenset({"yes", "yeah", "yep", "sure", "continue", "go on", "keep going", "please do",
+                          "yes please", "tell me more", "more"})
+
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+
+
+def classify_question(text: str) -> str:
+    """
+    Coarse question type from the leading words of the transcript.
+    """
+    text = (text or "").lower().strip()
+    if text.startswith(_EXPLAIN_PREFIXES):
+        return EXPLAIN
+    if text.startswith(_FACTUAL_PREFIXES):
+        return FACTUAL
+    first = text.split(" ", 1)[0]
+    if first == "how":
+        return EXPLAIN
+    if first in _YES_NO_WORDS:
+        return YES_NO
+    if first in _COMMAND_WORDS:
+        return COMMAND
+    return CHAT
+
+
+def estimate_spoken_seconds(text: str, rate_wpm: int = 125) -> float:
+    """
+    Speaking time at the TTS rate (pyttsx3/espeak `rate` is words per minute).
+    """
+    return len((text or "").split()) * 60.0 / rate_wpm
+
+
+def truncate_to_budget(text: str, max_seconds: float, rate_wpm: int = 125) -> Tuple[str, str]:
+    """
+    Keeps whole sentences while they fit in `max_seconds` of speech.
+
+    The first sentence is always kept, so a reply is never cut to nothing.
+
+    Returns:
+        (kept, remainder); remainder is "" when nothing was cut.
+    """
+    sentences = [s for s in _SENTENCE_END.split((text or "").strip()) if s]
+    kept = []
+    seconds = 0.0
+    for sentence in sentences:
+        seconds += estimate_spoken_seconds(sentence, rate_wpm)
+        if kept and seconds > max_seconds:
+            break
+        kept.append(sentence)
+    return " ".join(kept), " ".join(sentences[len(kept):])
+
+
+def drop_unfinished_sentence(text: str) -> str:
+    """
+    Drops a trailing fragment with no sentence terminator, as left by a reply
+    cut at the token cap. Text without any full sentence is returned as is.
+    """
+    text = (text or "").strip()
+    if not text or text[-1] in ".!?":
+        return text
+    sentences = _SENTENCE_END.split(text)
+    if len(sentences) < 2:
+        return text
+    return " ".join(sentences[:-1])
+
+
+@dataclass
+class ShapingStats:
+    """
+    How often replies were cut, and estimated versus measured speaking time
+    over the replies whose playback was timed.
+    """
+    responses: int = 0
+    truncated: int = 0
+    continued: int = 0
+    measured: int = 0
+    estimated_s: float = 0.0
+    actual_s: float = 0.0
+
+    @property
+    def actual_over_estimate(self) -> Optional[float]:
+        return self.actual_s / self.estimated_s if self.estimated_s else None
+
+    def __str__(self) -> str:
+        ratio = self.actual_over_estimate
+        return (
+            f"responses={self.responses}, truncated={self.truncated}, continued={self.continued}, "
+            f"spoken estimated={self.estimated_s:.1f}s actual={self.actual_s:.1f}s"
+            + (f" (x{ratio:.2f})" if ratio is not None else "")
+        )
+
+
+class ResponseShaper:
+    """
+    Keeps spoken replies short enough for voice latency.
+
+    token_budget() picks max_tokens for a turn from the question type, capped
+    by what fits in `max_spoken_s` at the TTS rate. shape() cuts a reply at
+    the last sentence boundary inside the spoken budget; with `follow_up`, the
+    rest is kept and offered with a "continue?" prompt, and continuation()
+    returns it if the next utterance is a yes.
+
+    Usage:
+        shaper = ResponseShaper(rate_wpm=125, max_spoken_s=15, follow_up=True)
+        response = shaper.continuation(text) or llm.ask(text, max_tokens=shaper.token_budget(text))
+        response, estimated_s = shaper.shape(response)
+        ...
+        shaper.record_playback(estimated_s, playback_seconds)
+    """
+
+    def __init__(
+        self,
+        rate_wpm: int = 125,
+        max_spoken_s: float = 20.0,
+        follow_up: bool = False,
+        follow_up_text: str = "Want me to continue?",
+        budgets: Optional[Dict[str, int]] = None,
+    ) -> None:
+        if rate_wpm <= 0 or max_spoken_s <= 0:
+            raise ValueError("rate_wpm and max_spoken_s must be positive")
+
+        self.rate_wpm = rate_wpm
+        self.max_spoken_s = max_spoken_s
+        self.follow_up = follow_up
+        self.follow_up_text = follow_up_text
+        self.budgets = dict(TOKEN_BUDGETS, **(budgets or {}))
+        self.stats = ShapingStats()
+        self.pending = ""
+
+    @property
+    def spoken_token_cap(self) -> int:
+        """
+        Tokens that fit in the spoken budget; anything beyond would be cut anyway.
+        A sentence of slack lets the cut land on a boundary.
+        """
+        words = self.max_spoken_s * self.rate_wpm / 60.0
+        return int((words + 20) * TOKENS_PER_WORD)
+
+    def token_budget(self, text: str) -> int:
+        return min(self.budgets[classify_question(text)], self.spoken_token_cap)
+
+    def shape(self, response: str) -> Tuple[str, float]:
+        """
+        Returns:
+            (text to speak, its estimated spoken seconds)
+        """
+        kept, remainder = truncate_to_budget(response, self.max_spoken_s, self.rate_wpm)
+        self.stats.responses += 1
+        self.pending = ""
+        if remainder:
+            self.stats.truncated += 1
+            if self.follow_up:
+                self.pending = remainder
+                kept = f"{kept} {self.follow_up_text}"
+
+        return kept, estimate_spoken_seconds(kept, self.rate_wpm)
+
+    def continuation(self, text: str) -> Optional[str]:
+        """
+        The held-back remainder if `text` accepts the follow-up, else None.
+        Any other utterance drops the remainder.
+        """
+        pending, self.pending = self.pending, ""
+        if not pending:
+            return None
+        reply = re.sub(r"[^\w\s]", "", (text or "").lower()).strip()
+        if reply in _AFFIRMATIVE:
+            self.stats.continued += 1
+            return pending
+        return None
+
+    def record_playback(self, estimated_s: float, actual_s: float) -> None:
+        """
+        Adds one timed playback to the estimate-vs-actual totals.
+        """
+        self.stats.measured += 1
+        self.stats.estimated_s += estimated_s
+        self.stats.actual_s += actual_s
@@ -0,0 +1,200 @@
+import re
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+from jetvoice.trace import tracer
+
+
+def _normalize(text: str) -> str:
+    """
+    Lowercases, drops punctuation and collapses whitespace so near-identical
+    transcripts ("What time is it?" / "what time is it") share one request.
+    """
+    text = re.sub(r"[^\w\s']", " ", (text or "").lower())
+    return re.sub(r"\s+", " ", text).strip()
+
+
+class FairLimiter:
+    """
+    Counting semaphore that grants slots strictly in arrival order (FIFO),
+    so a burst of callers can't starve an earlier one.
+    """
+
+    def __init__(self, limit: int) -> None:
+        if limit < 1:
+            raise ValueError("limit must be >= 1")
+        self.limit = limit
+        self._active = 0
+        self._waiters = deque()
+        self._lock = threading.Lock()
+
+    def acquire(self, withdraw: Optional[Callable[[], bool]] = None) -> Optional[float]:
+        """
+        Blocks until a slot is free. Returns the seconds spent waiting.
+
+        With `withdraw`, a queued caller polls it; if it returns True the
+        caller leaves the queue without taking a slot and gets None. It is
+        called under the limiter lock, so returning True commits the
+        withdrawal: the slot can't be handed over at the same time.
+        """
+        if withdraw and withdraw():
+            return None
+        start = time.monotonic()
+        with self._lock:
+            if self._active < self.limit and not self._waiters:
+                self._active += 1
+                return 0.0
+            turn = threading.Event()
+            self._waiters.append(turn)
+        # release() hands the slot over directly, so _active is already counted
+        if withdraw is None:
+            turn.wait()
+        else:
+            while not turn.wait(0.05):
+                with self._lock:
+                    # Not in the queue any more means a slot was just handed over
+                    if turn in self._waiters and withdraw():
+                        self._waiters.remove(turn)
+                        return None
+        return time.monotonic() - start
+
+    def release(self) -> None:
+        with self._lock:
+            if self._waiters:
+                self._waiters.popleft().set()
+            else:
+                self._active -= 1
+
+    @property
+    def queued(self) -> int:
+        return len(self._waiters)
+
+
+@dataclass
+class SingleFlightStats:
+    calls: int = 0
+    upstream: int = 0
+    coalesced: int = 0
+    withdrawn: int = 0
+    max_queue_wait_s: float = 0.0
+
+    def __str__(self) -> str:
+        return (
+            f"calls={self.calls}, upstream={self.upstream}, coalesced={self.coalesced}, "
+            f"withdrawn={self.withdrawn}, max_queue_wait={self.max_queue_wait_s:.2f}s"
+        )
+
+
+class _Flight:
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Optional[str] = None
+        self.followers = 0
+
+
+class SingleFlightLLM:
+    """
+    Wraps JetVoiceLLM so that concurrent callers asking the same thing share one request.
+
+    Callers whose normalized prompt, system prompt, model and max_tokens match
+    an in-flight request wait for it and all receive its result. Distinct
+    requests go through a FairLimiter, so no more than `max_concurrent` hit
+    the API at once and waiting callers are served first come, first served.
+    Nothing is cached once a request completes.
+
+    A caller passing a `cancel` event (a speculative prefetch) that is set
+    while the request still waits for a slot gives up its place in the queue
+    and gets None, unless other callers have joined the request meanwhile.
+
+    Usage:
+        client = SingleFlightLLM(JetVoiceLLM(), max_concurrent=2)
+        response = client.ask("what time is it")
+    """
+
+    def __init__(self, llm, max_concurrent: int = 2) -> None:
+        self.llm = llm
+        self.limiter = FairLimiter(max_concurrent)
+        self.stats = SingleFlightStats()
+        self._flights = {}
+        self._lock = threading.Lock()
+
+    def __getattr__(self, name):
+        # Expose the wrapped client's settings (system_prompt, max_tokens, ...)
+        if name == "llm":
+            raise AttributeError(name)
+        return getattr(self.llm, name)
+
+    def _key(self, prompt: str, max_tokens: Optional[int] = None):
+        return (
+            _normalize(prompt),
+            self.llm.system_prompt,
+            self.llm.model,
+            getattr(self.llm, "max_tokens", None),
+            max_tokens,
+        )
+
+    def ask(
+        self,
+        user_prompt: str,
+        max_tokens: Optional[int] = None,
+        cancel: Optional[threading.Event] = None,
+    ) -> Optional[str]:
+        key = self._key(user_prompt, max_tokens)
+
+        with self._lock:
+            self.stats.calls += 1
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = _Flight()
+                self._flights[key] = flight
+            else:
+                flight.followers += 1
+                self.stats.coalesced += 1
+
+        if not leader:
+            with tracer.span("llm.coalesced_wait", cat="queue"):
+                flight.done.wait()
+            return flight.result
+
+        try:
+            queued_at = time.perf_counter_ns()
+
+            def withdraw() -> bool:
+                # A follower keeps the request, and its place in the queue, alive
+                if not cancel.is_set():
+                    return False
+                with self._lock:
+                    if flight.followers:
+                        return False
+                    # Unregistered under the same lock followers join under
+                    if self._flights.get(key) is flight:
+                        del self._flights[key]
+                    self.stats.withdrawn += 1
+                    return True
+
+            waited = self.limiter.acquire(withdraw if cancel is not None else None)
+            if waited is None:
+                tracer.instant("llm.withdrawn", cat="queue")
+                return None
+            tracer.complete("llm.queue_wait", queued_at, cat="queue")
+            try:
+                with self._lock:
+                    self.stats.upstream += 1
+                    self.stats.max_queue_wait_s = max(self.stats.max_queue_wait_s, waited)
+                options = {"max_tokens": max_tokens} if max_tokens else {}
+                flight.result = self.llm.ask(user_prompt, **options)
+            finally:
+                self.limiter.release()
+        finally:
+            # Later callers start a new request; followers get this result.
+            # The key may already belong to a newer flight if this one withdrew.
+            with self._lock:
+                if self._flights.get(key) is flight:
+                    del self._flights[key]
+            flight.done.set()
+
+        return flight.result
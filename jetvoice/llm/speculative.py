@@ -0,0 +1,216 @@
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, Future
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+
+def _normalize(text: str) -> str:
+    """
+    Lowercases and collapses whitespace so cosmetic differences between the
+    partial and the final transcript don't count as a miss.
+    """
+    return re.sub(r"\s+", " ", (text or "").lower()).strip()
+
+
+@dataclass
+class SpeculationStats:
+    """
+    Running counters for speculative dispatch, used to tune how aggressive it is.
+    """
+    dispatched: int = 0
+    hits: int = 0
+    misses: int = 0
+    wasted_calls: int = 0
+    saved_seconds: float = 0.0
+
+    @property
+    def hit_rate(self) -> float:
+        resolved = self.hits + self.misses
+        return self.hits / resolved if resolved else 0.0
+
+    @property
+    def mean_saved_seconds(self) -> float:
+        return self.saved_seconds / self.hits if self.hits else 0.0
+
+    def __str__(self) -> str:
+        return (
+            f"dispatched={self.dispatched}, hits={self.hits}, misses={self.misses}, "
+            f"wasted_calls={self.wasted_calls}, hit_rate={self.hit_rate:.0%}, "
+            f"saved={self.saved_seconds:.2f}s (mean {self.mean_saved_seconds:.2f}s/hit)"
+        )
+
+
+class _Speculation:
+    def __init__(self, prompt: str, max_tokens: Optional[int]) -> None:
+        self.prompt = prompt
+        self.max_tokens = max_tokens
+        self.future: Optional[Future] = None
+        self.cancel = threading.Event()
+        self.started_at = time.monotonic()
+
+
+class SpeculativeLLM:
+    """
+    Fires JetVoiceLLM.ask early on a stable partial transcript.
+
+    The caller feeds the streaming partial hypothesis once per frame via
+    observe(). When the partial has stayed the same for `stable_frames`
+    consecutive paused (silent) frames, the prompt is sent in the background.
+    Once the endpointer closes the utterance, resolve() either commits the
+    speculative answer (final transcript matches) or discards it and asks again.
+
+    Usage:
+        spec = SpeculativeLLM(llm, stable_frames=3, token_budget=shaper.token_budget)
+        spec.observe(partial, paused=True)
+        ...
+        response = spec.resolve(final_text, max_tokens=shaper.token_budget(final_text))
+    """
+
+    def __init__(
+        self,
+        llm,
+        stable_frames: int = 3,
+        token_budget: Optional[Callable[[str], Optional[int]]] = None,
+    ) -> None:
+        """
+        Args:
+            llm: Object with an ask(prompt, max_tokens=None, cancel=None) -> str | None
+                method (JetVoiceLLM or SingleFlightLLM).
+            stable_frames: Paused frames the partial must stay unchanged before dispatch.
+            token_budget: Maps the prompt to the max_tokens of a speculative request
+                (e.g. ResponseShaper.token_budget); None uses the client's default.
+        """
+        if stable_frames < 1:
+            raise ValueError("stable_frames must be >= 1")
+
+        self.llm = llm
+        self.stable_frames = stable_frames
+        self.token_budget = token_budget
+        self.stats = SpeculationStats()
+
+        # Two workers so a discarded request that is still in flight
+        # doesn't hold up the next speculation.
+        self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="jetvoice-spec")
+        self._partial = ""
+        self._stable = 0
+        self._pending: Optional[_Speculation] = None
+
+    def _ask(self, prompt: str, max_tokens: Optional[int], **kwargs) -> Optional[str]:
+        options = {"max_tokens": max_tokens} if max_tokens else {}
+        return self.llm.ask(prompt, **options, **kwargs)
+
+    def _timed_ask(self, prompt: str, max_tokens: Optional[int], cancel: threading.Event):
+        start = time.monotonic()
+        response = self._ask(prompt, max_tokens, cancel=cancel)
+        return response, time.monotonic() - start
+
+    def _dispatch(self, prompt: str) -> None:
+        max_tokens = self.token_budget(prompt) if self.token_budget else None
+        speculation = _Speculation(_normalize(prompt), max_tokens)
+        speculation.future = self._executor.submit(
+            self._timed_ask, prompt, max_tokens, speculation.cancel
+        )
+        self._pending = speculation
+        self.stats.dispatched += 1
+
+    def _drop_pending(self) -> None:
+        """
+        Discards the in-flight speculation, if any, and records it as a miss.
+        One still waiting for a concurrency slot leaves the queue; a request
+        that already reached the API can't be recalled, so it is counted as a
+        wasted call and its result is ignored.
+        """
+        if self._pending is None:
+            return
+        self._pending.cancel.set()
+        if not self._pending.future.cancel():
+            self.stats.wasted_calls += 1
+        self.stats.misses += 1
+        self._pending = None
+
+    @property
+    def in_flight(self) -> bool:
+        """
+        True if a speculative request was sent for the current utterance and
+        not yet resolved or discarded.
+        """
+        return self._pending is not None
+
+    def observe(self, partial: str, paused: bool) -> None:
+        """
+        Updates the stability tracker with the latest partial hypothesis.
+
+        Args:
+            partial: Current partial transcript of the utterance.
+            paused: True if the current frame is silence inside an utterance.
+        """
+        norm = _normalize(partial)
+
+        if norm != self._partial:
+            self._partial = norm
+            self._stable = 0
+            # Speaker kept going: the earlier guess can't be right anymore
+            if self._pending is not None and self._pending.prompt != norm:
+                self._drop_pending()
+            return
+
+        if not paused:
+            self._stable = 0
+            return
+
+        self._stable += 1
+        if norm and self._stable >= self.stable_frames and self._pending is None:
+            self._dispatch(partial)
+
+    def resolve(self, final_text: str, max_tokens: Optional[int] = None) -> Optional[str]:
+        """
+        Returns the LLM response for the final transcript, reusing the
+        speculative request when it was made for the same text and budget.
+
+        Args:
+            final_text: Final transcript of the utterance.
+            max_tokens: Token budget for the answer; None uses the client's default.
+        """
+        pending = self._pending
+        self._pending = None
+        self._partial = ""
+        self._stable = 0
+
+        if (
+            pending is not None
+            and pending.prompt == _normalize(final_text)
+            and pending.max_tokens == max_tokens
+        ):
+            wait_start = time.monotonic()
+            try:
+                response, llm_seconds = pending.future.result()
+            except Exception as e:
+                print(f"[LLM Speculative Error]: {e}")
+                response, llm_seconds = None, 0.0
+            waited = time.monotonic() - wait_start
+
+            self.stats.hits += 1
+            self.stats.saved_seconds += max(0.0, llm_seconds - waited)
+            return response
+
+        if pending is not None:
+            self._pending = pending
+            self._drop_pending()
+
+        return self._ask(final_text, max_tokens)
+
+    def discard(self) -> None:
+        """
+        Drops any in-flight speculation without asking (e.g. empty final transcript).
+        """
+        self._drop_pending()
+        self._partial = ""
+        self._stable = 0
+
+    def close(self) -> None:
+        """
+        Stops the background worker; queued speculations are cancelled.
+        """
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -1,14 +1,26 @@
 import os
 import sys
-import queue
+import time
 
 import sounddevice as sd
 from loguru import logger
 
-from jetvoice.vad.vad import WebRTCVAD
-from jetvoice.stt.stt import transcribe_bytes
+from jetvoice.audio.frontend import AudioFrontend
+from jetvoice.audio.monitor import CaptureMonitor
+from jetvoice.vad.vad import create_vad
+from jetvoice.vad.endpoint import AdaptiveEndpointer
+from jetvoice.stt.stt import transcribe_result, StreamingTranscriber, use_model_async
+from jetvoice.stt.wakeword import WakeWordSpotter, strip_phrase
 from jetvoice.llm.llm import JetVoiceLLM
-from jetvoice.tts.tts import JetVoiceTTS
+from jetvoice.llm.speculative import SpeculativeLLM
+from jetvoice.llm.singleflight import SingleFlightLLM
+from jetvoice.llm.gate import ConfidenceGate, PASS, REPROMPT
+from jetvoice.llm.shaping import ResponseShaper
+from jetvoice.tts.worker import TTSWorker, PRIORITY_HIGH, PRIORITY_NORMAL
+from jetvoice.trace import tracer
+from jetvoice.journal.journal import UtteranceJournal
+from jetvoice.streams.streams import MultiStreamRunner, parse_streams
+from jetvoice.governor.governor import Governor, QualityLevel, default_levels, apply_level
 
 
 def main():
@@ -32,37 +44,248 @@ def main():
     sample_rate = int(os.getenv("SAMPLE_RATE", "16000"))
     frame_duration_ms = 20
 
+    # Device-native capture format; the front-end converts it to mono int16 at sample_rate
+    capture_rate = int(os.getenv("AUDIO_CAPTURE_RATE", str(sample_rate)))
+    capture_channels = int(os.getenv("AUDIO_CAPTURE_CHANNELS", "1"))
+    capture_dtype = os.getenv("AUDIO_CAPTURE_DTYPE", "int16")
+
+    # Capture health: bounded queue and what to do when processing falls behind
+    capture_max_queue = int(os.getenv("CAPTURE_MAX_QUEUE", "250"))
+    capture_max_lag_s = float(os.getenv("CAPTURE_MAX_LAG_S", "1.0"))
+    capture_lag_policy = os.getenv("CAPTURE_LAG_POLICY", "drop_oldest").lower()
+    capture_stats_interval_s = float(os.getenv("CAPTURE_STATS_INTERVAL_S", "30"))
+
+    # Load-shedding governor: degrade quality under CPU/thermal pressure
+    governor_enabled = os.getenv("GOVERNOR", "false").lower() == "true"
+    governor_interval_s = float(os.getenv("GOVERNOR_INTERVAL_S", "2"))
+    vosk_model_fallback = os.getenv("VOSK_MODEL_FALLBACK", "")
+
+    # Turn timeline tracer; dumps Chrome trace JSON on SIGUSR1 and at exit
+    trace_enabled = os.getenv("TRACE", "false").lower() == "true"
+    trace_capacity = int(os.getenv("TRACE_CAPACITY", "65536"))
+    trace_dir = os.getenv("TRACE_DIR", "/tmp")
+
+    vad_backend = os.getenv("VAD_BACKEND", "webrtc").lower()
+    vad_onnx_model = os.getenv("VAD_ONNX_MODEL", "")
+    vad_onnx_threshold = float(os.getenv("VAD_ONNX_THRESHOLD", "0.5"))
+    # Wait this long for more capture blocks before classifying, so a batched
+    # (ONNX) VAD sees several frames per inference call
+    vad_batch_ms = int(os.getenv("VAD_BATCH_MS", "60" if vad_backend == "onnx" else "0"))
     aggressiveness = int(os.getenv("VAD_AGGRESSIVENESS", "2"))
     n_streak = int(os.getenv("VAD_N_STREAK_FRAMES", "3"))
     n_silence = int(os.getenv("VAD_N_SILENCE_FRAMES", "5"))
 
+    # "fixed" keeps n_silence; "adaptive" tunes the timeout per turn within [min, max]
+    endpoint_mode = os.getenv("VAD_ENDPOINT", "fixed").lower()
+    min_silence = int(os.getenv("VAD_MIN_SILENCE_FRAMES", "3"))
+    max_silence = int(os.getenv("VAD_MAX_SILENCE_FRAMES", "40"))
+
+    speculative = os.getenv("LLM_SPECULATIVE", "false").lower() == "true"
+    spec_stable_frames = int(os.getenv("LLM_SPECULATIVE_STABLE_FRAMES", "3"))
+
+    # Upper bound on LLM requests in flight; identical concurrent prompts share one
+    llm_max_concurrent = int(os.getenv("LLM_MAX_CONCURRENT", "2"))
+
+    # Response shaping: token budget per question type, replies cut to a spoken-time budget
+    shaping_enabled = os.getenv("LLM_SHAPING", "false").lower() == "true"
+    shaping_max_spoken_s = float(os.getenv("TTS_MAX_SPOKEN_S", "20"))
+    shaping_follow_up = os.getenv("LLM_SHAPING_FOLLOW_UP", "false").lower() == "true"
+    tts_rate = int(os.getenv("TTS_RATE", "125"))
+
+    # Confidence gate: keep noise recognitions ("the", "huh") away from the LLM
+    gate_enabled = os.getenv("LLM_GATE", "false").lower() == "true"
+    gate_min_confidence = float(os.getenv("LLM_GATE_MIN_CONFIDENCE", "0.6"))
+    gate_min_words = int(os.getenv("LLM_GATE_MIN_WORDS", "2"))
+    gate_action = os.getenv("LLM_GATE_ACTION", "drop").lower()
+
+    # Optional wake word: utterances are only transcribed after the phrase is heard
+    wake_word = os.getenv("WAKE_WORD", "")
+    wake_timeout_s = float(os.getenv("WAKE_WORD_TIMEOUT_S", "10"))
+
+    # Utterance journal for replaying failures (disabled unless a directory is set)
+    journal_dir = os.getenv("JOURNAL_DIR", "")
+    journal_quota_mb = int(os.getenv("JOURNAL_QUOTA_MB", "1024"))
+
     logger.info(
         f"Config: sample_rate={sample_rate}, frame_duration_ms={frame_duration_ms}, "
-        f"aggressiveness={aggressiveness}, n_streak={n_streak}, n_silence={n_silence}"
+        f"capture={capture_rate}Hz/{capture_channels}ch/{capture_dtype}, "
+        f"capture_lag_policy={capture_lag_policy}@{capture_max_lag_s}s, "
+        f"vad={vad_backend}, vad_batch_ms={vad_batch_ms}, aggressiveness={aggressiveness}, n_streak={n_streak}, n_silence={n_silence}, "
+        f"endpoint={endpoint_mode}, speculative={speculative}, "
+        f"spec_stable_frames={spec_stable_frames}, llm_max_concurrent={llm_max_concurrent}, "
+        f"shaping={shaping_enabled}@{shaping_max_spoken_s}s, journal_dir={journal_dir or None}, "
+        f"wake_word={wake_word or None}, gate={gate_enabled}, governor={governor_enabled}, "
+        f"trace={trace_enabled}"
     )
 
+    if trace_enabled:
+        # Enabled before the worker threads start so their names are recorded
+        tracer.enable(trace_capacity)
+        tracer.install_signal_handler(trace_dir)
+        logger.info(f"Tracing: kill -USR1 {os.getpid()} writes a trace to {trace_dir}")
+
     # ------- Init Modules -------
-    vad = WebRTCVAD(
-        sample_rate=sample_rate,
-        frame_duration_ms=frame_duration_ms,
-        aggressiveness=aggressiveness,
+    def make_vad():
+        return create_vad(
+            vad_backend,
+            sample_rate=sample_rate,
+            frame_duration_ms=frame_duration_ms,
+            aggressiveness=aggressiveness,
+            model_path=vad_onnx_model,
+            threshold=vad_onnx_threshold,
+        )
+
+    def make_frontend():
+        return AudioFrontend(
+            in_rate=capture_rate,
+            channels=capture_channels,
+            dtype=capture_dtype,
+            out_rate=sample_rate,
+            dc_removal=os.getenv("AUDIO_DC_REMOVAL", "false").lower() == "true",
+        )
+
+    llm = JetVoiceLLM(token_param=os.getenv("LLM_TOKEN_PARAM") or None)
+    # Every caller (main loop, speculation, stream responders) goes through this
+    llm_client = SingleFlightLLM(llm, max_concurrent=llm_max_concurrent)
+    # Owns the TTS engine on its own thread; speaking never blocks the capture loop
+    tts = TTSWorker(sample_rate=sample_rate)
+
+    # ------- Multi-stream mode -------
+    # AUDIO_STREAMS="kitchen:2:speak,office:5:print" captures several mics in
+    # this process, sharing the Vosk model, LLM client and TTS engine.
+    audio_streams = os.getenv("AUDIO_STREAMS", "")
+    if audio_streams:
+        specs = parse_streams(audio_streams)
+        # The per-turn features below are only wired into the single-stream loop
+        unsupported = {
+            "JOURNAL_DIR": bool(journal_dir) and journal_quota_mb > 0,
+            "GOVERNOR": governor_enabled,
+            "LLM_SPECULATIVE": speculative,
+            "LLM_SHAPING": shaping_enabled,
+            "LLM_GATE": gate_enabled,
+            "VAD_ENDPOINT=adaptive": endpoint_mode == "adaptive",
+            "WAKE_WORD": bool(wake_word),
+        }
+        for setting, enabled in unsupported.items():
+            if enabled:
+                logger.warning(f"[STREAMS] {setting} is not supported with AUDIO_STREAMS and is ignored")
+        if trace_enabled:
+            logger.warning("[STREAMS] TRACE records stage spans only with AUDIO_STREAMS; turn spans are not recorded")
+
+        runner = MultiStreamRunner(
+            specs,
+            llm_client,
+            tts,
+            make_vad=make_vad,
+            make_frontend=make_frontend,
+            # One queue carries every stream's blocks
+            monitor=CaptureMonitor(
+                max_queue=capture_max_queue * len(specs),
+                max_lag_s=capture_max_lag_s,
+                policy=capture_lag_policy,
+            ),
+            sample_rate=sample_rate,
+            capture_rate=capture_rate,
+            capture_channels=capture_channels,
+            capture_dtype=capture_dtype,
+            frame_duration_ms=frame_duration_ms,
+            n_streak=n_streak,
+            n_silence=n_silence,
+        )
+        try:
+            runner.run()
+        except KeyboardInterrupt:
+            logger.info("Gracefully shutting down multi-stream loop.")
+        finally:
+            logger.info(f"LLM requests: {llm_client.stats}")
+            tts.close(timeout=5)
+            if tracer.enabled:
+                logger.info(f"Trace written to {tracer.dump_to_dir(trace_dir)}")
+        return
+
+    endpointer = None
+    if endpoint_mode == "adaptive":
+        endpointer = AdaptiveEndpointer(
+            frame_duration_ms=frame_duration_ms,
+            base_silence_frames=n_silence,
+            min_silence_frames=min_silence,
+            max_silence_frames=max_silence,
+        )
+
+    # Speculative mode and the adaptive endpointer both need the partial
+    # transcript, so decode while capturing; the streamer's final text then
+    # replaces transcribe_bytes.
+    streamer = None
+    if speculative or endpointer:
+        streamer = StreamingTranscriber(sample_rate=sample_rate)
+    gate = None
+    if gate_enabled:
+        gate = ConfidenceGate(
+            min_confidence=gate_min_confidence,
+            min_words=gate_min_words,
+            action=gate_action,
+        )
+
+    shaper = None
+    if shaping_enabled:
+        shaper = ResponseShaper(
+            rate_wpm=tts_rate,
+            max_spoken_s=shaping_max_spoken_s,
+            follow_up=shaping_follow_up,
+        )
+
+    spec = None
+    if speculative:
+        spec = SpeculativeLLM(
+            llm_client,
+            stable_frames=spec_stable_frames,
+            token_budget=shaper.token_budget if shaper else None,
+        )
+
+    governor = None
+    if governor_enabled:
+        governor = Governor(default_levels(vosk_model_fallback or None))
+        # What each level falls back to for the settings it leaves alone
+        base_level = QualityLevel(
+            "configured",
+            vad_aggressiveness=aggressiveness,
+            llm_max_tokens=llm.max_tokens,
+            tts_online=tts.use_online,
+        )
+
+    spotter = WakeWordSpotter(wake_word, sample_rate=sample_rate) if wake_word else None
+
+    journal = None
+    # JOURNAL_QUOTA_MB=0 disables the journal
+    if journal_dir and journal_quota_mb > 0:
+        quota_bytes = journal_quota_mb * 1024 * 1024
+        journal = UtteranceJournal(
+            journal_dir,
+            segment_bytes=min(64 * 1024 * 1024, quota_bytes),
+            quota_bytes=quota_bytes,
+        )
+
+    vad = make_vad()
+    frontend = make_frontend()
+
+    monitor = CaptureMonitor(
+        max_queue=capture_max_queue,
+        max_lag_s=capture_max_lag_s,
+        policy=capture_lag_policy,
     )
-    
-    llm = JetVoiceLLM()
-    tts = JetVoiceTTS()
 
     audio_device = int(os.getenv("AUDIO_DEVICE", "0"))
-    audio_queue: "queue.Queue[bytes]" = queue.Queue()
 
     def audio_callback(indata, frames, time_info, status):
-        if status:
-            pass 
-        audio_queue.put(bytes(indata))
+        # Overflows/underflows in `status` are counted by the monitor
+        monitor.put(bytes(indata), status)
 
-    blocksize = int(sample_rate * frame_duration_ms / 1000)
+    blocksize = int(capture_rate * frame_duration_ms / 1000)
 
     # ------- State -------
     in_speech = False
+    armed = spotter is None
+    armed_at = 0.0
     speech_streak = 0
     silence_streak = 0
 
@@ -70,31 +293,137 @@ def main():
     frame_bytes = vad.frame_size_bytes
     current_segment = bytearray()
 
+    # Reply being played by the TTS worker, and the journal entry waiting on its timing
+    playback = None
+    pending_record = None
+    turn_started_ns = 0
+    spoken_estimate_s = None
+
+    last_stats_at = time.monotonic()
+    last_governed_at = time.monotonic()
+    last_overflows = 0
+
     logger.info("[STATE] listening (no voice, waiting for activity)")
 
     try:
-        # We assign the stream to a variable 'stream' so we can stop/start it
+        # The stream stays open for the whole session, including during playback
         with sd.RawInputStream(
-            samplerate=sample_rate,
+            samplerate=capture_rate,
             blocksize=blocksize,
-            dtype="int16",
-            channels=1,
+            dtype=capture_dtype,
+            channels=capture_channels,
             callback=audio_callback,
             device=audio_device,
-        ) as stream:
+        ):
             while True:
-                chunk = audio_queue.get()
-                buffer += chunk
+                chunks, resynced = monitor.get_batch(window_s=vad_batch_ms / 1000)
+                tracer.counter("capture_lag_ms", monitor.stats.lag_s * 1000)
 
-                # Process fixed-size frames
-                while len(buffer) >= frame_bytes:
-                    frame = buffer[:frame_bytes]
-                    buffer = buffer[frame_bytes:]
+                if resynced:
+                    # Backlog was skipped: whatever was being captured is now stale
+                    tracer.instant("capture.resync", cat="capture")
+                    logger.warning(f"[CAPTURE] fell behind real time, skipped to live ({monitor.stats})")
+                    in_speech = False
+                    speech_streak = 0
+                    silence_streak = 0
+                    current_segment.clear()
+                    buffer = b""
+                    frontend.reset()
+                    vad.reset()
+                    if streamer:
+                        streamer.reset()
+                    if spec:
+                        spec.discard()
+                    if endpointer:
+                        endpointer.reset_utterance()
 
-                    has_speech = vad.has_speech(frame)
+                if monitor.stats.overflows > last_overflows:
+                    logger.warning(f"[CAPTURE] input overflow reported by PortAudio ({monitor.stats})")
+                    last_overflows = monitor.stats.overflows
+                if time.monotonic() - last_stats_at > capture_stats_interval_s:
+                    logger.info(f"[CAPTURE] {monitor.stats}")
+                    last_stats_at = time.monotonic()
+
+                if governor and time.monotonic() - last_governed_at > governor_interval_s:
+                    last_governed_at = time.monotonic()
+                    transition = governor.poll(lag_s=monitor.stats.lag_s)
+                    if transition:
+                        logger.warning(f"[GOVERNOR] {transition}")
+                        # The Vosk model loads on a background thread and is swapped in when ready
+                        monitor.pause()
+                        try:
+                            apply_level(governor.level, base_level, vad=vad, llm=llm, tts=tts, use_model=use_model_async)
+                        finally:
+                            monitor.resume()
+
+                if playback:
+                    # Capture keeps running during playback; drop what the mic hears of the reply
+                    if not playback.done:
+                        continue
+                    logger.info(f"Resuming listening... (playback {playback.status} in {playback.elapsed_s:.2f}s)")
+                    tracer.complete("tts.playback", playback.submitted_ns, cat="stage", status=playback.status)
+                    tracer.complete("turn", turn_started_ns, cat="turn")
+                    if shaper and spoken_estimate_s is not None and playback.audio_s is not None:
+                        # Timed from the first sound, so gTTS download and player startup don't count
+                        shaper.record_playback(spoken_estimate_s, playback.audio_s)
+                        logger.info(
+                            f"[SHAPING] spoken {playback.audio_s:.1f}s, estimated {spoken_estimate_s:.1f}s "
+                            f"({shaper.stats})"
+                        )
+                    spoken_estimate_s = None
+                    if pending_record:
+                        audio_bytes, text, response, timings = pending_record
+                        timings["tts"] = playback.elapsed_s
+                        journal.record(
+                            audio_bytes, sample_rate,
+                            transcript=text, response=response, timings=timings,
+                        )
+                        pending_record = None
+                    playback = None
+                    # Drop audio queued around the end of playback (echo tail)
+                    monitor.clear()
+                    buffer = b""
+                    frontend.reset()
+                    continue
+
+                buffer += frontend.process(b"".join(chunks))
+
+                # Process fixed-size frames; classify all complete frames in one
+                # call so batched (neural) VAD backends amortize inference
+                n_frames = len(buffer) // frame_bytes
+                frames = [buffer[i * frame_bytes:(i + 1) * frame_bytes] for i in range(n_frames)]
+                buffer = buffer[n_frames * frame_bytes:]
+                flushed = False
+
+                with tracer.span("vad.classify", cat="vad", frames=len(frames)):
+                    decisions = vad.classify_frames(frames)
+
+                for frame, has_speech in zip(frames, decisions):
+                    if endpointer:
+                        endpointer.update(frame, has_speech, in_speech)
+
+                    if spotter:
+                        if not armed and spotter.accept(frame):
+                            armed = True
+                            armed_at = time.monotonic()
+                            logger.info(f"[WAKE] '{spotter.phrase}' detected, arming transcription")
+                            # Catch the streamer up on the utterance captured so far
+                            if streamer and current_segment:
+                                streamer.reset()
+                                streamer.accept(bytes(current_segment))
+                        elif armed and not in_speech and time.monotonic() - armed_at > wake_timeout_s:
+                            armed = False
+                            logger.info("[WAKE] no request after wake word, disarming")
 
                     if has_speech:
                         current_segment.extend(frame)
+                        if streamer and armed:
+                            with tracer.span("stt.feed", cat="stt"):
+                                partial = streamer.accept(frame)
+                            if spec:
+                                if spotter:
+                                    partial = strip_phrase(partial, spotter.phrase)
+                                spec.observe(partial, paused=False)
                         speech_streak += 1
                         silence_streak = 0
 
@@ -109,9 +438,24 @@ def main():
                             silence_streak += 1
                             speech_streak = 0
                             current_segment.extend(frame)
+                            if streamer and armed:
+                                with tracer.span("stt.feed", cat="stt"):
+                                    partial = streamer.accept(frame)
+                                if spec:
+                                    if spotter:
+                                        partial = strip_phrase(partial, spotter.phrase)
+                                    spec.observe(partial, paused=True)
+
+                            if endpointer:
+                                decision = endpointer.decide(silence_streak, streamer.partial)
+                                if decision:
+                                    logger.info(f"[ENDPOINT] {decision}")
+                                end_of_utterance = decision is not None
+                            else:
+                                end_of_utterance = silence_streak >= n_silence
 
                             # --- TRANSITION: CAPTURING -> TRANSCRIBING ---
-                            if silence_streak >= n_silence:
+                            if end_of_utterance:
                                 in_speech = False
                                 
                                 logger.info("[STATE] transcribing...")
@@ -121,43 +465,124 @@ def main():
                                 speech_streak = 0
                                 silence_streak = 0
 
+                                if audio_bytes and not armed:
+                                    # No wake word: skip full STT and the LLM entirely
+                                    logger.info("[WAKE] not armed, dropping utterance")
+                                    if streamer:
+                                        streamer.reset()
+                                    audio_bytes = b""
+
                                 if audio_bytes:
-                                    text = transcribe_bytes(audio_bytes, sample_rate=sample_rate)
+                                    # Final STT and the LLM block this loop on purpose;
+                                    # audio queued meanwhile is not capture lag
+                                    monitor.pause()
+                                    timings = {}
+                                    response = None
+                                    spoken_estimate_s = None
+                                    turn_started_ns = time.perf_counter_ns()
+
+                                    stage_start = time.monotonic()
+                                    streamed_s = 0.0
+                                    with tracer.span("stt", cat="stage"):
+                                        if streamer:
+                                            # Most decoding already happened in accept() while capturing
+                                            streamed_s = streamer.decode_s
+                                            transcript = streamer.finish_result()
+                                        else:
+                                            transcript = transcribe_result(audio_bytes, sample_rate=sample_rate)
+                                    text = transcript.text
+                                    timings["stt"] = time.monotonic() - stage_start
+                                    if governor:
+                                        audio_seconds = len(audio_bytes) / 2 / sample_rate
+                                        governor.observe_stt((streamed_s + timings["stt"]) / audio_seconds)
+
+                                    if spotter:
+                                        text = strip_phrase(text, spotter.phrase)
+                                        if text:
+                                            armed = False
+                                        else:
+                                            # Wake phrase alone: stay armed for the next utterance
+                                            armed_at = time.monotonic()
+
                                     if text:
                                         print(f"\n[Transcript] {text}")
-                                        
-                                        logger.info("Querying LLM...")
-                                        response = llm.ask(text)
-                                        
+
+                                        verdict = PASS
+                                        if gate:
+                                            verdict, reason = gate.check(
+                                                text, transcript.confidence, prefetched=bool(spec and spec.in_flight)
+                                            )
+                                            if verdict != PASS:
+                                                logger.info(f"[GATE] {verdict}: {reason} ({gate.stats})")
+                                                if spec:
+                                                    spec.discard()
+
+                                        continued = shaper.continuation(text) if verdict == PASS and shaper else None
+                                        if continued:
+                                            # "Yes" to "Want me to continue?": speak the held-back rest
+                                            logger.info("[SHAPING] continuing previous reply")
+                                            response, spoken_estimate_s = shaper.shape(continued)
+                                            if spec:
+                                                spec.discard()
+                                        elif verdict == PASS:
+                                            logger.info("Querying LLM...")
+                                            stage_start = time.monotonic()
+                                            with tracer.span("llm", cat="stage", speculative=bool(spec)):
+                                                if spec:
+                                                    response = spec.resolve(
+                                                        text, max_tokens=shaper.token_budget(text) if shaper else None
+                                                    )
+                                                elif shaper:
+                                                    response = llm_client.ask(text, max_tokens=shaper.token_budget(text))
+                                                else:
+                                                    response = llm_client.ask(text)
+                                            if spec:
+                                                logger.info(f"Speculative LLM: {spec.stats}")
+                                            timings["llm"] = time.monotonic() - stage_start
+                                            if response and shaper:
+                                                response, spoken_estimate_s = shaper.shape(response)
+                                        elif verdict == REPROMPT:
+                                            response = gate.reprompt_text
+
                                         if response:
                                             print(f"[AI] {response}")
                                             
-                                            # --- TTS BLOCKING SECTION ---
-                                            logger.info("Pausing microphone for playback...")
-                                            
-                                            # 1. Stop capturing to prevent feedback loop
-                                            stream.stop()
-                                            
-                                            # 2. Speak the response (Blocking)
-                                            tts.speak(response)
-                                            
-                                            # 3. Clear any audio buffered during the stop process
-                                            #    (This prevents processing 'echoes' captured just before stopping)
-                                            with audio_queue.mutex:
-                                                audio_queue.queue.clear()
+                                            # --- TTS (handed to the worker) ---
+                                            # Capture stays open; chunks are discarded until
+                                            # playback completes, to prevent a feedback loop
+                                            logger.info("Muting microphone for playback...")
+                                            priority = PRIORITY_HIGH if verdict == REPROMPT else PRIORITY_NORMAL
+                                            playback = tts.submit(response, priority=priority)
                                             buffer = b""
-                                            
-                                            # 4. Resume capturing
-                                            logger.info("Resuming listening...")
-                                            stream.start()
-                                            
-                                        else:
+                                            frontend.reset()
+                                            flushed = True
+
+                                        elif verdict == PASS:
                                             logger.warning("LLM returned no response.")
                                     else:
+                                        if spec:
+                                            spec.discard()
                                         print("\n[Transcript] (no text recognized)")
 
+                                    if journal and playback:
+                                        # Recorded once playback finishes, with its timing
+                                        pending_record = (audio_bytes, text, response, timings)
+                                    elif journal:
+                                        journal.record(
+                                            audio_bytes, sample_rate,
+                                            transcript=text, response=response, timings=timings,
+                                        )
+
+                                    if not playback:
+                                        tracer.complete("turn", turn_started_ns, cat="turn")
+                                    monitor.resume()
+
                                 logger.info("[STATE] listening")
 
+                                # Frames left in this batch were captured before playback
+                                if flushed:
+                                    break
+
                         else:
                             # Still silent, not in a speech segment
                             speech_streak = 0
@@ -167,6 +592,15 @@ def main():
     except Exception as e:
         logger.error(f"Unexpected error in main loop: {e}")
         logger.exception("Traceback:")
+    finally:
+        logger.info(f"LLM requests: {llm_client.stats}")
+        tts.close(timeout=5)
+        if tracer.enabled:
+            logger.info(f"Trace written to {tracer.dump_to_dir(trace_dir)}")
+        if spec:
+            spec.close()
+        if journal:
+            journal.close(timeout=5)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,2 @@
+from .streams import MultiStreamRunner
+from .streams import parse_streams
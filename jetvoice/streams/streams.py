@@ -0,0 +1,324 @@
+import json
+import queue
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, List, Optional
+
+import vosk
+from loguru import logger
+
+from jetvoice.audio.monitor import CaptureMonitor
+from jetvoice.stt.stt import get_model, Transcript
+from jetvoice.trace import tracer
+from jetvoice.vad.segmenter import Segmenter
+
+
+ROUTES = ("speak", "print", "none")
+
+
+@dataclass
+class StreamSpec:
+    """
+    One capture stream: a name for logs, the input device and where replies go.
+
+    Routes:
+        speak - answer through the shared TTS engine (the stream is muted meanwhile)
+        print - print the transcript and answer, no audio
+        none  - transcribe and log only, the LLM is not called
+    """
+    name: str
+    device: int
+    route: str = "speak"
+
+
+def parse_streams(value: str) -> List[StreamSpec]:
+    """
+    Parses AUDIO_STREAMS, e.g. "kitchen:2:speak,office:5:print".
+    The route is optional and defaults to "speak".
+    """
+    specs = []
+    for item in filter(None, (part.strip() for part in value.split(","))):
+        fields = item.split(":")
+        if len(fields) not in (2, 3):
+            raise ValueError(f"Invalid stream '{item}', expected name:device[:route]")
+        route = fields[2].lower() if len(fields) == 3 else "speak"
+        if route not in ROUTES:
+            raise ValueError(f"Invalid route '{route}' for stream '{fields[0]}', expected one of {ROUTES}")
+        specs.append(StreamSpec(name=fields[0], device=int(fields[1]), route=route))
+
+    names = [s.name for s in specs]
+    if len(set(names)) != len(names):
+        raise ValueError("stream names must be unique")
+    return specs
+
+
+class _Job:
+    def __init__(self, stream: str, audio: bytes, sample_rate: int) -> None:
+        self.stream = stream
+        self.audio = audio
+        self.offset = 0
+        self.recognizer = vosk.KaldiRecognizer(get_model(), sample_rate)
+        self.recognizer.SetWords(True)
+
+
+class FairSTTScheduler:
+    """
+    Runs STT for all streams on one worker thread using the single loaded model.
+
+    Each stream has its own queue and its own recognizer state. The worker
+    feeds one chunk of the current utterance for each stream with work in
+    round-robin order, so a long utterance in one room doesn't hold back a
+    short command in another.
+
+    Usage:
+        scheduler = FairSTTScheduler(16000, on_result=handle)
+        scheduler.submit("kitchen", utterance_bytes)
+        ...
+        scheduler.close()
+    """
+
+    def __init__(
+        self,
+        sample_rate: int,
+        on_result: Callable[[str, Transcript], None],
+        chunk_bytes: int = 16000,
+    ) -> None:
+        """
+        Args:
+            sample_rate: Sample rate of submitted PCM16 mono audio.
+            on_result: Called from the worker with (stream name, Transcript).
+            chunk_bytes: Audio fed per turn (16000 bytes = 0.5 s at 16 kHz).
+        """
+        self.sample_rate = sample_rate
+        self.on_result = on_result
+        self.chunk_bytes = chunk_bytes
+
+        self._pending = OrderedDict()  # stream -> deque of audio, in round-robin order
+        self._active = {}  # stream -> _Job being decoded
+        self._cond = threading.Condition()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="jetvoice-stt", daemon=True)
+        self._thread.start()
+
+    def submit(self, stream: str, audio: bytes) -> None:
+        with self._cond:
+            self._pending.setdefault(stream, deque()).append(audio)
+            self._cond.notify()
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """
+        Stops the worker once all submitted utterances are transcribed.
+        """
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+        self._thread.join(timeout)
+
+    def _next_stream(self) -> Optional[str]:
+        """
+        Picks the stream at the front of the rotation and moves it to the back.
+        """
+        for stream in list(self._pending):
+            self._pending.move_to_end(stream)
+            if stream in self._active or self._pending[stream]:
+                return stream
+        return None
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                stream = self._next_stream()
+                while stream is None:
+                    if self._closed:
+                        return
+                    self._cond.wait()
+                    stream = self._next_stream()
+
+                job = self._active.get(stream)
+                if job is None:
+                    job = _Job(stream, self._pending[stream].popleft(), self.sample_rate)
+                    self._active[stream] = job
+
+            # Decode outside the lock so submit() never waits on Vosk
+            try:
+                chunk = job.audio[job.offset:job.offset + self.chunk_bytes]
+                job.offset += self.chunk_bytes
+                with tracer.span("stt.feed", cat="stt", stream=stream):
+                    job.recognizer.AcceptWaveform(chunk)
+                done = job.offset >= len(job.audio)
+                result = Transcript.from_result(json.loads(job.recognizer.FinalResult())) if done else None
+            except Exception as e:
+                print(f"[STT Scheduler Error] {stream}: {e}")
+                done, result = True, Transcript()
+
+            if done:
+                with self._cond:
+                    self._active.pop(stream, None)
+                try:
+                    self.on_result(stream, result)
+                except Exception as e:
+                    print(f"[STT Scheduler Error] {stream} callback: {e}")
+
+
+class MultiStreamRunner:
+    """
+    Captures N microphones in one process with one Vosk model and one TTS engine.
+
+    Capture callbacks push (stream, chunk) into one queue; the main thread runs
+    each stream's front-end, VAD and Segmenter and submits utterances to the
+    FairSTTScheduler. Transcripts are answered on a small LLM pool (one worker
+    per stream, so rooms don't queue behind each other's API calls) and the
+    answers routed per stream; spoken replies go to a responder thread, so the
+    shared TTS engine is only ever driven from that one thread.
+    """
+
+    def __init__(
+        self,
+        specs: List[StreamSpec],
+        llm,
+        tts,
+        make_vad: Callable[[], object],
+        make_frontend: Callable[[], object],
+        sample_rate: int = 16000,
+        capture_rate: int = 16000,
+        capture_channels: int = 1,
+        capture_dtype: str = "int16",
+        frame_duration_ms: int = 20,
+        n_streak: int = 3,
+        n_silence: int = 5,
+        monitor: Optional[CaptureMonitor] = None,
+    ) -> None:
+        if not specs:
+            raise ValueError("at least one stream is required")
+
+        self.specs = {spec.name: spec for spec in specs}
+        self.llm = llm
+        self.tts = tts
+        self.sample_rate = sample_rate
+        self.capture_rate = capture_rate
+        self.capture_channels = capture_channels
+        self.capture_dtype = capture_dtype
+        self.frame_duration_ms = frame_duration_ms
+
+        self._vads = {name: make_vad() for name in self.specs}
+        self._frontends = {name: make_frontend() for name in self.specs}
+        self._segmenters = {name: Segmenter(n_streak, n_silence) for name in self.specs}
+        self._buffers = {name: b"" for name in self.specs}
+        self._muted = {name: False for name in self.specs}
+        self._streams = {}
+
+        # One bounded, health-tracked queue for all streams' (name, chunk) items
+        self.monitor = monitor or CaptureMonitor(max_queue=250 * len(specs))
+        self._replies: "queue.Queue[Optional[tuple]]" = queue.Queue()
+        self._llm_pool = ThreadPoolExecutor(max_workers=len(specs), thread_name_prefix="jetvoice-llm")
+        self._scheduler = FairSTTScheduler(sample_rate, on_result=self._on_transcript)
+        self._responder = threading.Thread(target=self._respond, name="jetvoice-respond", daemon=True)
+
+    def _on_transcript(self, stream: str, transcript: Transcript) -> None:
+        if transcript.text:
+            self._llm_pool.submit(self._answer, stream, transcript.text)
+        else:
+            logger.info(f"[{stream}] (no text recognized)")
+
+    def _answer(self, stream: str, text: str) -> None:
+        route = self.specs[stream].route
+        print(f"\n[{stream}] [Transcript] {text}")
+        if route == "none":
+            return
+
+        with tracer.span("llm", cat="stage", stream=stream):
+            response = self.llm.ask(text)
+        if not response:
+            logger.warning(f"[{stream}] LLM returned no response.")
+            return
+
+        print(f"[{stream}] [AI] {response}")
+        if route == "speak":
+            self._replies.put((stream, response))
+
+    def _respond(self) -> None:
+        while True:
+            item = self._replies.get()
+            if item is None:
+                return
+            stream, response = item
+            # Mute only the stream that asked, to keep its mic from hearing the reply
+            self._muted[stream] = True
+            try:
+                with tracer.span("device.stop", cat="device", stream=stream):
+                    self._streams[stream].stop()
+                with tracer.span("tts", cat="stage", stream=stream):
+                    self.tts.speak(response)
+                with tracer.span("device.start", cat="device", stream=stream):
+                    self._streams[stream].start()
+            finally:
+                self._muted[stream] = False
+
+    def process_chunk(self, stream: str, chunk: bytes) -> None:
+        """
+        Runs one captured chunk through the stream's front-end, VAD and segmenter.
+        """
+        if self._muted[stream]:
+            self._buffers[stream] = b""
+            self._segmenters[stream].reset()
+            return
+
+        vad = self._vads[stream]
+        frame_bytes = vad.frame_size_bytes
+        buffer = self._buffers[stream] + self._frontends[stream].process(chunk)
+
+        n_frames = len(buffer) // frame_bytes
+        frames = [buffer[i * frame_bytes:(i + 1) * frame_bytes] for i in range(n_frames)]
+        self._buffers[stream] = buffer[n_frames * frame_bytes:]
+
+        segmenter = self._segmenters[stream]
+        for frame, has_speech in zip(frames, vad.classify_frames(frames)):
+            utterance = segmenter.feed(frame, has_speech)
+            if utterance:
+                logger.info(f"[{stream}] [STATE] transcribing {len(utterance) / 2 / self.sample_rate:.1f}s")
+                self._scheduler.submit(stream, utterance)
+
+    def run(self) -> None:
+        import sounddevice as sd
+
+        blocksize = int(self.capture_rate * self.frame_duration_ms / 1000)
+
+        def make_callback(name):
+            def callback(indata, frames, time_info, status):
+                self.monitor.put((name, bytes(indata)), status)
+            return callback
+
+        for name, spec in self.specs.items():
+            self._streams[name] = sd.RawInputStream(
+                samplerate=self.capture_rate,
+                blocksize=blocksize,
+                dtype=self.capture_dtype,
+                channels=self.capture_channels,
+                callback=make_callback(name),
+                device=spec.device,
+            )
+
+        self._responder.start()
+        for name, stream in self._streams.items():
+            stream.start()
+            logger.info(f"[{name}] listening on device {self.specs[name].device} (route={self.specs[name].route})")
+
+        try:
+            while True:
+                (name, chunk), resynced = self.monitor.get()
+                if resynced:
+                    logger.warning(f"[CAPTURE] fell behind real time, skipped to live ({self.monitor.stats})")
+                    for other in self.specs:
+                        self._buffers[other] = b""
+                        self._segmenters[other].reset()
+                        self._vads[other].reset()
+                self.process_chunk(name, chunk)
+        finally:
+            for stream in self._streams.values():
+                stream.stop()
+                stream.close()
+            self._scheduler.close(timeout=5)
+            self._llm_pool.shutdown(wait=False, cancel_futures=True)
+            self._replies.put(None)
@@ -1,3 +1,5 @@
 from .stt import callback
 from .stt import transcribe
-from .stt import recognize_from_microphone
\ No newline at end of file
+from .stt import recognize_from_microphone
+from .stt import StreamingTranscriber
+from .wakeword import WakeWordSpotter
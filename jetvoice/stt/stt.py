@@ -3,8 +3,12 @@ import queue
 import sounddevice as sd
 import vosk
 import json
+import threading
 import time
-import wave
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+from jetvoice.audio.frontend import load_wav
 
 
 # Path to the Vosk speech recognition model (configurable)
@@ -25,6 +29,84 @@ try:
 except Exception as e:
     raise RuntimeError(f"Vosk model not found at {MODEL_PATH}. Error: {e}")
 
+# Only the model in use stays loaded; switching releases the previous one
+# (recognizers still decoding keep it alive until they finish)
+_model_name = VOSK_MODEL
+_wanted_name = VOSK_MODEL
+_loader: Optional[threading.Thread] = None
+_switch_lock = threading.Lock()
+
+
+def _load_model(name: str):
+    path = os.path.join(BASE_DIR, "models", name)
+    try:
+        return vosk.Model(path)
+    except Exception as e:
+        raise RuntimeError(f"Vosk model not found at {path}. Error: {e}")
+
+
+def use_model(name: str = None) -> None:
+    """
+    Switches the model used by transcribe_* and new StreamingTranscriber
+    utterances (e.g. to a smaller one under CPU pressure). Blocks while the
+    model loads; see use_model_async() for the capture loop.
+
+    Args:
+        name: Model directory under stt/models; None restores VOSK_MODEL.
+    """
+    global model, _model_name, _wanted_name
+    name = name or VOSK_MODEL
+    if name == _model_name:
+        return
+    loaded = _load_model(name)
+    with _switch_lock:
+        model, _model_name, _wanted_name = loaded, name, name
+
+
+def use_model_async(name: str = None) -> None:
+    """
+    Like use_model(), but loads on a background thread and swaps the model in
+    once it is ready; returns immediately. Until then the current model keeps
+    serving. If several switches are requested during a load, the last wins.
+    """
+    global _wanted_name, _loader
+    with _switch_lock:
+        _wanted_name = name or VOSK_MODEL
+        if _loader is not None or _wanted_name == _model_name:
+            return
+        _loader = threading.Thread(target=_load_wanted, name="jetvoice-model-loader", daemon=True)
+        _loader.start()
+
+
+def _load_wanted() -> None:
+    global model, _model_name, _wanted_name, _loader
+    while True:
+        with _switch_lock:
+            name = _wanted_name
+            if name == _model_name:
+                _loader = None
+                return
+        try:
+            loaded = _load_model(name)
+        except RuntimeError as e:
+            print(f"[STT Error]: {e}")
+            with _switch_lock:
+                if _wanted_name == name:
+                    # Stay on the current model
+                    _wanted_name = _model_name
+            continue
+        with _switch_lock:
+            model, _model_name = loaded, name
+        loaded = None
+
+
+def get_model():
+    """
+    The model currently selected by use_model(). Modules outside stt.py must
+    call this instead of importing `model`, which would pin the startup model.
+    """
+    return model
+
 # Create audio queue
 q = queue.Queue()
 
@@ -33,22 +115,72 @@ def callback(indata, frames, time, status):
     q.put(bytes(indata))
 
 
-def transcribe_bytes(audio_bytes: bytes, sample_rate: int = SAMPLE_RATE) -> str:
+@dataclass
+class Word:
     """
-    Transcribes a chunk of raw PCM16 mono audio bytes using the already loaded Vosk model.
+    One recognized word with its timing (seconds) and Vosk confidence (0-1).
+    """
+    word: str
+    start: float
+    end: float
+    conf: float
+
+
+@dataclass
+class Transcript:
+    """
+    Structured recognition result: the text plus word-level details.
+    """
+    text: str = ""
+    words: List[Word] = field(default_factory=list)
+
+    @property
+    def confidence(self) -> float:
+        """
+        Mean word confidence, 0.0 if no words were recognized.
+        """
+        if not self.words:
+            return 0.0
+        return sum(w.conf for w in self.words) / len(self.words)
+
+    @property
+    def duration(self) -> float:
+        """
+        Seconds from the first word's start to the last word's end.
+        """
+        if not self.words:
+            return 0.0
+        return self.words[-1].end - self.words[0].start
+
+    @classmethod
+    def from_result(cls, result: dict, key: str = "text") -> "Transcript":
+        """
+        Builds a Transcript from a parsed Vosk Result()/FinalResult() dict.
+        """
+        words = [
+            Word(w.get("word", ""), w.get("start", 0.0), w.get("end", 0.0), w.get("conf", 1.0))
+            for w in result.get("result", [])
+        ]
+        return cls(text=result.get(key, "").strip(), words=words)
+
+
+def transcribe_result(audio_bytes: bytes, sample_rate: int = SAMPLE_RATE) -> Transcript:
+    """
+    Transcribes raw PCM16 mono audio and returns text with word timings and confidences.
 
     Args:
         audio_bytes: Raw 16-bit PCM mono audio bytes.
         sample_rate: Sample rate of the audio (Hz), must match how it was recorded.
 
     Returns:
-        Transcribed text (may be empty string if nothing recognized).
+        Transcript (empty if nothing recognized).
     """
     try:
         if not audio_bytes:
-            return ""
+            return Transcript()
 
         recognizer = vosk.KaldiRecognizer(model, sample_rate)
+        recognizer.SetWords(True)
 
         # Feed audio to recognizer in chunks
         chunk_size = 4000  # bytes per chunk; doesn't need to match exactly anything
@@ -60,12 +192,112 @@ def transcribe_bytes(audio_bytes: bytes, sample_rate: int = SAMPLE_RATE) -> str:
             offset += chunk_size
             recognizer.AcceptWaveform(chunk)
 
-        result = json.loads(recognizer.FinalResult())
-        return result.get("text", "").strip()
+        return Transcript.from_result(json.loads(recognizer.FinalResult()))
 
     except Exception as e:
         print(f"[STT Bytes Error]: {e}")
-        return ""
+        return Transcript()
+
+
+def transcribe_bytes(audio_bytes: bytes, sample_rate: int = SAMPLE_RATE) -> str:
+    """
+    Transcribes a chunk of raw PCM16 mono audio bytes using the already loaded Vosk model.
+
+    Args:
+        audio_bytes: Raw 16-bit PCM mono audio bytes.
+        sample_rate: Sample rate of the audio (Hz), must match how it was recorded.
+
+    Returns:
+        Transcribed text (may be empty string if nothing recognized).
+    """
+    return transcribe_result(audio_bytes, sample_rate=sample_rate).text
+
+
+class StreamingTranscriber:
+    """
+    Incremental Vosk recognizer that exposes the partial hypothesis while an
+    utterance is still being captured.
+
+    Feeding the same bytes that would otherwise go to transcribe_bytes yields
+    the same final text, so the caller can use it instead of a second decode.
+
+    Usage:
+        streamer = StreamingTranscriber(sample_rate=16000)
+        partial = streamer.accept(frame)
+        ...
+        text = streamer.finish()
+    """
+
+    def __init__(self, sample_rate: int = SAMPLE_RATE) -> None:
+        self.sample_rate = sample_rate
+        self.partial = ""
+        # Seconds spent decoding the current utterance, for its real-time factor
+        self.decode_s = 0.0
+        self._recognizer = None
+        self._committed = []
+        self._words = []
+        self.reset()
+
+    def reset(self) -> None:
+        """
+        Drop any buffered audio and start a fresh utterance.
+        """
+        self._recognizer = vosk.KaldiRecognizer(model, self.sample_rate)
+        self._recognizer.SetWords(True)
+        self._committed = []
+        self._words = []
+        self.partial = ""
+        self.decode_s = 0.0
+
+    def accept(self, audio_bytes: bytes) -> str:
+        """
+        Feeds raw PCM16 mono audio and returns the current partial hypothesis.
+
+        Vosk may close a phrase internally (AcceptWaveform returns True) in the
+        middle of an utterance; those phrases are kept so the partial always
+        covers everything heard since the last reset.
+        """
+        start = time.perf_counter()
+        try:
+            if self._recognizer.AcceptWaveform(audio_bytes):
+                phrase = Transcript.from_result(json.loads(self._recognizer.Result()))
+                if phrase.text:
+                    self._committed.append(phrase.text)
+                    self._words.extend(phrase.words)
+                current = ""
+            else:
+                current = json.loads(self._recognizer.PartialResult()).get("partial", "").strip()
+        except Exception as e:
+            print(f"[STT Stream Error]: {e}")
+            current = ""
+        self.decode_s += time.perf_counter() - start
+
+        self.partial = " ".join(self._committed + ([current] if current else []))
+        return self.partial
+
+    def finish_result(self) -> Transcript:
+        """
+        Flushes the recognizer and returns the final Transcript of the utterance.
+        The transcriber is reset afterwards and can be reused.
+        """
+        try:
+            last = Transcript.from_result(json.loads(self._recognizer.FinalResult()))
+        except Exception as e:
+            print(f"[STT Stream Error]: {e}")
+            last = Transcript()
+
+        result = Transcript(
+            text=" ".join(self._committed + ([last.text] if last.text else [])),
+            words=self._words + last.words,
+        )
+        self.reset()
+        return result
+
+    def finish(self) -> str:
+        """
+        Same as finish_result() but returns only the text.
+        """
+        return self.finish_result().text
 
 
 # Main transcription function
@@ -150,7 +382,8 @@ def transcribe_file(file_path: str) -> str:
     Transcribes a local audio file.
 
     This function is primarily for testing the Vosk model with a consistent
-    input. The audio file must be in WAV format with the correct properties.
+    input. Any uncompressed PCM WAV is accepted; it is downmixed and resampled
+    to mono 16-bit at SAMPLE_RATE before decoding.
 
     Args:
         file_path: The path to the .wav file.
@@ -159,24 +392,14 @@ def transcribe_file(file_path: str) -> str:
         The transcribed text as a string.
     """
     try:
-        # Check if the file is in the required format
-        wf = wave.open(file_path, "rb")
-        expected_framerate = int(SAMPLE_RATE)
-        if (wf.getnchannels() != 1 or wf.getsampwidth() != 2 or
-                wf.getcomptype() != "NONE" or wf.getframerate() != expected_framerate):
-            raise TypeError(
-                f"Audio file must be WAV format, mono, 16-bit, {expected_framerate} Hz. "
-                f"File provided has {wf.getnchannels()} channels, "
-                f"{wf.getsampwidth()*8}-bit, {wf.getframerate()} Hz."
-            )
-
-        recognizer = vosk.KaldiRecognizer(model, wf.getframerate())
-        
-        while True:
-            data = wf.readframes(4000)  # Read audio in chunks
-            if len(data) == 0:
-                break
-            recognizer.AcceptWaveform(data)
+        # Convert to the model's format (raises TypeError for unsupported WAVs)
+        audio = load_wav(file_path, out_rate=int(SAMPLE_RATE))
+
+        recognizer = vosk.KaldiRecognizer(model, int(SAMPLE_RATE))
+
+        chunk_size = 8000  # bytes, i.e. 4000 frames of 16-bit mono
+        for offset in range(0, len(audio), chunk_size):
+            recognizer.AcceptWaveform(audio[offset:offset + chunk_size])
 
         # Get the final recognized text
         result = json.loads(recognizer.FinalResult())
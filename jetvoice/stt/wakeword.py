@@ -0,0 +1,157 @@
+import json
+import os
+import sys
+import time
+
+import vosk
+
+from jetvoice.audio.frontend import load_wav
+from jetvoice.stt.stt import get_model, SAMPLE_RATE
+
+
+def _words(text: str) -> list:
+    return (text or "").lower().split()
+
+
+def contains_phrase(text: str, phrase: str) -> bool:
+    """
+    True if the words of `phrase` appear contiguously in `text`.
+    """
+    words, target = _words(text), _words(phrase)
+    if not target:
+        return False
+    n = len(target)
+    return any(words[i:i + n] == target for i in range(len(words) - n + 1))
+
+
+def strip_phrase(text: str, phrase: str) -> str:
+    """
+    Removes everything up to and including the first occurrence of the wake phrase.
+    """
+    words, target = _words(text), _words(phrase)
+    n = len(target)
+    for i in range(len(words) - n + 1):
+        if words[i:i + n] == target:
+            return " ".join(words[i + n:])
+    return text
+
+
+class WakeWordSpotter:
+    """
+    Cheap keyword spotter run on every frame before full transcription.
+
+    Uses the already loaded Vosk model with a grammar restricted to the wake
+    phrase and "[unk]", which decodes much faster than the full vocabulary and
+    maps everything else (TV audio, background chatter) to [unk].
+
+    Usage:
+        spotter = WakeWordSpotter("hey jetson", sample_rate=16000)
+        if spotter.accept(frame):
+            ...  # arm full transcription
+    """
+
+    def __init__(self, phrase: str, sample_rate: int = SAMPLE_RATE) -> None:
+        """
+        Args:
+            phrase: Wake phrase, e.g. "hey jetson". Words must exist in the model vocabulary.
+            sample_rate: Sample rate of the fed audio (Hz).
+        """
+        if not _words(phrase):
+            raise ValueError("wake phrase must not be empty")
+
+        self.phrase = " ".join(_words(phrase))
+        self.sample_rate = sample_rate
+        self.detections = 0
+        self._recognizer = vosk.KaldiRecognizer(
+            get_model(), sample_rate, json.dumps([self.phrase, "[unk]"])
+        )
+
+    def accept(self, frame: bytes) -> bool:
+        """
+        Feeds one frame of PCM16 mono audio.
+
+        Returns:
+            bool: True once when the wake phrase is heard; the spotter then resets.
+        """
+        try:
+            if self._recognizer.AcceptWaveform(frame):
+                text = json.loads(self._recognizer.Result()).get("text", "")
+            else:
+                text = json.loads(self._recognizer.PartialResult()).get("partial", "")
+        except Exception as e:
+            print(f"[WakeWord Error]: {e}")
+            return False
+
+        if contains_phrase(text, self.phrase):
+            self.detections += 1
+            self._recognizer.Reset()
+            return True
+        return False
+
+    def reset(self) -> None:
+        self._recognizer.Reset()
+
+
+def benchmark(paths, phrase: str, frame_duration_ms: int = 20) -> dict:
+    """
+    Runs the spotter over WAV files and measures its cost. Files are first
+    converted to mono 16-bit at SAMPLE_RATE by the audio front-end.
+
+    Feed recordings that do NOT contain the wake phrase (TV, chatter) to get
+    the false-accept rate; the CPU cost is reported as a real-time factor
+    (process CPU seconds per second of audio).
+
+    Returns:
+        dict with audio hours, detections, false accepts per hour and real-time factor.
+    """
+    audio_seconds = 0.0
+    cpu_seconds = 0.0
+    detections = 0
+
+    for path in paths:
+        rate = SAMPLE_RATE
+        audio = load_wav(path, out_rate=rate)
+
+        spotter = WakeWordSpotter(phrase, sample_rate=rate)
+        step = int(rate * frame_duration_ms / 1000) * 2
+
+        start = time.process_time()
+        for offset in range(0, len(audio) - step + 1, step):
+            spotter.accept(audio[offset:offset + step])
+        cpu_seconds += time.process_time() - start
+
+        audio_seconds += len(audio) / 2 / rate
+        detections += spotter.detections
+
+    hours = audio_seconds / 3600
+    return {
+        "files": len(paths),
+        "audio_hours": hours,
+        "detections": detections,
+        "false_accepts_per_hour": detections / hours if hours else 0.0,
+        "real_time_factor": cpu_seconds / audio_seconds if audio_seconds else 0.0,
+    }
+
+
+if __name__ == "__main__":
+    # This block runs when you execute: python -m jetvoice.stt.wakeword <wav or dir>...
+    if len(sys.argv) < 2:
+        print("Usage: python -m jetvoice.stt.wakeword <negative.wav | dir> ...")
+        sys.exit(1)
+
+    phrase = os.getenv("WAKE_WORD", "hey jetson")
+    files = []
+    for arg in sys.argv[1:]:
+        if os.path.isdir(arg):
+            files.extend(sorted(
+                os.path.join(arg, name) for name in os.listdir(arg) if name.endswith(".wav")
+            ))
+        else:
+            files.append(arg)
+
+    result = benchmark(files, phrase)
+    print(f"--- Wake word benchmark: '{phrase}' ---")
+    print(f"Files           : {result['files']} ({result['audio_hours'] * 60:.1f} min)")
+    print(f"Detections      : {result['detections']}")
+    print(f"False accepts/h : {result['false_accepts_per_hour']:.2f}")
+    print(f"Real-time factor: {result['real_time_factor']:.3f}")
@@ -0,0 +1,2 @@
+from .trace import Tracer
+from .trace import tracer
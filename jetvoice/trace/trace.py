@@ -0,0 +1,185 @@
+import itertools
+import json
+import os
+import signal
+import threading
+import time
+from typing import Optional
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    __slots__ = ("tracer", "name", "cat", "args", "start")
+
+    def __init__(self, tracer, name, cat, args) -> None:
+        self.tracer = tracer
+        self.name = name
+        self.cat = cat
+        self.args = args
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc):
+        self.tracer.complete(self.name, self.start, cat=self.cat, **self.args)
+        return False
+
+
+class Tracer:
+    """
+    Turn timeline recorder that writes Chrome / Perfetto trace JSON.
+
+    Disabled by default: every call returns after one attribute check and no
+    buffer is allocated. enable() preallocates a ring of `capacity` events;
+    once full, the oldest events are overwritten. Spans are stored as
+    complete ("X") events carrying their begin timestamp and duration, so a
+    wrapped ring never holds a begin without its end.
+
+    Usage:
+        from jetvoice.trace import tracer
+
+        tracer.enable()
+        with tracer.span("llm", cat="stage"):
+            ...
+        tracer.complete("tts.queue_wait", submitted_ns, cat="queue")
+        tracer.dump("/tmp/jetvoice-trace.json")  # open in ui.perfetto.dev
+    """
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self.capacity = 0
+        self._ring = []
+        self._counter = itertools.count()
+        self._written = 0
+        self._thread_names = {}
+        self._origin_ns = time.perf_counter_ns()
+
+    def enable(self, capacity: int = 65536) -> None:
+        if capacity < 1:
+            raise ValueError("capacity must be >= 1")
+        self.capacity = capacity
+        self._ring = [None] * capacity
+        self._counter = itertools.count()
+        self._written = 0
+        self._thread_names = {}
+        self._origin_ns = time.perf_counter_ns()
+        self.enabled = True
+
+    def disable(self) -> None:
+        self.enabled = False
+
+    def _record(self, phase: str, name: str, cat: str, ts_ns: int, dur_ns: int, args) -> None:
+        thread = threading.current_thread()
+        tid = thread.native_id
+        if tid not in self._thread_names:
+            self._thread_names[tid] = thread.name
+        # next() on itertools.count is atomic under the GIL, so writers never share a slot
+        i = next(self._counter)
+        self._ring[i % self.capacity] = (phase, name, cat, ts_ns, dur_ns, tid, args)
+        self._written = i + 1
+
+    def span(self, name: str, cat: str = "stage", **args):
+        """
+        Context manager timing the enclosed block.
+        """
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self, name, cat, args)
+
+    def complete(self, name: str, start_ns: int, end_ns: Optional[int] = None, cat: str = "stage", **args) -> None:
+        """
+        Records an interval measured by the caller (perf_counter_ns timestamps),
+        e.g. a queue wait that starts on one thread and ends on another.
+        """
+        if not self.enabled:
+            return
+        end_ns = end_ns if end_ns is not None else time.perf_counter_ns()
+        self._record("X", name, cat, start_ns, end_ns - start_ns, args)
+
+    def instant(self, name: str, cat: str = "event", **args) -> None:
+        if not self.enabled:
+            return
+        self._record("i", name, cat, time.perf_counter_ns(), 0, args)
+
+    def counter(self, name: str, value: float, cat: str = "counter") -> None:
+        if not self.enabled:
+            return
+        self._record("C", name, cat, time.perf_counter_ns(), 0, {name: value})
+
+    def events(self) -> list:
+        """
+        Recorded events, oldest first.
+        """
+        written = self._written
+        if written <= self.capacity:
+            return [e for e in self._ring[:written] if e is not None]
+        start = written % self.capacity
+        return [e for e in self._ring[start:] + self._ring[:start] if e is not None]
+
+    def to_chrome(self) -> dict:
+        pid = os.getpid()
+        trace_events = [
+            {"ph": "M", "name": "thread_name", "pid": pid, "tid": tid, "args": {"name": name}}
+            for tid, name in list(self._thread_names.items())
+        ]
+        for phase, name, cat, ts_ns, dur_ns, tid, args in self.events():
+            event = {
+                "ph": phase,
+                "name": name,
+                "cat": cat,
+                "ts": (ts_ns - self._origin_ns) / 1000,
+                "pid": pid,
+                "tid": tid,
+            }
+            if phase == "X":
+                event["dur"] = dur_ns / 1000
+            elif phase == "i":
+                event["s"] = "t"
+            if args:
+                event["args"] = args
+            trace_events.append(event)
+        return {"traceEvents": trace_events, "displayTimeUnit": "ms"}
+
+    def dump(self, path: str) -> str:
+        """
+        Writes the ring as Chrome trace JSON (chrome://tracing, ui.perfetto.dev).
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(self.to_chrome(), f, default=str)
+        return path
+
+    def dump_to_dir(self, directory: str) -> str:
+        return self.dump(os.path.join(directory, f"jetvoice-trace-{time.strftime('%Y%m%d-%H%M%S')}.json"))
+
+    def install_signal_handler(self, directory: str, signum: int = signal.SIGUSR1) -> None:
+        """
+        Dumps the trace into `directory` whenever the process receives `signum`
+        (kill -USR1 <pid>). Must be called from the main thread.
+        """
+        def handler(received, frame):
+            try:
+                print(f"[Trace] Wrote {self.dump_to_dir(directory)}")
+            except OSError as e:
+                print(f"[Trace Error]: {e}")
+
+        signal.signal(signum, handler)
+
+
+# Process-wide tracer; modules import this instance and call it unconditionally
+tracer = Tracer()
@@ -1 +1,2 @@
 from .tts import JetVoiceTTS
+from .worker import TTSWorker
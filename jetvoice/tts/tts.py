@@ -1,8 +1,12 @@
 import pyttsx3
 import os
 import subprocess
+import time
 from gtts import gTTS
 
+from jetvoice.audio.frontend import load_wav
+from jetvoice.trace import tracer
+
 class JetVoiceTTS:
     def __init__(self):
         """
@@ -10,6 +14,11 @@ class JetVoiceTTS:
         """
         self.engine = None
         self.use_online = os.getenv("TTS_ONLINE", "false").lower() == "true"
+
+        # Polled while a player subprocess runs; returning True stops playback
+        self.should_stop = None
+        # time.monotonic() when the last utterance started sounding (after download/startup)
+        self.audio_started_at = None
         
         # Only init pyttsx3 if we are NOT using online TTS (or as backup)
         if not self.use_online:
@@ -19,12 +28,30 @@ class JetVoiceTTS:
             except Exception as e:
                 print(f"[TTS] Offline engine init failed: {e}")
 
+    def set_online(self, online: bool):
+        """
+        Switches between gTTS and the offline engine at runtime.
+        The offline engine is initialized on first use if it wasn't at startup.
+        """
+        if not online and not self.engine:
+            try:
+                self.engine = pyttsx3.init()
+                self._configure_engine()
+            except Exception as e:
+                print(f"[TTS] Offline engine init failed: {e}")
+        self.use_online = online
+
     def _configure_engine(self):
         """
         Configures the offline engine properties.
         """
         if not self.engine: 
             return
+
+        try:
+            self.engine.connect('started-utterance', self._on_audio_start)
+        except Exception:
+            pass
         
         # 1. Rate (Slower = Less Robotic)
         # Defaulting to 125 makes espeak much clearer
@@ -61,6 +88,30 @@ class JetVoiceTTS:
         else:
             self._speak_offline(text)
 
+    def synthesize(self, text: str, sample_rate: int = 16000) -> bytes:
+        """
+        Renders the text offline to PCM16 mono at sample_rate instead of playing it.
+        Returns empty bytes if neither pyttsx3 nor espeak could render it.
+        """
+        if not text:
+            return b""
+
+        filepath = "/tmp/jetvoice_synth.wav"
+        if self.engine:
+            try:
+                self.engine.save_to_file(text, filepath)
+                self.engine.runAndWait()
+                return load_wav(filepath, out_rate=sample_rate)
+            except Exception as e:
+                print(f"[TTS] pyttsx3 synthesis error: {e}")
+
+        try:
+            subprocess.run(['espeak', '-s', '125', '-v', 'en-us', '-w', filepath, text], check=True)
+            return load_wav(filepath, out_rate=sample_rate)
+        except Exception as e:
+            print(f"[TTS] espeak synthesis failed: {e}")
+            return b""
+
     def _speak_online(self, text: str):
         """
         Uses Google TTS (Natural voice). Requires Internet and mpg123.
@@ -69,13 +120,12 @@ class JetVoiceTTS:
             # Generate MP3
             tts = gTTS(text, lang='en', tld='us')
             filepath = "/tmp/jetvoice_output.mp3"
-            tts.save(filepath)
+            with tracer.span("gtts.download", cat="net"):
+                tts.save(filepath)
             
             # Play MP3 using mpg123
-            subprocess.run(
-                ['mpg123', '-q', filepath], 
-                check=True
-            )
+            with tracer.span("mpg123", cat="subprocess"):
+                self._run_player(['mpg123', '-q', filepath])
         except Exception as e:
             print(f"[TTS] Online failed ({e}). Switching to offline fallback.")
             self._speak_offline(text)
@@ -87,7 +137,8 @@ class JetVoiceTTS:
         if self.engine:
             try:
                 self.engine.say(text)
-                self.engine.runAndWait()
+                with tracer.span("pyttsx3.runAndWait", cat="tts"):
+                    self.engine.runAndWait()
             except Exception as e:
                 print(f"[TTS] pyttsx3 error: {e}")
                 self._fallback_espeak(text)
@@ -99,10 +150,43 @@ class JetVoiceTTS:
         Direct shell call to espeak if Python bindings fail.
         """
         try:
-            subprocess.run(['espeak', '-s', '125', '-v', 'en-us', text], check=True)
+            with tracer.span("espeak", cat="subprocess"):
+                self._run_player(['espeak', '-s', '125', '-v', 'en-us', text])
         except Exception as e:
             print(f"[TTS] espeak command failed: {e}")
 
+    def _on_audio_start(self, *args):
+        self.audio_started_at = time.monotonic()
+
+    def _run_player(self, cmd) -> bool:
+        """
+        Runs an audio player to completion, or terminates it once should_stop() is True.
+
+        Returns:
+            True if playback finished, False if it was stopped.
+
+        Raises:
+            subprocess.CalledProcessError: If the player exits with an error.
+        """
+        if self.should_stop and self.should_stop():
+            return False
+
+        process = subprocess.Popen(cmd)
+        self._on_audio_start()
+        while True:
+            try:
+                returncode = process.wait(timeout=0.05)
+                break
+            except subprocess.TimeoutExpired:
+                if self.should_stop and self.should_stop():
+                    process.terminate()
+                    process.wait()
+                    return False
+
+        if returncode:
+            raise subprocess.CalledProcessError(returncode, cmd)
+        return True
+
 if __name__ == "__main__":
     # This block runs when you execute: python -m jetvoice.tts.tts
     
@@ -0,0 +1,258 @@
+import itertools
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+from jetvoice.trace import tracer
+from jetvoice.tts.tts import JetVoiceTTS
+
+
+PRIORITY_HIGH = 0
+PRIORITY_NORMAL = 10
+PRIORITY_LOW = 20
+
+PLAY = "play"
+SYNTHESIZE = "synthesize"
+
+DONE = "done"
+CANCELLED = "cancelled"
+FAILED = "failed"
+
+
+class CancelToken:
+    """
+    Shared flag for cancelling one or more jobs. A queued job is skipped; a job
+    being spoken by pyttsx3 is stopped at the next word boundary.
+    """
+
+    def __init__(self) -> None:
+        self._event = threading.Event()
+
+    def cancel(self) -> None:
+        self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+
+@dataclass
+class TTSEvent:
+    """
+    Emitted once per job when it leaves the worker (played, synthesized, cancelled or failed).
+    """
+    job_id: int
+    mode: str
+    status: str
+    pcm: Optional[bytes] = None
+    elapsed_s: float = 0.0
+
+
+class TTSJob:
+    def __init__(self, job_id: int, text: str, mode: str, priority: int, token: CancelToken) -> None:
+        self.id = job_id
+        self.text = text
+        self.mode = mode
+        self.priority = priority
+        self.token = token
+        self.status: Optional[str] = None
+        self.pcm: Optional[bytes] = None
+        self.elapsed_s = 0.0
+        # Seconds from the audio starting to the end of playback; None if not measured
+        self.audio_s: Optional[float] = None
+        self.submitted_ns = time.perf_counter_ns()
+        self._finished = threading.Event()
+
+    @property
+    def done(self) -> bool:
+        return self._finished.is_set()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        return self._finished.wait(timeout)
+
+    def cancel(self) -> None:
+        self.token.cancel()
+
+
+class TTSWorker:
+    """
+    Long-lived thread that owns the TTS engine and works through a priority queue.
+
+    pyttsx3 must only be driven from the thread that created it, so the engine
+    is created once on the worker thread and never touched elsewhere. Callers
+    submit() jobs and get a TTSJob back straight away; they can poll job.done,
+    wait() on it, or receive a TTSEvent through `on_event` (called on the
+    worker thread). Lower priority values run first, equal priorities in
+    submission order.
+
+    Usage:
+        worker = TTSWorker()
+        job = worker.submit("Hello", priority=PRIORITY_HIGH)
+        ...
+        if job.done:
+            ...
+        pcm = worker.synthesize("Hello")  # blocking, PCM16 mono at sample_rate
+        worker.close()
+    """
+
+    def __init__(
+        self,
+        make_tts: Callable[[], object] = JetVoiceTTS,
+        sample_rate: int = 16000,
+        on_event: Optional[Callable[[TTSEvent], None]] = None,
+    ) -> None:
+        self.sample_rate = sample_rate
+        self.on_event = on_event
+
+        self._make_tts = make_tts
+        self._tts = None
+        self._jobs = queue.PriorityQueue()
+        self._seq = itertools.count()
+        self._ids = itertools.count(1)
+        self._pending = set()
+        self._lock = threading.Lock()
+        self._current: Optional[TTSJob] = None
+        self._hooked_engine = None
+        self._online: Optional[bool] = None
+        self._ready = threading.Event()
+        self._closed = False
+
+        self._thread = threading.Thread(target=self._run, name="jetvoice-tts", daemon=True)
+        self._thread.start()
+        self._ready.wait()
+
+    @property
+    def use_online(self) -> bool:
+        if self._online is not None:
+            return self._online
+        return getattr(self._tts, "use_online", False)
+
+    def set_online(self, online: bool) -> None:
+        """
+        Switches the engine mode; applied on the worker thread before the next job.
+        """
+        self._online = online
+
+    def submit(
+        self,
+        text: str,
+        priority: int = PRIORITY_NORMAL,
+        token: Optional[CancelToken] = None,
+        mode: str = PLAY,
+    ) -> TTSJob:
+        if mode not in (PLAY, SYNTHESIZE):
+            raise ValueError(f"mode must be '{PLAY}' or '{SYNTHESIZE}'")
+        if self._closed:
+            raise RuntimeError("TTS worker is closed")
+
+        job = TTSJob(next(self._ids), text, mode, priority, token or CancelToken())
+        with self._lock:
+            self._pending.add(job)
+        self._jobs.put((priority, next(self._seq), job))
+        return job
+
+    def speak(self, text: str, priority: int = PRIORITY_NORMAL) -> None:
+        """
+        Blocking drop-in for JetVoiceTTS.speak(), for callers that own a thread anyway.
+        """
+        self.submit(text, priority).wait()
+
+    def synthesize(self, text: str, priority: int = PRIORITY_NORMAL) -> bytes:
+        """
+        Blocking; returns PCM16 mono at `sample_rate` (empty if synthesis failed).
+        """
+        job = self.submit(text, priority, mode=SYNTHESIZE)
+        job.wait()
+        return job.pcm or b""
+
+    def cancel_all(self) -> None:
+        """
+        Cancels every queued job and the one being spoken.
+        """
+        with self._lock:
+            for job in self._pending:
+                job.cancel()
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """
+        Cancels outstanding jobs and stops the worker thread.
+        """
+        self._closed = True
+        self.cancel_all()
+        self._jobs.put((float("inf"), next(self._seq), None))
+        self._thread.join(timeout)
+
+    def _on_word(self, *args) -> None:
+        # pyttsx3 callback, runs on the worker thread inside runAndWait()
+        if self._should_stop():
+            self._tts.engine.stop()
+
+    def _should_stop(self) -> bool:
+        job = self._current
+        return job is not None and job.token.cancelled
+
+    def _hook_engine(self) -> None:
+        # Engines are created lazily (set_online(False)) or replaced, so hook each new one
+        engine = getattr(self._tts, "engine", None)
+        if engine is not None and engine is not self._hooked_engine:
+            engine.connect("started-word", self._on_word)
+            self._hooked_engine = engine
+
+    def _execute(self, job: TTSJob) -> str:
+        self._current = job
+        try:
+            if self._online is not None and self._online != self._tts.use_online:
+                self._tts.set_online(self._online)
+                self._hook_engine()
+            if job.mode == SYNTHESIZE:
+                job.pcm = self._tts.synthesize(job.text, sample_rate=self.sample_rate)
+            else:
+                self._tts.audio_started_at = None
+                self._tts.speak(job.text)
+                started = getattr(self._tts, "audio_started_at", None)
+                if started is not None:
+                    job.audio_s = time.monotonic() - started
+            return CANCELLED if job.token.cancelled else DONE
+        except Exception as e:
+            print(f"[TTS Worker] Job {job.id} failed: {e}")
+            return FAILED
+        finally:
+            self._current = None
+
+    def _run(self) -> None:
+        try:
+            # Created here, once, so the engine lives on this thread only
+            self._tts = self._make_tts()
+            # Lets the mpg123/espeak players be terminated on cancel
+            self._tts.should_stop = self._should_stop
+            self._hook_engine()
+        except Exception as e:
+            print(f"[TTS Worker] Engine setup failed: {e}")
+        finally:
+            self._ready.set()
+
+        while True:
+            _, _, job = self._jobs.get()
+            if job is None:
+                return
+
+            start = time.monotonic()
+            status = CANCELLED
+            tracer.complete("tts.queue_wait", job.submitted_ns, cat="queue", job=job.id)
+            if not job.token.cancelled:
+                with tracer.span("tts.job", cat="tts", job=job.id, mode=job.mode):
+                    status = self._execute(job)
+
+            job.status = status
+            job.elapsed_s = time.monotonic() - start
+            with self._lock:
+                self._pending.discard(job)
+            job._finished.set()
+
+            if self.on_event:
+                try:
+                    self.on_event(TTSEvent(job.id, job.mode, status, job.pcm, job.elapsed_s))
+                except Exception as e:
+                    print(f"[TTS Worker] Event callback failed: {e}")
@@ -1 +1,5 @@
 from .vad import WebRTCVAD
+from .vad import VADBackend
+from .vad import create_vad
+from .endpoint import AdaptiveEndpointer
+from .segmenter import Segmenter
@@ -0,0 +1,99 @@
+import json
+import os
+import sys
+import time
+
+from jetvoice.audio.frontend import load_wav
+from jetvoice.vad.vad import create_vad
+
+
+def load_labels(wav_path: str):
+    """
+    Reads the sidecar label file next to a WAV: <name>.json containing
+    {"speech": [[start_s, end_s], ...]}.
+    """
+    with open(os.path.splitext(wav_path)[0] + ".json") as f:
+        return [tuple(seg) for seg in json.load(f)["speech"]]
+
+
+def frame_labels(segments, n_frames: int, frame_duration_ms: int):
+    """
+    Ground-truth speech flag per frame (frame centre inside a labeled segment).
+    """
+    labels = []
+    for i in range(n_frames):
+        centre = (i + 0.5) * frame_duration_ms / 1000
+        labels.append(any(start <= centre < end for start, end in segments))
+    return labels
+
+
+def score(predicted, truth) -> dict:
+    """
+    Frame-level precision/recall/F1 of speech detection.
+    """
+    tp = sum(1 for p, t in zip(predicted, truth) if p and t)
+    fp = sum(1 for p, t in zip(predicted, truth) if p and not t)
+    fn = sum(1 for p, t in zip(predicted, truth) if not p and t)
+
+    precision = tp / (tp + fp) if tp + fp else 0.0
+    recall = tp / (tp + fn) if tp + fn else 0.0
+    f1 = 2 * precision * recall / (precision + recall) if precision + recall else 0.0
+    return {"tp": tp, "fp": fp, "fn": fn, "precision": precision, "recall": recall, "f1": f1}
+
+
+def compare(backends: dict, wav_paths, sample_rate: int = 16000) -> dict:
+    """
+    Runs every backend over the labeled WAVs.
+
+    Args:
+        backends: Mapping of display name -> VADBackend.
+        wav_paths: WAV files, each with a <name>.json label sidecar.
+
+    Returns:
+        dict of name -> precision/recall/F1 plus real-time factor (CPU s per audio s).
+    """
+    results = {}
+    for name, vad in backends.items():
+        predicted, truth = [], []
+        cpu_seconds = 0.0
+        audio_seconds = 0.0
+
+        for path in wav_paths:
+            audio = load_wav(path, out_rate=sample_rate)
+            frames = list(vad._iter_frames(audio))
+            vad.reset()
+
+            start = time.process_time()
+            predicted.extend(vad.classify_frames(frames))
+            cpu_seconds += time.process_time() - start
+
+            truth.extend(frame_labels(load_labels(path), len(frames), vad.frame_duration_ms))
+            audio_seconds += len(audio) / 2 / sample_rate
+
+        result = score(predicted, truth)
+        result["real_time_factor"] = cpu_seconds / audio_seconds if audio_seconds else 0.0
+        results[name] = result
+    return results
+
+
+if __name__ == "__main__":
+    # This block runs when you execute: python -m jetvoice.vad.compare <labeled_dir> [model.onnx]
+    if len(sys.argv) < 2:
+        print("Usage: python -m jetvoice.vad.compare <labeled_wav_dir> [model.onnx]")
+        sys.exit(1)
+
+    directory = sys.argv[1]
+    wavs = sorted(
+        os.path.join(directory, name) for name in os.listdir(directory)
+        if name.endswith(".wav") and os.path.exists(os.path.join(directory, name[:-4] + ".json"))
+    )
+
+    backends = {f"webrtc-{a}": create_vad("webrtc", aggressiveness=a) for a in range(4)}
+    model_path = sys.argv[2] if len(sys.argv) > 2 else os.getenv("VAD_ONNX_MODEL")
+    if model_path:
+        backends["onnx"] = create_vad("onnx", model_path=model_path)
+
+    print(f"--- VAD comparison on {len(wavs)} labeled files ---")
+    for name, r in compare(backends, wavs).items():
+        print(f"{name:>10}: precision={r['precision']:.3f} recall={r['recall']:.3f} "
+              f"f1={r['f1']:.3f} rtf={r['real_time_factor']:.4f}")
@@ -0,0 +1,326 @@
+import math
+import sys
+from collections import deque
+from dataclasses import dataclass
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+
+# Words that rarely end a spoken request; a partial ending in one of them
+# usually means the speaker is mid-sentence and just pausing.
+TRAILING_WORDS = frozenset({
+    "a", "an", "the", "and", "or", "but", "so", "because", "if", "to", "of",
+    "in", "on", "at", "for", "with", "from", "about", "my", "your", "is",
+    "are", "was", "what", "how", "when", "where", "why", "which", "who",
+    "um", "uh", "er", "like", "then", "than", "that", "can", "could", "would",
+})
+
+
+def frame_rms(frame: bytes) -> float:
+    """
+    Root-mean-square level of a PCM16 mono frame.
+    """
+    samples = np.frombuffer(frame, dtype="<i2")
+    if not samples.size:
+        return 0.0
+    samples = samples.astype(np.float64)
+    return math.sqrt(float(np.dot(samples, samples)) / samples.size)
+
+
+@dataclass
+class EndpointDecision:
+    """
+    Why an utterance was closed; logged by the main loop for later comparison.
+    """
+    silence_frames: int
+    timeout_frames: int
+    pause_frames: Optional[int]
+    snr_db: Optional[float]
+    partial_complete: Optional[bool]
+    frame_duration_ms: int
+
+    @property
+    def delay_ms(self) -> int:
+        return self.silence_frames * self.frame_duration_ms
+
+    def __str__(self) -> str:
+        snr = f"{self.snr_db:.1f}dB" if self.snr_db is not None else "n/a"
+        return (
+            f"end after {self.silence_frames} silent frames ({self.delay_ms} ms), "
+            f"timeout={self.timeout_frames}, pause_p={self.pause_frames}, "
+            f"snr={snr}, partial_complete={self.partial_complete}"
+        )
+
+
+class AdaptiveEndpointer:
+    """
+    Picks the end-of-utterance silence timeout per turn instead of a fixed count.
+
+    Signals:
+        - Recent intra-utterance pause lengths (a percentile of them sets the base).
+        - Background noise level (low SNR makes the VAD flap, so wait longer).
+        - Whether the partial transcript looks syntactically complete.
+
+    Usage:
+        ep = AdaptiveEndpointer(frame_duration_ms=20, base_silence_frames=5)
+        ep.update(frame, is_speech, in_speech)
+        decision = ep.decide(silence_streak, partial)
+        if decision:
+            ...  # close the utterance
+    """
+
+    def __init__(
+        self,
+        frame_duration_ms: int = 20,
+        base_silence_frames: int = 5,
+        min_silence_frames: int = 3,
+        max_silence_frames: int = 40,
+        history: int = 50,
+        pause_percentile: float = 0.9,
+        margin_frames: int = 2,
+        min_pauses: int = 5,
+        low_snr_db: float = 10.0,
+    ) -> None:
+        """
+        Args:
+            frame_duration_ms: Frame length in milliseconds.
+            base_silence_frames: Timeout used until enough pauses have been seen.
+            min_silence_frames: Lower bound on the adaptive timeout.
+            max_silence_frames: Upper bound on the adaptive timeout.
+            history: Number of recent pauses kept for the distribution.
+            pause_percentile: Percentile of recent pauses the timeout must exceed (0-1).
+            margin_frames: Frames added on top of the pause percentile.
+            min_pauses: Pauses required before the distribution is trusted.
+            low_snr_db: Below this speech-to-noise ratio the timeout is extended.
+        """
+        if not 0 < min_silence_frames <= max_silence_frames:
+            raise ValueError("need 0 < min_silence_frames <= max_silence_frames")
+        if not 0.0 < pause_percentile <= 1.0:
+            raise ValueError("pause_percentile must be in (0, 1]")
+
+        self.frame_duration_ms = frame_duration_ms
+        self.base_silence_frames = base_silence_frames
+        self.min_silence_frames = min_silence_frames
+        self.max_silence_frames = max_silence_frames
+        self.pause_percentile = pause_percentile
+        self.margin_frames = margin_frames
+        self.min_pauses = min_pauses
+        self.low_snr_db = low_snr_db
+
+        self._pauses = deque(maxlen=history)
+        self._silence_run = 0
+        self._noise_rms: Optional[float] = None
+        self._speech_rms: Optional[float] = None
+
+    @staticmethod
+    def _ema(current: Optional[float], value: float, alpha: float = 0.05) -> float:
+        return value if current is None else current + alpha * (value - current)
+
+    def update(self, frame: bytes, is_speech: bool, in_speech: bool) -> None:
+        """
+        Feeds one VAD-classified frame.
+
+        Args:
+            frame: Raw PCM16 mono frame.
+            is_speech: VAD decision for this frame.
+            in_speech: True if the state machine is currently capturing.
+        """
+        if is_speech:
+            self._speech_rms = self._ema(self._speech_rms, frame_rms(frame))
+            # A silence run that speech interrupted is a pause, not an end
+            if in_speech and self._silence_run:
+                self._pauses.append(self._silence_run)
+            self._silence_run = 0
+        else:
+            if in_speech:
+                self._silence_run += 1
+            else:
+                self._noise_rms = self._ema(self._noise_rms, frame_rms(frame))
+
+    def reset_utterance(self) -> None:
+        """
+        Forgets the trailing silence run once an utterance has been closed.
+        """
+        self._silence_run = 0
+
+    def pause_frames(self) -> Optional[int]:
+        """
+        Percentile of recent pauses, or None until enough have been observed.
+        """
+        if len(self._pauses) < self.min_pauses:
+            return None
+        ordered = sorted(self._pauses)
+        index = min(len(ordered) - 1, int(math.ceil(self.pause_percentile * len(ordered))) - 1)
+        return ordered[max(0, index)]
+
+    def snr_db(self) -> Optional[float]:
+        if not self._speech_rms or not self._noise_rms:
+            return None
+        return 20.0 * math.log10(self._speech_rms / self._noise_rms)
+
+    @staticmethod
+    def partial_complete(partial: str) -> Optional[bool]:
+        """
+        Rough syntactic check: None if there is no partial to judge.
+        """
+        words = (partial or "").lower().split()
+        if not words:
+            return None
+        return words[-1] not in TRAILING_WORDS
+
+    def timeout_frames(self, partial: str = "") -> int:
+        """
+        Silence frames required to close the utterance right now.
+        """
+        pause = self.pause_frames()
+        timeout = float(self.base_silence_frames if pause is None else pause + self.margin_frames)
+
+        snr = self.snr_db()
+        if snr is not None and snr < self.low_snr_db:
+            timeout *= 1.25
+
+        complete = self.partial_complete(partial)
+        if complete is False:
+            timeout *= 1.5
+        elif complete is True and len(partial.split()) >= 3:
+            timeout *= 0.75
+
+        return max(self.min_silence_frames, min(self.max_silence_frames, int(round(timeout))))
+
+    def decide(self, silence_frames: int, partial: str = "") -> Optional[EndpointDecision]:
+        """
+        Returns a decision if the utterance should end after `silence_frames`
+        trailing silent frames, otherwise None.
+        """
+        timeout = self.timeout_frames(partial)
+        if silence_frames < timeout:
+            return None
+
+        self.reset_utterance()
+        return EndpointDecision(
+            silence_frames=silence_frames,
+            timeout_frames=timeout,
+            pause_frames=self.pause_frames(),
+            snr_db=self.snr_db(),
+            partial_complete=self.partial_complete(partial),
+            frame_duration_ms=self.frame_duration_ms,
+        )
+
+
+def partials_from_words(words, n_frames: int, frame_duration_ms: int = 20) -> List[str]:
+    """
+    Per-frame partial transcripts from a recorded transcript's timed words
+    (e.g. stt.Transcript.words): each frame sees the words that ended by then.
+    """
+    partials = []
+    heard = []
+    pending = sorted(words, key=lambda w: w.end)
+    for i in range(n_frames):
+        now = (i + 1) * frame_duration_ms / 1000.0
+        while pending and pending[0].end <= now:
+            heard.append(pending.pop(0).word)
+        partials.append(" ".join(heard))
+    return partials
+
+
+def replay_endpointing(
+    frames,
+    decisions,
+    n_streak: int,
+    n_silence: int,
+    endpointer: Optional[AdaptiveEndpointer] = None,
+    frame_duration_ms: int = 20,
+    partials: Optional[Sequence[str]] = None,
+) -> dict:
+    """
+    Runs the main-loop state machine over pre-classified frames.
+
+    With `endpointer` None the fixed `n_silence` policy is used, which makes
+    it possible to compare both policies on the same recording. `partials`
+    gives the partial transcript after each frame (see partials_from_words),
+    so the adaptive policy can judge completeness as it does live; words from
+    earlier utterances are dropped, as the live streamer resets per utterance.
+
+    Returns:
+        dict with the number of utterances and their end-of-speech delays (ms).
+    """
+    in_speech = False
+    speech_streak = 0
+    silence_streak = 0
+    delays = []
+    heard_before = ""
+
+    for i, (frame, has_speech) in enumerate(zip(frames, decisions)):
+        if endpointer:
+            endpointer.update(frame, has_speech, in_speech)
+
+        if has_speech:
+            speech_streak += 1
+            silence_streak = 0
+            if not in_speech and speech_streak >= n_streak:
+                in_speech = True
+        elif in_speech:
+            silence_streak += 1
+            speech_streak = 0
+            if endpointer:
+                partial = ""
+                if partials is not None:
+                    partial = partials[i]
+                    if partial.startswith(heard_before):
+                        partial = partial[len(heard_before):].strip()
+                ended = endpointer.decide(silence_streak, partial) is not None
+            else:
+                ended = silence_streak >= n_silence
+            if ended:
+                if partials is not None:
+                    heard_before = partials[i]
+                delays.append(silence_streak * frame_duration_ms)
+                in_speech = False
+                silence_streak = 0
+        else:
+            speech_streak = 0
+
+    return {
+        "utterances": len(delays),
+        "mean_delay_ms": sum(delays) / len(delays) if delays else 0.0,
+        "delays_ms": delays,
+    }
+
+
+if __name__ == "__main__":
+    # This block runs when you execute: python -m jetvoice.vad.endpoint file.wav [n_silence] [--partials]
+    from jetvoice.vad.vad import WebRTCVAD
+
+    args = [a for a in sys.argv[1:] if a != "--partials"]
+    if not args:
+        print("Usage: python -m jetvoice.vad.endpoint <file.wav> [n_silence] [--partials]")
+        sys.exit(1)
+
+    n_silence = int(args[1]) if len(args) > 1 else 5
+
+    from jetvoice.audio.frontend import load_wav
+
+    audio = load_wav(args[0], out_rate=16000)
+    vad = WebRTCVAD(sample_rate=16000, frame_duration_ms=20, aggressiveness=2)
+
+    frames = list(vad._iter_frames(audio))
+    decisions = vad.classify_frames(frames)
+
+    partials = None
+    if "--partials" in sys.argv:
+        # Word timings from one Vosk pass stand in for the live partials
+        from jetvoice.stt.stt import transcribe_result
+        partials = partials_from_words(transcribe_result(audio).words, len(frames))
+
+    fixed = replay_endpointing(frames, decisions, n_streak=3, n_silence=n_silence)
+    adaptive = replay_endpointing(
+        frames, decisions, n_streak=3, n_silence=n_silence,
+        endpointer=AdaptiveEndpointer(base_silence_frames=n_silence),
+        partials=partials,
+    )
+
+    print(f"--- Endpointing replay: {args[0]} ---")
+    for name, result in (("fixed", fixed), ("adaptive", adaptive)):
+        print(f"{name:>8}: utterances={result['utterances']}, "
+              f"mean end-of-speech delay={result['mean_delay_ms']:.0f} ms")
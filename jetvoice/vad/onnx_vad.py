@@ -0,0 +1,126 @@
+from typing import List
+
+import numpy as np
+
+try:
+    import onnxruntime as ort
+except ImportError:  # optional dependency, only needed for VAD_BACKEND=onnx
+    ort = None
+
+from jetvoice.vad.vad import VADBackend
+
+
+# Silero VAD v5 window and context sizes (samples) per supported rate
+SILERO_WINDOWS = {16000: (512, 64), 8000: (256, 32)}
+SILERO_STATE_SHAPE = (2, 1, 128)
+
+
+class OnnxVAD(VADBackend):
+    """
+    CPU neural VAD running the Silero VAD (v5) ONNX model.
+
+    Silero scores fixed windows (512 samples at 16 kHz, 32 ms), each prefixed
+    with the last 64 samples of the previous one, and carries a recurrent
+    `state` from window to window, so windows must run in order. Pipeline
+    frames (e.g. 20 ms) are buffered into windows; each frame gets the
+    probability of the latest window that ended within it or before it.
+    classify_frames() runs every window the batch completes in one pass,
+    which saves per-frame Python overhead. The model itself still runs one
+    window per session.run(), because its batch axis means independent
+    streams, not time.
+
+    State persists across classify_frames() calls; call reset() between
+    unrelated recordings or after a capture resync.
+
+    Usage:
+        vad = OnnxVAD("models/silero_vad.onnx", sample_rate=16000, frame_duration_ms=20)
+        flags = vad.classify_frames(frames)
+    """
+
+    def __init__(
+        self,
+        model_path: str,
+        sample_rate: int = 16000,
+        frame_duration_ms: int = 20,
+        threshold: float = 0.5,
+        session=None,
+    ) -> None:
+        """
+        Args:
+            model_path: Path to the Silero VAD v5 ONNX file (silero_vad.onnx).
+            sample_rate: 16000 or 8000, the rates Silero supports.
+            frame_duration_ms: Pipeline frame length in milliseconds.
+            threshold: Speech probability at or above which a frame counts as speech.
+            session: Pre-built inference session (anything with run()).
+        """
+        if sample_rate not in SILERO_WINDOWS:
+            raise ValueError("the onnx VAD backend supports sample_rate 8000 or 16000")
+        super().__init__(sample_rate, frame_duration_ms)
+        if not 0.0 < threshold < 1.0:
+            raise ValueError("threshold must be between 0 and 1")
+
+        if session is None:
+            if ort is None:
+                raise RuntimeError(
+                    "onnxruntime is required for the onnx VAD backend (pip install onnxruntime)"
+                )
+            options = ort.SessionOptions()
+            # One thread keeps the VAD from competing with Vosk on the Nano's 4 cores
+            options.intra_op_num_threads = 1
+            options.inter_op_num_threads = 1
+            session = ort.InferenceSession(
+                model_path, sess_options=options, providers=["CPUExecutionProvider"]
+            )
+
+        self.model_path = model_path
+        self.threshold = threshold
+        self.window, self.context_size = SILERO_WINDOWS[sample_rate]
+        self._session = session
+        self._sr = np.array(sample_rate, dtype=np.int64)
+        self.reset()
+
+    def reset(self) -> None:
+        self._state = np.zeros(SILERO_STATE_SHAPE, dtype=np.float32)
+        self._context = np.zeros(self.context_size, dtype=np.float32)
+        self._pending = np.zeros(0, dtype=np.float32)
+        self._prob = 0.0
+
+    def _run_window(self, window: np.ndarray) -> float:
+        x = np.concatenate((self._context, window))[None, :]
+        out, self._state = self._session.run(
+            None, {"input": x, "state": self._state, "sr": self._sr}
+        )
+        self._context = window[-self.context_size:]
+        return float(np.asarray(out).reshape(-1)[0])
+
+    def speech_probabilities(self, frames: List[bytes]) -> np.ndarray:
+        """
+        Returns one speech probability per frame.
+        """
+        if not frames:
+            return np.zeros(0, dtype=np.float32)
+
+        samples = np.frombuffer(b"".join(frames), dtype="<i2").astype(np.float32) / 32768.0
+        x = np.concatenate((self._pending, samples))
+        n_windows = len(x) // self.window
+        window_probs = np.array(
+            [self._run_window(x[i * self.window:(i + 1) * self.window]) for i in range(n_windows)],
+            dtype=np.float32,
+        )
+        carried = self._prob
+        if n_windows:
+            self._prob = float(window_probs[-1])
+
+        # Windows completed by the end of each frame
+        frame_samples = self.frame_size_bytes // 2
+        ends = len(self._pending) + frame_samples * np.arange(1, len(frames) + 1)
+        done = ends // self.window
+        self._pending = x[n_windows * self.window:]
+
+        probs = np.full(len(frames), carried, dtype=np.float32)
+        ready = done > 0
+        probs[ready] = window_probs[done[ready] - 1]
+        return probs
+
+    def classify_frames(self, frames: List[bytes]) -> List[bool]:
+        return [bool(p >= self.threshold) for p in self.speech_probabilities(frames)]
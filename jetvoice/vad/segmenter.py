@@ -0,0 +1,52 @@
+from typing import Optional
+
+
+class Segmenter:
+    """
+    Per-stream VAD state machine (listening -> capturing -> utterance),
+    the same policy as the single-stream loop in main.main. Used by the
+    multi-stream runner and replayed offline by the VAD parameter sweep.
+
+    Usage:
+        seg = Segmenter(n_streak=3, n_silence=5)
+        utterance = seg.feed(frame, has_speech)
+        if utterance:
+            ...
+    """
+
+    def __init__(self, n_streak: int = 3, n_silence: int = 5) -> None:
+        self.n_streak = n_streak
+        self.n_silence = n_silence
+        self.reset()
+
+    def reset(self) -> None:
+        self.in_speech = False
+        self._speech_streak = 0
+        self._silence_streak = 0
+        self._segment = bytearray()
+
+    def feed(self, frame: bytes, has_speech: bool) -> Optional[bytes]:
+        """
+        Returns the utterance bytes once it ends, otherwise None.
+        """
+        if has_speech:
+            self._segment.extend(frame)
+            self._speech_streak += 1
+            self._silence_streak = 0
+            if not self.in_speech and self._speech_streak >= self.n_streak:
+                self.in_speech = True
+            return None
+
+        if not self.in_speech:
+            self._speech_streak = 0
+            return None
+
+        self._segment.extend(frame)
+        self._silence_streak += 1
+        self._speech_streak = 0
+        if self._silence_streak < self.n_silence:
+            return None
+
+        utterance = bytes(self._segment)
+        self.reset()
+        return utterance
@@ -0,0 +1,307 @@
+import hashlib
+import itertools
+import json
+import os
+import struct
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple
+
+from jetvoice.audio.frontend import load_wav
+from jetvoice.vad.compare import load_labels
+from jetvoice.vad.segmenter import Segmenter
+from jetvoice.vad.vad import WebRTCVAD
+
+
+# Stand-in frame carrying a frame index through the Segmenter
+_FRAME_INDEX = struct.Struct("<I")
+
+def load_reference_text(wav_path: str) -> Optional[str]:
+    """
+    Reference transcript from the label sidecar's optional "text" key, for WER.
+    """
+    with open(os.path.splitext(wav_path)[0] + ".json") as f:
+        return json.load(f).get("text")
+
+
+def word_errors(reference: str, hypothesis: str) -> Tuple[int, int]:
+    """
+    Word-level edit distance. Returns (errors, reference word count).
+    """
+    ref = reference.lower().split()
+    hyp = hypothesis.lower().split()
+    row = list(range(len(hyp) + 1))
+    for i, r in enumerate(ref, 1):
+        prev, row[0] = row[0], i
+        for j, h in enumerate(hyp, 1):
+            prev, row[j] = row[j], min(row[j] + 1, row[j - 1] + 1, prev + (r != h))
+    return row[-1], len(ref)
+
+
+def vad_decisions(
+    wav_path: str,
+    aggressiveness: int,
+    sample_rate: int = 16000,
+    frame_duration_ms: int = 20,
+    cache_dir: Optional[str] = None,
+) -> List[bool]:
+    """
+    Per-frame WebRTC VAD decisions for a file.
+
+    With `cache_dir`, decisions are stored per (file, aggressiveness, frame
+    size) and reused until the WAV changes, so sweeping only the streak and
+    silence counts never re-runs the VAD. Files are told apart by their
+    absolute path, so same-named WAVs in different directories don't collide.
+    """
+    cache_path = None
+    mtime_ns = os.stat(wav_path).st_mtime_ns
+    if cache_dir:
+        name = os.path.basename(wav_path)
+        digest = hashlib.sha1(os.path.abspath(wav_path).encode()).hexdigest()[:12]
+        cache_path = os.path.join(
+            cache_dir, f"{name}.{digest}.a{aggressiveness}.{sample_rate}hz.{frame_duration_ms}ms.vad"
+        )
+        try:
+            with open(cache_path) as f:
+                cached = json.load(f)
+            if cached["mtime_ns"] == mtime_ns:
+                return [flag == "1" for flag in cached["decisions"]]
+        except (OSError, ValueError, KeyError):
+            pass
+
+    vad = WebRTCVAD(sample_rate=sample_rate, frame_duration_ms=frame_duration_ms, aggressiveness=aggressiveness)
+    audio = load_wav(wav_path, out_rate=sample_rate)
+    decisions = vad.classify_frames(list(vad._iter_frames(audio)))
+
+    if cache_path:
+        os.makedirs(cache_dir, exist_ok=True)
+        with open(cache_path, "w") as f:
+            json.dump({"mtime_ns": mtime_ns, "decisions": "".join("1" if d else "0" for d in decisions)}, f)
+    return decisions
+
+
+def replay_segments(decisions: List[bool], n_streak: int, n_silence: int) -> List[Tuple[int, ...]]:
+    """
+    Drives the live Segmenter (listening -> capturing -> transcribing) over
+    per-frame decisions, feeding each frame index as a 4-byte stand-in frame.
+
+    Returns:
+        One tuple of frame indices per emitted utterance. Like the live loop,
+        speech frames heard before the streak threshold stay in the segment,
+        and an utterance still open at the end of the file is not emitted.
+    """
+    segmenter = Segmenter(n_streak, n_silence)
+    utterances = []
+    for i, has_speech in enumerate(decisions):
+        utterance = segmenter.feed(_FRAME_INDEX.pack(i), has_speech)
+        if utterance:
+            utterances.append(tuple(index for (index,) in _FRAME_INDEX.iter_unpack(utterance)))
+    return utterances
+
+
+def _new_totals() -> dict:
+    return {
+        "files": 0,
+        "audio_s": 0.0,
+        "utterances": 0,
+        "false_triggers": 0,
+        "labeled": 0,
+        "missed": 0,
+        "clipped": 0,
+        "delays_s": [],
+        "word_errors": 0,
+        "ref_words": 0,
+    }
+
+
+def _score_file(
+    utterances: List[Tuple[int, ...]],
+    segments,
+    frame_s: float,
+    onset_tolerance_s: float,
+    totals: dict,
+) -> None:
+    """
+    Adds one file's event-level metrics to `totals`.
+    """
+    spans = [(u[0] * frame_s, (u[-1] + 1) * frame_s) for u in utterances]
+    totals["utterances"] += len(spans)
+    totals["labeled"] += len(segments)
+
+    for start, end in spans:
+        if not any(s < end and start < e for s, e in segments):
+            totals["false_triggers"] += 1
+
+    for s, e in segments:
+        overlapping = [(start, end) for start, end in spans if s < end and start < e]
+        if not overlapping:
+            totals["missed"] += 1
+            continue
+        if overlapping[0][0] > s + onset_tolerance_s:
+            totals["clipped"] += 1
+        # Time from the end of speech to the endpoint decision
+        totals["delays_s"].append(overlapping[-1][1] - e)
+
+
+def _replay_file(
+    wav_path: str,
+    aggressiveness: int,
+    pairs: List[Tuple[int, int]],
+    sample_rate: int,
+    frame_duration_ms: int,
+    cache_dir: Optional[str],
+    onset_tolerance_s: float,
+    transcriber: Optional[Callable[[bytes, int], str]],
+    stt: bool,
+) -> Dict[Tuple[int, int, int], dict]:
+    """
+    Process-pool task: one file at one aggressiveness, every (streak, silence) pair.
+    The VAD runs once and identical utterances are transcribed once.
+    """
+    decisions = vad_decisions(wav_path, aggressiveness, sample_rate, frame_duration_ms, cache_dir)
+    segments = load_labels(wav_path)
+    frame_s = frame_duration_ms / 1000
+    reference = load_reference_text(wav_path) if stt else None
+
+    audio = None
+    transcripts = {}
+    if reference is not None:
+        if transcriber is None:
+            # Imported here so a --no-stt sweep never loads the Vosk model
+            from jetvoice.stt.stt import transcribe_bytes as transcriber
+        audio = load_wav(wav_path, out_rate=sample_rate)
+    frame_bytes = int(sample_rate * frame_duration_ms / 1000) * 2
+
+    results = {}
+    for n_streak, n_silence in pairs:
+        totals = _new_totals()
+        totals["files"] = 1
+        totals["audio_s"] = len(decisions) * frame_s
+
+        utterances = replay_segments(decisions, n_streak, n_silence)
+        _score_file(utterances, segments, frame_s, onset_tolerance_s, totals)
+
+        if reference is not None:
+            texts = []
+            for utterance in utterances:
+                if utterance not in transcripts:
+                    pcm = b"".join(audio[i * frame_bytes:(i + 1) * frame_bytes] for i in utterance)
+                    transcripts[utterance] = transcriber(pcm, sample_rate)
+                texts.append(transcripts[utterance])
+            errors, words = word_errors(reference, " ".join(filter(None, texts)))
+            totals["word_errors"] += errors
+            totals["ref_words"] += words
+
+        results[(aggressiveness, n_streak, n_silence)] = totals
+    return results
+
+
+def parameter_grid(
+    aggressiveness=(0, 1, 2, 3),
+    n_streak=(2, 3, 5),
+    n_silence=(5, 10, 20, 40),
+) -> List[Tuple[int, int, int]]:
+    return list(itertools.product(aggressiveness, n_streak, n_silence))
+
+
+def summarize(totals: dict) -> dict:
+    delays = sorted(totals["delays_s"])
+    return {
+        "files": totals["files"],
+        "utterances": totals["utterances"],
+        "wer": totals["word_errors"] / totals["ref_words"] if totals["ref_words"] else None,
+        "eos_delay_mean_s": sum(delays) / len(delays) if delays else None,
+        "eos_delay_p90_s": delays[min(len(delays) - 1, int(0.9 * len(delays)))] if delays else None,
+        "clipped_onset_rate": totals["clipped"] / totals["labeled"] if totals["labeled"] else 0.0,
+        "missed_rate": totals["missed"] / totals["labeled"] if totals["labeled"] else 0.0,
+        "false_triggers": totals["false_triggers"],
+        "false_triggers_per_min": totals["false_triggers"] / (totals["audio_s"] / 60) if totals["audio_s"] else 0.0,
+    }
+
+
+def sweep(
+    wav_paths: List[str],
+    grid: Optional[List[Tuple[int, int, int]]] = None,
+    sample_rate: int = 16000,
+    frame_duration_ms: int = 20,
+    cache_dir: Optional[str] = None,
+    onset_tolerance_s: float = 0.1,
+    stt: bool = True,
+    transcriber: Optional[Callable[[bytes, int], str]] = None,
+    workers: Optional[int] = None,
+) -> Dict[Tuple[int, int, int], dict]:
+    """
+    Replays labeled recordings through the VAD state machine for every
+    (aggressiveness, n_streak, n_silence) in `grid`.
+
+    Each WAV needs a <name>.json sidecar with "speech" segments; an optional
+    "text" key enables WER (utterances are transcribed with transcribe_bytes
+    unless `transcriber` is given). Work is split per (file, aggressiveness)
+    across a process pool; `workers=1` runs in-process.
+
+    Returns:
+        dict of (aggressiveness, n_streak, n_silence) -> summarize() metrics.
+    """
+    grid = grid or parameter_grid()
+    pairs_by_level = {}
+    for aggressiveness, n_streak, n_silence in grid:
+        pairs_by_level.setdefault(aggressiveness, []).append((n_streak, n_silence))
+
+    tasks = [
+        (path, aggressiveness, pairs, sample_rate, frame_duration_ms, cache_dir,
+         onset_tolerance_s, transcriber, stt)
+        for path in wav_paths
+        for aggressiveness, pairs in pairs_by_level.items()
+    ]
+
+    if workers == 1:
+        partials = [_replay_file(*task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            partials = list(pool.map(_replay_file, *zip(*tasks))) if tasks else []
+
+    combined = {config: _new_totals() for config in grid}
+    for partial in partials:
+        for config, totals in partial.items():
+            merged = combined[config]
+            for key, value in totals.items():
+                merged[key] += value
+    return {config: summarize(totals) for config, totals in combined.items()}
+
+
+def _fmt(value, spec: str) -> str:
+    return "n/a" if value is None else format(value, spec)
+
+
+if __name__ == "__main__":
+    # This block runs when you execute: python -m jetvoice.vad.sweep <labeled_dir> [--no-stt]
+    if len(sys.argv) < 2:
+        print("Usage: python -m jetvoice.vad.sweep <labeled_wav_dir> [--no-stt]")
+        sys.exit(1)
+
+    directory = sys.argv[1]
+    with_stt = "--no-stt" not in sys.argv[2:]
+    wavs = sorted(
+        os.path.join(directory, name) for name in os.listdir(directory)
+        if name.endswith(".wav") and os.path.exists(os.path.join(directory, name[:-4] + ".json"))
+    )
+
+    results = sweep(wavs, cache_dir=os.path.join(directory, ".vad_cache"), stt=with_stt)
+
+    print(f"--- VAD sweep on {len(wavs)} labeled files, {len(results)} configurations ---")
+    print(f"{'aggr':>4} {'streak':>6} {'silence':>7} {'WER':>6} {'eos_mean':>8} {'eos_p90':>7} "
+          f"{'clipped':>7} {'missed':>6} {'false':>5} {'false/min':>9}")
+    ranked = sorted(
+        results.items(),
+        key=lambda item: (
+            item[1]["wer"] if item[1]["wer"] is not None else 0.0,
+            item[1]["missed_rate"] + item[1]["clipped_onset_rate"],
+            item[1]["false_triggers"],
+            item[1]["eos_delay_mean_s"] if item[1]["eos_delay_mean_s"] is not None else float("inf"),
+        ),
+    )
+    for (aggressiveness, n_streak, n_silence), r in ranked:
+        print(f"{aggressiveness:>4} {n_streak:>6} {n_silence:>7} {_fmt(r['wer'], '.3f'):>6} "
+              f"{_fmt(r['eos_delay_mean_s'], '.2f'):>8} {_fmt(r['eos_delay_p90_s'], '.2f'):>7} "
+              f"{r['clipped_onset_rate']:>7.1%} {r['missed_rate']:>6.1%} {r['false_triggers']:>5} "
+              f"{r['false_triggers_per_min']:>9.2f}")
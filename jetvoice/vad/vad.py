@@ -1,8 +1,60 @@
+import abc
 import webrtcvad
-from typing import Optional
+from typing import List, Optional
 
 
-class WebRTCVAD:
+class VADBackend(abc.ABC):
+    """
+    Interface for voice activity detectors working on 16-bit mono PCM frames.
+
+    Backends implement classify_frames(), which receives a batch of frames so
+    that detectors with per-call overhead (neural models) can amortize it.
+    The main loop hands over every complete frame it has buffered at once.
+    """
+
+    def __init__(self, sample_rate: int = 16000, frame_duration_ms: int = 20) -> None:
+        if frame_duration_ms <= 0:
+            raise ValueError("frame_duration_ms must be positive")
+
+        self.sample_rate = sample_rate
+        self.frame_duration_ms = frame_duration_ms
+        self.frame_size_bytes = int(sample_rate * frame_duration_ms / 1000) * 2  # 16-bit mono
+
+    @abc.abstractmethod
+    def classify_frames(self, frames: List[bytes]) -> List[bool]:
+        """
+        Classify each frame (exactly frame_size_bytes long) as speech or not.
+        """
+
+    def reset(self) -> None:
+        """
+        Drops state carried between calls (recurrent models); no-op by default.
+        """
+
+    def _iter_frames(self, audio: bytes):
+        """
+        Yield consecutive frames of size frame_size_bytes from the chunk.
+        Discards any trailing bytes that don't fit a full frame.
+        """
+        length = len(audio)
+        step = self.frame_size_bytes
+        for start in range(0, length - step + 1, step):
+            yield audio[start:start + step]
+
+    def has_speech(self, audio: bytes) -> bool:
+        """
+        Return True if any frame in the chunk is classified as speech.
+        """
+        return any(self.classify_frames(list(self._iter_frames(audio))))
+
+    def count_speech_frames(self, audio: bytes) -> int:
+        """
+        Count how many frames in the chunk are classified as speech.
+        """
+        return sum(self.classify_frames(list(self._iter_frames(audio))))
+
+
+class WebRTCVAD(VADBackend):
     """
     Simple wrapper around WebRTC VAD for 16-bit mono PCM audio.
 
@@ -29,20 +81,24 @@ class WebRTCVAD:
         if frame_duration_ms not in (10, 20, 30):
             raise ValueError("frame_duration_ms must be 10, 20, or 30")
 
-        self.sample_rate = sample_rate
-        self.frame_duration_ms = frame_duration_ms
-        self.frame_size_bytes = int(sample_rate * frame_duration_ms / 1000) * 2  # 16-bit mono
+        super().__init__(sample_rate, frame_duration_ms)
+        self.aggressiveness = aggressiveness
         self._vad = webrtcvad.Vad(aggressiveness)
 
-    def _iter_frames(self, audio: bytes):
+    def set_aggressiveness(self, aggressiveness: int) -> None:
         """
-        Yield consecutive frames of size frame_size_bytes from the chunk.
-        Discards any trailing bytes that don't fit a full frame.
+        Changes the VAD mode (0-3) without recreating the detector.
         """
-        length = len(audio)
-        step = self.frame_size_bytes
-        for start in range(0, length - step + 1, step):
-            yield audio[start:start + step]
+        if aggressiveness not in (0, 1, 2, 3):
+            raise ValueError("aggressiveness must be 0, 1, 2 or 3")
+        self._vad.set_mode(aggressiveness)
+        self.aggressiveness = aggressiveness
+
+    def classify_frames(self, frames: List[bytes]) -> List[bool]:
+        """
+        WebRTC VAD has no batch API; frames are classified one by one.
+        """
+        return [self._vad.is_speech(frame, self.sample_rate) for frame in frames]
 
     def has_speech(self, audio: bytes) -> bool:
         """
@@ -81,3 +137,42 @@ class WebRTCVAD:
             if self._vad.is_speech(frame, self.sample_rate):
                 count += 1
         return count
+
+
+def create_vad(
+    backend: str = "webrtc",
+    sample_rate: int = 16000,
+    frame_duration_ms: int = 20,
+    aggressiveness: int = 2,
+    model_path: Optional[str] = None,
+    threshold: float = 0.5,
+) -> VADBackend:
+    """
+    Builds the VAD backend selected in config.
+
+    Args:
+        backend: "webrtc" (GMM, default) or "onnx" (Silero VAD v5, needs model_path
+            and the optional onnxruntime package).
+        aggressiveness: WebRTC only, 0-3.
+        model_path: ONNX only, path to the model file.
+        threshold: ONNX only, speech probability threshold.
+    """
+    backend = backend.lower()
+    if backend == "webrtc":
+        return WebRTCVAD(
+            sample_rate=sample_rate,
+            frame_duration_ms=frame_duration_ms,
+            aggressiveness=aggressiveness,
+        )
+    if backend == "onnx":
+        from jetvoice.vad.onnx_vad import OnnxVAD
+
+        if not model_path:
+            raise ValueError("the onnx VAD backend needs a model path (VAD_ONNX_MODEL)")
+        return OnnxVAD(
+            model_path,
+            sample_rate=sample_rate,
+            frame_duration_ms=frame_duration_ms,
+            threshold=threshold,
+        )
+    raise ValueError(f"Unknown VAD backend '{backend}', expected 'webrtc' or 'onnx'")
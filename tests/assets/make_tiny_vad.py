@@ -0,0 +1,73 @@
+"""
+Builds tests/assets/tiny_vad.onnx, a stand-in with the Silero VAD v5 interface:
+
+    inputs:  input (batch, context + window) float32, state (2, batch, 128) float32, sr () int64
+    outputs: output (batch, 1) float32, stateN (2, batch, 128) float32
+
+It scores window energy plus half the previous energy carried in `state`,
+so a quiet window right after a loud one still reads as speech. That makes
+recurrent-state handling observable in tests.
+
+Run from the repo root (needs the `onnx` package):
+    python tests/assets/make_tiny_vad.py
+"""
+import os
+
+import numpy as np
+import onnx
+from onnx import TensorProto, helper, numpy_helper
+
+
+def build() -> onnx.ModelProto:
+    consts = [
+        numpy_helper.from_array(np.array(0.5, dtype=np.float32), "half"),
+        numpy_helper.from_array(np.array(200.0, dtype=np.float32), "gain"),
+        numpy_helper.from_array(np.array(3.0, dtype=np.float32), "bias"),
+        numpy_helper.from_array(np.array(0.0, dtype=np.float32), "zero"),
+        numpy_helper.from_array(np.array([0], dtype=np.int64), "first"),
+        numpy_helper.from_array(np.array([1], dtype=np.int64), "second"),
+        numpy_helper.from_array(np.array([1], dtype=np.int64), "axis1"),
+    ]
+    nodes = [
+        helper.make_node("Mul", ["input", "input"], ["squared"]),
+        helper.make_node("ReduceMean", ["squared"], ["energy"], axes=[1], keepdims=1),
+        # state[0, :, 0:1] holds the carried energy
+        helper.make_node("Gather", ["state", "first"], ["layer"], axis=0),
+        helper.make_node("Squeeze", ["layer", "first"], ["layer2d"]),
+        helper.make_node("Slice", ["layer2d", "first", "second", "axis1"], ["prev"]),
+        helper.make_node("Mul", ["prev", "half"], ["carried"]),
+        helper.make_node("Add", ["energy", "carried"], ["score"]),
+        helper.make_node("Mul", ["score", "gain"], ["scaled"]),
+        helper.make_node("Sub", ["scaled", "bias"], ["logit_raw"]),
+        # sr is part of the Silero signature; fold it in with weight zero
+        helper.make_node("Cast", ["sr"], ["sr_f"], to=TensorProto.FLOAT),
+        helper.make_node("Mul", ["sr_f", "zero"], ["sr_zero"]),
+        helper.make_node("Add", ["logit_raw", "sr_zero"], ["logit"]),
+        helper.make_node("Sigmoid", ["logit"], ["output"]),
+        helper.make_node("Mul", ["state", "half"], ["decayed"]),
+        helper.make_node("Add", ["decayed", "energy"], ["stateN"]),
+    ]
+    graph = helper.make_graph(
+        nodes,
+        "tiny_vad",
+        inputs=[
+            helper.make_tensor_value_info("input", TensorProto.FLOAT, ["batch", "samples"]),
+            helper.make_tensor_value_info("state", TensorProto.FLOAT, [2, "batch", 128]),
+            helper.make_tensor_value_info("sr", TensorProto.INT64, []),
+        ],
+        outputs=[
+            helper.make_tensor_value_info("output", TensorProto.FLOAT, ["batch", 1]),
+            helper.make_tensor_value_info("stateN", TensorProto.FLOAT, [2, "batch", 128]),
+        ],
+        initializer=consts,
+    )
+    model = helper.make_model(graph, opset_imports=[helper.make_opsetid("", 13)])
+    model.ir_version = 7
+    onnx.checker.check_model(model)
+    return model
+
+
+if __name__ == "__main__":
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "tiny_vad.onnx")
+    onnx.save(build(), path)
+    print(f"Wrote {path}")
@@ -0,0 +1,94 @@
+from types import SimpleNamespace
+
+import pytest
+
+from jetvoice.vad.endpoint import AdaptiveEndpointer, frame_rms, partials_from_words, replay_endpointing
+
+
+SILENT = b"\x00" * 640
+LOUD = (b"\x00\x10" * 320)
+
+
+def _feed_pauses(ep, pause_frames, count):
+    """Simulates `count` utterance-internal pauses of the given length."""
+    ep.update(LOUD, True, True)
+    for _ in range(count):
+        for _ in range(pause_frames):
+            ep.update(SILENT, False, True)
+        ep.update(LOUD, True, True)
+
+
+def test_endpoint_invalid_bounds_raise():
+    """min/max timeouts must be ordered and positive."""
+    with pytest.raises(ValueError):
+        AdaptiveEndpointer(min_silence_frames=10, max_silence_frames=5)
+
+
+def test_endpoint_uses_base_until_pauses_seen():
+    """Without pause history the configured base timeout applies."""
+    ep = AdaptiveEndpointer(base_silence_frames=5)
+    assert ep.timeout_frames() == 5
+    assert ep.decide(4) is None
+    assert ep.decide(5) is not None
+
+
+def test_endpoint_follows_slow_speaker_pauses():
+    """Long pauses between words push the timeout above them."""
+    ep = AdaptiveEndpointer(base_silence_frames=5, margin_frames=2, max_silence_frames=40)
+    _feed_pauses(ep, pause_frames=12, count=6)
+
+    assert ep.pause_frames() == 12
+    assert ep.timeout_frames() == 14
+    assert ep.decide(12) is None
+
+
+def test_endpoint_partial_completeness_scales_timeout():
+    """Trailing function words wait longer; complete sentences end sooner."""
+    ep = AdaptiveEndpointer(base_silence_frames=8, min_silence_frames=1)
+
+    assert ep.timeout_frames("set a timer for") > ep.timeout_frames()
+    assert ep.timeout_frames("set a timer please") < ep.timeout_frames()
+
+
+def test_replay_compares_fixed_and_adaptive():
+    """Replay yields one utterance per policy for a single speech burst."""
+    frames = [LOUD] * 10 + [SILENT] * 20
+    decisions = [True] * 10 + [False] * 20
+
+    fixed = replay_endpointing(frames, decisions, n_streak=3, n_silence=5)
+    adaptive = replay_endpointing(
+        frames, decisions, n_streak=3, n_silence=5,
+        endpointer=AdaptiveEndpointer(base_silence_frames=5),
+    )
+
+    assert fixed["utterances"] == 1
+    assert fixed["mean_delay_ms"] == 100
+    assert adaptive["utterances"] == 1
+
+
+def test_frame_rms():
+    assert frame_rms(b"") == 0.0
+    assert frame_rms(SILENT) == 0.0
+    assert frame_rms(LOUD) == pytest.approx(4096.0)
+    assert frame_rms(b"\x00\x10\x00\xf0") == pytest.approx(4096.0)  # +4096, -4096
+
+
+def test_partials_from_words():
+    words = [SimpleNamespace(word="set", end=0.03), SimpleNamespace(word="timer", end=0.07)]
+
+    assert partials_from_words(words, 4) == ["", "set", "set", "set timer"]
+
+
+def test_replay_passes_partials_to_endpointer():
+    """An unfinished partial keeps the utterance open longer in replay, as it does live."""
+    frames = [LOUD] * 10 + [SILENT] * 30
+    decisions = [True] * 10 + [False] * 30
+
+    def delay(partial):
+        return replay_endpointing(
+            frames, decisions, n_streak=3, n_silence=8,
+            endpointer=AdaptiveEndpointer(base_silence_frames=8, min_silence_frames=1),
+            partials=[partial] * len(frames),
+        )["mean_delay_ms"]
+
+    assert delay("set a timer for") > delay("set a timer please")
@@ -0,0 +1,106 @@
+import wave
+
+import numpy as np
+import pytest
+
+from jetvoice.audio.frontend import AudioFrontend, load_wav
+
+
+def _tone(rate, seconds=1.0, freq=1000.0, amplitude=0.5):
+    t = np.arange(int(rate * seconds)) / rate
+    return amplitude * np.sin(2 * np.pi * freq * t)
+
+
+def _dominant_freq(pcm16: bytes, rate: int) -> float:
+    y = np.frombuffer(pcm16, dtype="<i2").astype(np.float64)
+    spectrum = np.abs(np.fft.rfft(y))
+    return np.argmax(spectrum) * rate / len(y)
+
+
+def test_frontend_invalid_dtype_raises():
+    with pytest.raises(ValueError):
+        AudioFrontend(in_rate=48000, dtype="float16")
+
+
+def test_frontend_passthrough_for_pipeline_format():
+    """Mono int16 at the output rate is returned untouched."""
+    frontend = AudioFrontend(in_rate=16000, channels=1, dtype="int16", dc_removal=False)
+    data = b"\x01\x02" * 320
+    assert frontend.passthrough
+    assert frontend.process(data) is data
+
+
+@pytest.mark.parametrize("in_rate", [44100, 48000, 8000])
+def test_frontend_resamples_stereo_float(in_rate):
+    """A 1 kHz stereo float tone comes out as 1 kHz mono int16 at 16 kHz."""
+    tone = _tone(in_rate).astype(np.float32)
+    stereo = np.stack([tone, tone], axis=1).ravel().tobytes()
+
+    frontend = AudioFrontend(in_rate=in_rate, channels=2, dtype="float32", dc_removal=False)
+    out = frontend.process(stereo)
+
+    assert len(out) == 16000 * 2
+    assert _dominant_freq(out, 16000) == pytest.approx(1000.0, abs=2.0)
+
+
+def _level_db(y, amplitude=0.5):
+    return 20 * np.log10(np.sqrt(np.mean(y ** 2)) / (amplitude / np.sqrt(2)) + 1e-12)
+
+
+@pytest.mark.parametrize("in_rate", [44100, 48000])
+@pytest.mark.parametrize("freq", [10000.0, 11000.0, 12000.0])
+def test_frontend_rejects_tones_above_output_nyquist(in_rate, freq):
+    """Tones that would alias into the 0-8 kHz band come out below -60 dB."""
+    frontend = AudioFrontend(in_rate=in_rate, dtype="float32", dc_removal=False)
+    y = frontend.process_float(_tone(in_rate, freq=freq).astype(np.float32).tobytes())
+
+    assert _level_db(y[2000:]) < -60.0
+
+
+@pytest.mark.parametrize("in_rate", [44100, 48000])
+def test_frontend_passband_is_flat_to_7khz(in_rate):
+    frontend = AudioFrontend(in_rate=in_rate, dtype="float32", dc_removal=False)
+    y = frontend.process_float(_tone(in_rate, freq=7000.0).astype(np.float32).tobytes())
+
+    assert _level_db(y[2000:]) == pytest.approx(0.0, abs=0.5)
+
+
+def test_frontend_streaming_matches_bulk():
+    """Odd-sized blocks (even split mid-frame) give the same output as one call."""
+    tone = (_tone(44100) * 32767).astype("<i2")
+    stereo = np.stack([tone, tone], axis=1).ravel().tobytes()
+
+    bulk = AudioFrontend(in_rate=44100, channels=2, dc_removal=False).process(stereo)
+    streamed_fe = AudioFrontend(in_rate=44100, channels=2, dc_removal=False)
+    streamed = b"".join(
+        streamed_fe.process(stereo[i:i + 1001]) for i in range(0, len(stereo), 1001)
+    )
+
+    assert streamed == bulk
+
+
+def test_frontend_removes_dc_and_clips():
+    """A constant offset is removed and out-of-range floats are clipped."""
+    frontend = AudioFrontend(in_rate=16000, dtype="float32")
+    offset = (_tone(16000, amplitude=0.2) + 0.3).astype(np.float32).tobytes()
+    y = np.frombuffer(frontend.process(offset), dtype="<i2")
+    assert abs(y.mean()) < 200
+
+    clipper = AudioFrontend(in_rate=16000, dtype="float32", dc_removal=False)
+    y = np.frombuffer(clipper.process(np.full(100, 2.0, np.float32).tobytes()), dtype="<i2")
+    assert y.max() == 32767
+
+
+def test_load_wav_converts_to_pipeline_format(tmp_path):
+    path = str(tmp_path / "stereo48k.wav")
+    tone = (_tone(48000) * 32767).astype("<i2")
+    with wave.open(path, "wb") as wf:
+        wf.setnchannels(2)
+        wf.setsampwidth(2)
+        wf.setframerate(48000)
+        wf.writeframes(np.stack([tone, tone], axis=1).ravel().tobytes())
+
+    pcm = load_wav(path, out_rate=16000)
+
+    assert len(pcm) == 16000 * 2
+    assert _dominant_freq(pcm, 16000) == pytest.approx(1000.0, abs=2.0)
@@ -0,0 +1,59 @@
+import pytest
+
+from jetvoice.llm.gate import ConfidenceGate, PASS, DROP, REPROMPT
+
+
+def test_gate_invalid_config_raises():
+    with pytest.raises(ValueError):
+        ConfidenceGate(min_confidence=1.5)
+    with pytest.raises(ValueError):
+        ConfidenceGate(action="ignore")
+
+
+def test_gate_passes_confident_transcript():
+    gate = ConfidenceGate(min_confidence=0.6, min_words=2)
+    verdict, reason = gate.check("what time is it", 0.92)
+
+    assert verdict == PASS
+    assert reason == ""
+    assert gate.stats.passed == 1
+    assert gate.stats.llm_calls_avoided == 0
+
+
+def test_gate_drops_noise_recognitions():
+    """Low confidence or too-short transcripts never reach the LLM."""
+    gate = ConfidenceGate(min_confidence=0.6, min_words=2)
+
+    assert gate.check("the", 0.95)[0] == DROP
+    assert gate.check("turn on the lights", 0.31)[0] == DROP
+    assert gate.check("", 1.0)[0] == DROP
+    assert gate.stats.dropped == 3
+    assert gate.stats.llm_calls_avoided == 3
+
+
+def test_gate_allows_short_commands():
+    """Single-word commands like 'stop' pass the length check."""
+    gate = ConfidenceGate(min_confidence=0.6, min_words=2)
+    assert gate.check("stop", 0.9)[0] == PASS
+
+
+def test_gate_reprompt_action():
+    gate = ConfidenceGate(action=REPROMPT)
+    verdict, reason = gate.check("huh", 0.2)
+
+    assert verdict == REPROMPT
+    assert "confidence" in reason
+    assert gate.stats.reprompted == 1
+
+
+def test_gate_drop_after_prefetch_is_not_an_avoided_call():
+    """A speculative request already sent for the turn was paid for anyway."""
+    gate = ConfidenceGate(min_confidence=0.6, min_words=2)
+
+    assert gate.check("the", 0.95, prefetched=True)[0] == DROP
+    assert gate.check("huh", 0.2)[0] == DROP
+    assert gate.check("what time is it", 0.9, prefetched=True)[0] == PASS
+
+    assert gate.stats.dropped == 2
+    assert gate.stats.after_prefetch == 1
+    assert gate.stats.llm_calls_avoided == 1
@@ -0,0 +1,101 @@
+import os
+from unittest.mock import MagicMock
+
+import pytest
+
+from jetvoice.governor.governor import (
+    Governor, QualityLevel, SystemProbe, apply_level, default_levels,
+)
+
+
+def _write_proc(root, busy, idle):
+    """Stub /proc/stat with cumulative user and idle jiffies."""
+    os.makedirs(root / "proc", exist_ok=True)
+    (root / "proc" / "stat").write_text(f"cpu  {busy} 0 0 {idle} 0 0 0 0 0 0\ncpu0 1 0 0 1\n")
+
+
+def _write_temp(root, millidegrees):
+    zone = root / "sys" / "class" / "thermal" / "thermal_zone0"
+    os.makedirs(zone, exist_ok=True)
+    (zone / "temp").write_text(f"{millidegrees}\n")
+
+
+class FakeProbe:
+    def __init__(self):
+        self.cpu = None
+        self.temp = None
+
+    def cpu_load(self):
+        return self.cpu
+
+    def temperature_c(self):
+        return self.temp
+
+
+def test_probe_reads_stub_tree(tmp_path):
+    probe = SystemProbe(root=str(tmp_path))
+    _write_proc(tmp_path, busy=100, idle=100)
+    _write_temp(tmp_path, 71500)
+
+    assert probe.cpu_load() is None  # first reading has no delta
+    _write_proc(tmp_path, busy=190, idle=110)
+    assert probe.cpu_load() == pytest.approx(0.9)
+    assert probe.temperature_c() == pytest.approx(71.5)
+
+
+def test_probe_missing_files(tmp_path):
+    probe = SystemProbe(root=str(tmp_path))
+    assert probe.cpu_load() is None
+    assert probe.temperature_c() is None
+
+
+def test_governor_steps_down_and_back_up():
+    probe = FakeProbe()
+    governor = Governor(default_levels("small-model"), probe=probe, down_after=2, up_after=3)
+
+    probe.temp = 85.0
+    assert governor.poll() is None
+    transition = governor.poll()
+    assert transition.to_level == "reduced"
+    assert "temp=85.0C" in transition.reason
+
+    # Within the hysteresis band nothing changes
+    probe.temp = 75.0
+    assert all(governor.poll() is None for _ in range(5))
+
+    probe.temp = 60.0
+    results = [governor.poll() for _ in range(3)]
+    assert results[:2] == [None, None]
+    assert results[2].to_level == "full"
+    assert "cleared" in results[2].reason
+
+
+def test_governor_reacts_to_stt_rtf_and_lag():
+    governor = Governor(default_levels(), probe=FakeProbe(), down_after=1)
+
+    governor.observe_stt(1.4)
+    assert "stt_rtf=1.40" in governor.poll().reason
+    assert "capture_lag" in governor.poll(lag_s=2.0).reason
+    assert governor.level.name == "minimal"
+    assert governor.poll(lag_s=2.0) is None  # already at the bottom
+
+
+def test_apply_level_restores_configured_values():
+    base = QualityLevel("configured", vad_aggressiveness=1, llm_max_tokens=None, tts_online=True)
+    vad, llm, tts, use_model = MagicMock(), MagicMock(), MagicMock(), MagicMock()
+    tts.use_online = True
+
+    apply_level(default_levels("small-model")[2], base, vad=vad, llm=llm, tts=tts, use_model=use_model)
+
+    use_model.assert_called_with("small-model")
+    vad.set_aggressiveness.assert_called_with(3)
+    assert llm.max_tokens == 60
+    tts.set_online.assert_called_with(False)
+
+    tts.use_online = False
+    apply_level(default_levels()[0], base, vad=vad, llm=llm, tts=tts, use_model=use_model)
+
+    use_model.assert_called_with(None)
+    vad.set_aggressiveness.assert_called_with(1)
+    assert llm.max_tokens is None
+    tts.set_online.assert_called_with(True)
@@ -0,0 +1,95 @@
+import os
+import threading
+import time
+import wave
+
+import pytest
+
+from jetvoice.journal.journal import UtteranceJournal, JournalReader
+
+
+PCM = b"\x01\x00" * 1600  # 0.1 s at 16 kHz
+
+
+def test_journal_invalid_quota_raises(tmp_path):
+    """The quota must hold at least one segment."""
+    with pytest.raises(ValueError):
+        UtteranceJournal(str(tmp_path), segment_bytes=1000, quota_bytes=10)
+
+
+def test_journal_roundtrip_and_export(tmp_path):
+    """Records written by the background thread can be read and exported."""
+    journal = UtteranceJournal(str(tmp_path / "journal"))
+    assert journal.record(PCM, 16000, transcript="hello", response="hi", timings={"stt": 0.1})
+    assert journal.record(PCM[:320], 16000, transcript="", timings={"stt": 0.05})
+    journal.close()
+
+    reader = JournalReader(str(tmp_path / "journal"))
+    assert len(reader) == 2
+
+    meta, pcm = reader[0]
+    assert meta["transcript"] == "hello"
+    assert meta["response"] == "hi"
+    assert meta["timings"]["stt"] == 0.1
+    assert pcm == PCM
+    assert reader.find(since=meta["time"]) == [0, 1]
+
+    paths = reader.export_wav(str(tmp_path / "wav"))
+    reader.close()
+
+    assert len(paths) == 2
+    with wave.open(paths[0], "rb") as wf:
+        assert wf.getframerate() == 16000
+        assert wf.readframes(wf.getnframes()) == PCM
+    assert os.path.exists(paths[0][:-4] + ".json")
+
+
+def test_journal_quota_drops_oldest_segments(tmp_path):
+    """Segments roll at segment_bytes and the oldest are removed to stay within the quota."""
+    journal = UtteranceJournal(str(tmp_path), segment_bytes=4000, quota_bytes=12000)
+    for i in range(10):
+        journal.record(PCM, 16000, transcript=f"utt {i}")
+    journal.close()
+
+    total = sum(os.path.getsize(tmp_path / name) for name in os.listdir(tmp_path))
+    assert total <= 12000
+
+    reader = JournalReader(str(tmp_path))
+    transcripts = [reader[i][0]["transcript"] for i in range(len(reader))]
+    reader.close()
+
+    assert 0 < len(transcripts) < 10
+    assert transcripts[-1] == "utt 9"
+
+
+def test_journal_quota_counts_active_segment(tmp_path):
+    """With one segment as large as the quota, the disk total never exceeds it."""
+    journal = UtteranceJournal(str(tmp_path), segment_bytes=6000, quota_bytes=6000)
+    for i in range(10):
+        journal.record(PCM, 16000, transcript=f"utt {i}")
+    journal.close()
+
+    total = sum(os.path.getsize(tmp_path / name) for name in os.listdir(tmp_path))
+    assert total <= 6000
+    assert journal.written == 10
+
+
+def test_journal_close_does_not_block_on_full_queue(tmp_path):
+    journal = UtteranceJournal(str(tmp_path), queue_size=1)
+    release = threading.Event()
+    write = journal._write
+    journal._write = lambda *item: (release.wait(5), write(*item))
+
+    journal.record(PCM, 16000, transcript="first")
+    while journal._queue.qsize():
+        time.sleep(0.001)  # writer has taken it and is blocked
+    journal.record(PCM, 16000, transcript="second")  # fills the queue
+
+    closer = threading.Thread(target=journal.close, kwargs={"timeout": 0.1})
+    closer.start()
+    closer.join(0.5)
+    assert not closer.is_alive()
+
+    release.set()
+    journal._thread.join(2)
+    assert journal.written == 2
@@ -53,4 +53,89 @@ def test_llm_class_missing_key():
     with patch('jetvoice.llm.llm.os.getenv', return_value=None):
         llm = JetVoiceLLM()
         result = llm.ask("Hi")
-        assert result is None
\ No newline at end of file
+        assert result is None
+
+@patch('jetvoice.llm.llm.openai')
+def test_llm_class_max_tokens(mock_openai):
+    """
+    The cap is only sent when set (e.g. by the governor); older models take max_tokens.
+    """
+    mock_response = MagicMock()
+    mock_response.choices = [MagicMock(message={"content": "Short"})]
+    mock_chat_completion = MagicMock()
+    mock_chat_completion.create.return_value = mock_response
+    mock_openai.ChatCompletion = mock_chat_completion
+
+    with patch('jetvoice.llm.llm.os.getenv', return_value="sk-fake-key"):
+        llm = JetVoiceLLM(model="gpt-4o-mini")
+        llm.ask("Hi")
+        assert 'max_tokens' not in mock_chat_completion.create.call_args[1]
+
+        llm.max_tokens = 60
+        llm.ask("Hi")
+
+    assert mock_chat_completion.create.call_args[1]['max_tokens'] == 60
+
+@patch('jetvoice.llm.llm.openai')
+def test_llm_class_per_call_max_tokens(mock_openai):
+    """
+    A per-call budget applies on its own and never loosens the configured cap.
+    """
+    mock_response = MagicMock()
+    mock_response.choices = [MagicMock(message={"content": "Short"})]
+    mock_chat_completion = MagicMock()
+    mock_chat_completion.create.return_value = mock_response
+    mock_openai.ChatCompletion = mock_chat_completion
+
+    with patch('jetvoice.llm.llm.os.getenv', return_value="sk-fake-key"):
+        llm = JetVoiceLLM()
+        llm.ask("Hi", max_tokens=80)
+        assert mock_chat_completion.create.call_args[1]['max_completion_tokens'] == 80
+
+        llm.max_tokens = 60
+        llm.ask("Hi", max_tokens=80)
+
+    assert mock_chat_completion.create.call_args[1]['max_completion_tokens'] == 60
+
+@patch('jetvoice.llm.llm.openai')
+def test_llm_class_default_model_token_param(mock_openai):
+    """
+    The default gpt-5.1 model takes max_completion_tokens; the name can be overridden.
+    """
+    mock_response = MagicMock()
+    mock_response.choices = [MagicMock(message={"content": "Short"})]
+    mock_chat_completion = MagicMock()
+    mock_chat_completion.create.return_value = mock_response
+    mock_openai.ChatCompletion = mock_chat_completion
+
+    with patch('jetvoice.llm.llm.os.getenv', return_value="sk-fake-key"):
+        llm = JetVoiceLLM()
+        assert llm.model == "gpt-5.1"
+        llm.max_tokens = 60
+        llm.ask("Hi")
+        kwargs = mock_chat_completion.create.call_args[1]
+        assert kwargs['max_completion_tokens'] == 60
+        assert 'max_tokens' not in kwargs
+
+        llm.token_param = "max_tokens"
+        llm.ask("Hi")
+
+    assert mock_chat_completion.create.call_args[1]['max_tokens'] == 60
+
+@patch('jetvoice.llm.llm.openai')
+def test_llm_class_drops_fragment_cut_at_cap(mock_openai):
+    """
+    A reply cut at the token cap ends on its last full sentence.
+    """
+    mock_response = MagicMock()
+    mock_response.choices = [MagicMock(message={"content": "It is sunny. Later it will"}, finish_reason="length")]
+    mock_chat_completion = MagicMock()
+    mock_chat_completion.create.return_value = mock_response
+    mock_openai.ChatCompletion = mock_chat_completion
+
+    with patch('jetvoice.llm.llm.os.getenv', return_value="sk-fake-key"):
+        llm = JetVoiceLLM()
+        assert llm.ask("Weather?") == "It is sunny."
+
+        mock_response.choices[0].finish_reason = "stop"
+        assert llm.ask("Weather?") == "It is sunny. Later it will"
@@ -0,0 +1,160 @@
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from jetvoice.audio.monitor import CaptureMonitor, CaptureLagError
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _fill(monitor, clock, n, step=0.02):
+    for i in range(n):
+        monitor.put(i)
+        clock.now += step
+
+
+def test_monitor_invalid_policy_raises():
+    with pytest.raises(ValueError):
+        CaptureMonitor(policy="ignore")
+
+
+def test_monitor_counts_portaudio_status():
+    monitor = CaptureMonitor()
+    monitor.put(b"a", SimpleNamespace(input_overflow=True, input_underflow=False))
+    monitor.put(b"b", SimpleNamespace(input_overflow=False, input_underflow=True))
+    monitor.put(b"c", None)
+
+    assert monitor.stats.overflows == 1
+    assert monitor.stats.underflows == 1
+    assert monitor.stats.chunks == 3
+
+
+def test_monitor_in_time_chunks_pass_through():
+    clock = FakeClock()
+    monitor = CaptureMonitor(max_lag_s=1.0, clock=clock)
+    _fill(monitor, clock, 3)
+
+    assert [monitor.get(timeout=0)[0] for _ in range(3)] == [0, 1, 2]
+    assert monitor.stats.dropped_chunks == 0
+
+
+def test_monitor_queue_is_bounded():
+    """drop_oldest keeps the newest max_queue chunks."""
+    clock = FakeClock()
+    monitor = CaptureMonitor(max_queue=5, max_lag_s=100, clock=clock)
+    _fill(monitor, clock, 8)
+
+    assert monitor.stats.max_depth == 5
+    assert monitor.stats.dropped_chunks == 3
+    assert monitor.get(timeout=0)[0] == 3
+
+
+def test_monitor_drop_oldest_on_lag():
+    """Chunks older than max_lag_s are discarded, newer ones kept."""
+    clock = FakeClock()
+    monitor = CaptureMonitor(max_lag_s=0.5, clock=clock)
+    _fill(monitor, clock, 50)  # 1 s of audio, consumer stalled
+
+    item, resynced = monitor.get(timeout=0)
+
+    assert not resynced
+    assert item > 0
+    assert monitor.stats.lag_s <= 0.5
+    assert monitor.stats.dropped_chunks == item
+
+
+def test_monitor_skip_to_live_reports_resync():
+    clock = FakeClock()
+    monitor = CaptureMonitor(max_lag_s=0.5, policy="skip_to_live", clock=clock)
+    _fill(monitor, clock, 50)
+
+    item, resynced = monitor.get(timeout=0)
+
+    assert resynced
+    assert item == 49
+    assert monitor.stats.skips == 1
+    assert monitor.stats.dropped_chunks == 49
+    assert monitor.stats.depth == 0
+
+
+def test_monitor_fail_policy_raises():
+    clock = FakeClock()
+    monitor = CaptureMonitor(max_lag_s=0.5, policy="fail", clock=clock)
+    _fill(monitor, clock, 50)
+
+    with pytest.raises(CaptureLagError):
+        monitor.get(timeout=0)
+
+
+def test_monitor_clear_is_not_a_resync():
+    clock = FakeClock()
+    monitor = CaptureMonitor(clock=clock)
+    _fill(monitor, clock, 3)
+    monitor.clear()
+    monitor.put("live")
+
+    assert monitor.get(timeout=0) == ("live", False)
+    assert monitor.stats.dropped_chunks == 0
+
+
+def test_monitor_paused_stall_is_not_lag():
+    """A deliberate stall (STT/LLM) between pause() and resume() doesn't trip the policy."""
+    clock = FakeClock()
+    monitor = CaptureMonitor(max_lag_s=0.5, policy="fail", clock=clock)
+    monitor.pause()
+    _fill(monitor, clock, 100)  # 2 s of audio queued while blocked
+    monitor.resume()
+
+    assert [monitor.get(timeout=0)[0] for _ in range(3)] == [0, 1, 2]
+    assert monitor.stats.lag_s <= 0.5
+
+
+def test_monitor_lag_resumes_counting_after_pause():
+    clock = FakeClock()
+    monitor = CaptureMonitor(max_lag_s=0.5, policy="fail", clock=clock)
+    monitor.pause()
+    _fill(monitor, clock, 10)
+    monitor.resume()
+    clock.now += 1.0  # consumer stalls after resuming
+
+    with pytest.raises(CaptureLagError):
+        monitor.get(timeout=0)
+
+
+def test_monitor_full_queue_while_paused_drops_quietly():
+    clock = FakeClock()
+    monitor = CaptureMonitor(max_queue=5, max_lag_s=100, policy="fail", clock=clock)
+    monitor.pause()
+    _fill(monitor, clock, 8)
+    monitor.resume()
+
+    assert monitor.get(timeout=0) == (3, False)
+    assert monitor.stats.dropped_chunks == 3
+
+
+def test_monitor_get_batch_drains_ready_chunks():
+    clock = FakeClock()
+    monitor = CaptureMonitor(clock=clock)
+    _fill(monitor, clock, 4)
+
+    assert monitor.get_batch(timeout=0) == ([0, 1, 2, 3], False)
+    assert monitor.stats.depth == 0
+
+
+def test_monitor_get_batch_window_collects_late_chunks():
+    monitor = CaptureMonitor()
+    monitor.put(0)
+    late = threading.Timer(0.02, monitor.put, args=(1,))
+    late.start()
+
+    chunks, _ = monitor.get_batch(timeout=1, window_s=0.2)
+    late.join()
+
+    assert chunks == [0, 1]
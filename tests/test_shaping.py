@@ -0,0 +1,103 @@
+import pytest
+
+from jetvoice.llm.shaping import (
+    CHAT, COMMAND, EXPLAIN, FACTUAL, YES_NO, TOKEN_BUDGETS,
+    ResponseShaper, classify_question, drop_unfinished_sentence, estimate_spoken_seconds,
+    truncate_to_budget,
+)
+
+
+@pytest.mark.parametrize("text, kind", [
+    ("turn on the kitchen lights", COMMAND),
+    ("is it going to rain today", YES_NO),
+    ("what time is it", FACTUAL),
+    ("how many people live in Paris", FACTUAL),
+    ("why is the sky blue", EXPLAIN),
+    ("how does a jet engine work", EXPLAIN),
+    ("what is the difference between a virus and bacteria", EXPLAIN),
+    ("tell me a joke", CHAT),
+])
+def test_classify_question(text, kind):
+    assert classify_question(text) == kind
+
+
+def test_estimate_spoken_seconds():
+    assert estimate_spoken_seconds("one two three four five", rate_wpm=150) == 2.0
+    assert estimate_spoken_seconds("") == 0.0
+
+
+def test_truncate_keeps_whole_sentences():
+    text = "First sentence here. Second one is here! Third? Fourth sentence."
+
+    kept, remainder = truncate_to_budget(text, max_seconds=3.5, rate_wpm=120)
+
+    assert kept == "First sentence here. Second one is here!"
+    assert remainder == "Third? Fourth sentence."
+
+
+def test_truncate_always_keeps_first_sentence():
+    kept, remainder = truncate_to_budget("A very long opening sentence without end", 0.5)
+    assert kept == "A very long opening sentence without end"
+    assert remainder == ""
+
+
+def test_drop_unfinished_sentence():
+    assert drop_unfinished_sentence("It is sunny. Tomorrow it will") == "It is sunny."
+    assert drop_unfinished_sentence("It is sunny. Warm too!") == "It is sunny. Warm too!"
+    # Nothing to fall back to: keep the fragment rather than say nothing
+    assert drop_unfinished_sentence("It is sunny and") == "It is sunny and"
+
+
+def test_token_budget_by_type_and_spoken_cap():
+    shaper = ResponseShaper(rate_wpm=125, max_spoken_s=60)
+    assert shaper.token_budget("turn off the radio") == TOKEN_BUDGETS[COMMAND]
+    assert shaper.token_budget("why is the sky blue") == TOKEN_BUDGETS[EXPLAIN]
+
+    short = ResponseShaper(rate_wpm=120, max_spoken_s=10)
+    # 20 words speakable plus a sentence of slack
+    assert short.token_budget("why is the sky blue") == short.spoken_token_cap < TOKEN_BUDGETS[EXPLAIN]
+
+
+def test_shape_without_follow_up_drops_remainder():
+    shaper = ResponseShaper(rate_wpm=60, max_spoken_s=3)
+
+    spoken, estimate = shaper.shape("One two three. Four five six. Seven.")
+
+    assert spoken == "One two three."
+    assert estimate == 3.0
+    assert shaper.pending == ""
+    assert shaper.stats.truncated == 1
+
+
+def test_follow_up_offers_and_continues():
+    shaper = ResponseShaper(rate_wpm=60, max_spoken_s=3, follow_up=True, follow_up_text="More?")
+
+    spoken, _ = shaper.shape("One two three. Four five six. Seven.")
+    assert spoken == "One two three. More?"
+
+    rest = shaper.continuation("Yes.")
+    assert rest == "Four five six. Seven."
+    spoken, _ = shaper.shape(rest)
+    assert spoken == "Four five six. More?"
+
+    # Anything but a yes drops what is left
+    assert shaper.continuation("what's the weather") is None
+    assert shaper.continuation("yes") is None
+    assert shaper.stats.continued == 1
+
+
+def test_record_playback_reports_ratio():
+    shaper = ResponseShaper()
+    assert shaper.stats.actual_over_estimate is None
+
+    shaper.record_playback(4.0, 5.0)
+    shaper.record_playback(6.0, 7.0)
+
+    assert shaper.stats.measured == 2
+    assert shaper.stats.actual_over_estimate == pytest.approx(1.2)
+    assert "x1.20" in str(shaper.stats)
+
+
+def test_shaper_rejects_bad_config():
+    with pytest.raises(ValueError):
+        ResponseShaper(rate_wpm=0)
@@ -0,0 +1,260 @@
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from jetvoice.llm.singleflight import FairLimiter, SingleFlightLLM
+
+
+class SlowLLM:
+    """
+    Stands in for JetVoiceLLM: blocks in ask() until released and records calls.
+    """
+
+    def __init__(self):
+        self.system_prompt = "be brief"
+        self.model = "gpt-test"
+        self.max_tokens = None
+        self.calls = []
+        self.release = threading.Event()
+        self._lock = threading.Lock()
+
+    def ask(self, prompt):
+        with self._lock:
+            self.calls.append(prompt)
+        self.release.wait(5)
+        return f"answer to {prompt}"
+
+
+def _ask_in_threads(client, prompts):
+    results = [None] * len(prompts)
+
+    def run(i, prompt):
+        results[i] = client.ask(prompt)
+
+    threads = [threading.Thread(target=run, args=(i, p)) for i, p in enumerate(prompts)]
+    for t in threads:
+        t.start()
+    return threads, results
+
+
+def _wait_for(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.005)
+
+
+def test_singleflight_coalesces_identical_prompts():
+    inner = SlowLLM()
+    client = SingleFlightLLM(inner)
+
+    threads, results = _ask_in_threads(client, ["What time is it?", "what time is it", "WHAT TIME IS IT"])
+    _wait_for(lambda: client.stats.calls == 3)
+    inner.release.set()
+    for t in threads:
+        t.join(2)
+
+    assert len(inner.calls) == 1
+    assert len(set(results)) == 1 and results[0].startswith("answer to")
+    assert client.stats.upstream == 1
+    assert client.stats.coalesced == 2
+
+
+def test_singleflight_distinct_prompts_are_not_coalesced():
+    inner = SlowLLM()
+    inner.release.set()
+    client = SingleFlightLLM(inner)
+
+    threads, results = _ask_in_threads(client, ["lights on", "lights off"])
+    for t in threads:
+        t.join(2)
+
+    assert sorted(inner.calls) == ["lights off", "lights on"]
+    assert client.stats.coalesced == 0
+
+
+def test_singleflight_key_includes_settings():
+    inner = SlowLLM()
+    client = SingleFlightLLM(inner)
+
+    key = client._key("hello")
+    inner.max_tokens = 60
+    assert client._key("hello") != key
+    inner.system_prompt = "be verbose"
+    assert client._key("Hello!") == client._key("hello")
+
+
+def test_singleflight_does_not_cache_after_completion():
+    inner = SlowLLM()
+    inner.release.set()
+    client = SingleFlightLLM(inner)
+
+    client.ask("hello")
+    client.ask("hello")
+
+    assert len(inner.calls) == 2
+
+
+def test_singleflight_failure_wakes_followers():
+    class Failing(SlowLLM):
+        def ask(self, prompt):
+            super().ask(prompt)
+            raise RuntimeError("boom")
+
+    inner = Failing()
+    client = SingleFlightLLM(inner)
+    follower_result = []
+
+    leader = threading.Thread(target=lambda: pytest.raises(RuntimeError, client.ask, "hi"))
+    leader.start()
+    _wait_for(lambda: inner.calls)
+    follower = threading.Thread(target=lambda: follower_result.append(client.ask("hi")))
+    follower.start()
+    _wait_for(lambda: client.stats.coalesced == 1)
+    inner.release.set()
+    leader.join(2)
+    follower.join(2)
+
+    assert follower_result == [None]
+    assert client._flights == {}
+
+
+def test_singleflight_forwards_attributes():
+    client = SingleFlightLLM(SimpleNamespace(system_prompt="x", model="m", max_tokens=42))
+    assert client.max_tokens == 42
+
+
+def test_fair_limiter_bounds_concurrency():
+    inner = SlowLLM()
+    client = SingleFlightLLM(inner, max_concurrent=2)
+
+    threads, _ = _ask_in_threads(client, ["a", "b", "c", "d"])
+    _wait_for(lambda: client.limiter.queued == 2)
+    assert len(inner.calls) == 2
+    inner.release.set()
+    for t in threads:
+        t.join(2)
+
+    assert len(inner.calls) == 4
+
+
+def test_fair_limiter_grants_in_arrival_order():
+    limiter = FairLimiter(1)
+    limiter.acquire()
+    order = []
+
+    def waiter(i):
+        limiter.acquire()
+        order.append(i)
+        limiter.release()
+
+    threads = []
+    for i in range(5):
+        t = threading.Thread(target=waiter, args=(i,))
+        t.start()
+        threads.append(t)
+        _wait_for(lambda: limiter.queued == i + 1)
+
+    limiter.release()
+    for t in threads:
+        t.join(2)
+
+    assert order == [0, 1, 2, 3, 4]
+
+
+def test_fair_limiter_rejects_zero():
+    with pytest.raises(ValueError):
+        FairLimiter(0)
+
+
+def test_singleflight_forwards_per_call_budget():
+    calls = []
+    inner = SimpleNamespace(system_prompt="s", model="m", max_tokens=None,
+                            ask=lambda prompt, **options: calls.append(options) or "ok")
+    client = SingleFlightLLM(inner)
+
+    client.ask("hello")
+    client.ask("hello", max_tokens=40)
+
+    assert calls == [{}, {"max_tokens": 40}]
+    assert client._key("hello", 40) != client._key("hello")
+
+
+def test_cancelled_request_leaves_the_queue():
+    """A discarded speculation waiting for a slot withdraws instead of using it."""
+    inner = SlowLLM()
+    client = SingleFlightLLM(inner, max_concurrent=1)
+    cancel = threading.Event()
+    result = []
+
+    busy, _ = _ask_in_threads(client, ["busy"])
+    _wait_for(lambda: inner.calls)
+    speculative = threading.Thread(target=lambda: result.append(client.ask("guess", cancel=cancel)))
+    speculative.start()
+    _wait_for(lambda: client.limiter.queued == 1)
+
+    cancel.set()
+    speculative.join(2)
+    assert result == [None]
+    assert client.limiter.queued == 0
+    assert client.stats.withdrawn == 1
+
+    inner.release.set()
+    busy[0].join(2)
+    assert inner.calls == ["busy"]
+    assert client._flights == {}
+
+
+def test_cancelled_request_kept_for_followers():
+    """A cancelled leader still asks if a real caller joined its request."""
+    inner = SlowLLM()
+    client = SingleFlightLLM(inner, max_concurrent=1)
+    cancel = threading.Event()
+
+    busy, _ = _ask_in_threads(client, ["busy"])
+    _wait_for(lambda: inner.calls)
+    leader = threading.Thread(target=client.ask, args=("guess",), kwargs={"cancel": cancel})
+    leader.start()
+    _wait_for(lambda: client.limiter.queued == 1)
+    followers, results = _ask_in_threads(client, ["Guess?"])
+    _wait_for(lambda: client.stats.coalesced == 1)
+
+    cancel.set()
+    time.sleep(0.1)
+    inner.release.set()
+    for t in busy + [leader] + followers:
+        t.join(2)
+
+    assert results == ["answer to guess"]
+    assert inner.calls == ["busy", "guess"]
+    assert client.stats.withdrawn == 0
+    assert client.stats.max_queue_wait_s < 1.0  # the leader kept its place in the queue
+
+
+def test_fair_limiter_withdraw_before_queueing():
+    limiter = FairLimiter(1)
+    assert limiter.acquire(withdraw=lambda: True) is None
+    assert limiter.acquire() == 0.0
+
+
+def test_withdrawn_flight_does_not_unregister_newer_leader():
+    """A new leader that registers the key right after a withdrawal keeps its flight."""
+    inner = SlowLLM()
+    client = SingleFlightLLM(inner)
+    newer = object()
+    key = client._key("guess")
+
+    class RacingLimiter:
+        def acquire(self, withdraw=None):
+            assert withdraw()
+            client._flights[key] = newer  # another caller becomes leader in the gap
+            return None
+
+    client.limiter = RacingLimiter()
+    cancel = threading.Event()
+    cancel.set()
+
+    assert client.ask("guess", cancel=cancel) is None
+    assert client._flights[key] is newer
@@ -0,0 +1,160 @@
+import threading
+from unittest.mock import ANY, MagicMock
+
+import pytest
+
+from jetvoice.llm.speculative import SpeculativeLLM
+
+
+def _make_llm(response="Sure thing"):
+    llm = MagicMock()
+    llm.ask.return_value = response
+    return llm
+
+
+def test_speculative_invalid_window_raises():
+    """stable_frames must be at least one frame."""
+    with pytest.raises(ValueError):
+        SpeculativeLLM(_make_llm(), stable_frames=0)
+
+
+def test_speculative_hit_reuses_early_request():
+    """
+    A partial that stays stable during a pause is dispatched once,
+    and a matching final transcript commits that result.
+    """
+    llm = _make_llm()
+    spec = SpeculativeLLM(llm, stable_frames=2)
+
+    spec.observe("turn on the lights", paused=False)
+    for _ in range(4):
+        spec.observe("turn on the lights", paused=True)
+
+    response = spec.resolve("Turn on  the lights")
+    spec.close()
+
+    assert response == "Sure thing"
+    llm.ask.assert_called_once_with("turn on the lights", cancel=ANY)
+    assert spec.stats.dispatched == 1
+    assert spec.stats.hits == 1
+    assert spec.stats.misses == 0
+
+
+def test_speculative_no_dispatch_while_speaking():
+    """An unchanged partial during speech frames must not trigger a request."""
+    llm = _make_llm()
+    spec = SpeculativeLLM(llm, stable_frames=2)
+
+    for _ in range(5):
+        spec.observe("what is", paused=False)
+
+    assert spec.stats.dispatched == 0
+    spec.close()
+    llm.ask.assert_not_called()
+
+
+def test_speculative_miss_asks_with_final_text():
+    """
+    If the speaker continues after a dispatch, the early request is discarded
+    and the final transcript is sent instead.
+    """
+    release = threading.Event()
+    llm = MagicMock()
+
+    def ask(prompt, cancel=None):
+        if prompt == "what is":
+            release.wait(timeout=1)
+            return "early answer"
+        return "final answer"
+
+    llm.ask.side_effect = ask
+    spec = SpeculativeLLM(llm, stable_frames=1)
+
+    spec.observe("what is", paused=False)
+    spec.observe("what is", paused=True)
+    assert spec.stats.dispatched == 1
+
+    spec.observe("what is the time", paused=False)
+    response = spec.resolve("what is the time")
+    release.set()
+    spec.close()
+
+    assert response == "final answer"
+    assert spec.stats.hits == 0
+    assert spec.stats.misses == 1
+
+
+def test_speculative_discard_on_empty_final():
+    """discard() drops a pending request and counts it as a miss."""
+    spec = SpeculativeLLM(_make_llm(), stable_frames=1)
+
+    spec.observe("hello", paused=False)
+    assert not spec.in_flight
+    spec.observe("hello", paused=True)
+    assert spec.in_flight
+    spec.discard()
+    spec.close()
+
+    assert not spec.in_flight
+    assert spec.stats.misses == 1
+    assert spec.stats.hit_rate == 0.0
+
+
+def test_speculative_discard_signals_cancel():
+    """A discarded speculation sets its cancel event so a queued request can withdraw."""
+    release = threading.Event()
+    started = threading.Event()
+    seen = []
+    llm = MagicMock()
+
+    def ask(prompt, cancel=None):
+        seen.append(cancel)
+        started.set()
+        release.wait(timeout=1)
+        return "early answer"
+
+    llm.ask.side_effect = ask
+    spec = SpeculativeLLM(llm, stable_frames=1)
+    spec.observe("hello", paused=False)
+    spec.observe("hello", paused=True)
+    started.wait(timeout=1)
+
+    spec.discard()
+    release.set()
+    spec.close()
+
+    assert seen and seen[0].is_set()
+
+
+def test_speculative_requests_carry_token_budget():
+    """
+    The prefetch is sent with the budget for its prompt, and a final
+    transcript asking with the same budget reuses it.
+    """
+    llm = _make_llm()
+    spec = SpeculativeLLM(llm, stable_frames=1, token_budget=lambda text: 60)
+
+    spec.observe("what time is it", paused=False)
+    spec.observe("what time is it", paused=True)
+    response = spec.resolve("What time is it", max_tokens=60)
+    spec.close()
+
+    assert response == "Sure thing"
+    llm.ask.assert_called_once_with("what time is it", max_tokens=60, cancel=ANY)
+    assert spec.stats.hits == 1
+
+
+def test_speculative_budget_mismatch_asks_again():
+    """A prefetch made with a different budget is not reused."""
+    llm = _make_llm()
+    spec = SpeculativeLLM(llm, stable_frames=1, token_budget=lambda text: 60)
+
+    spec.observe("tell me a story", paused=False)
+    spec.observe("tell me a story", paused=True)
+    response = spec.resolve("tell me a story", max_tokens=200)
+    spec.close()
+
+    assert response == "Sure thing"
+    llm.ask.assert_called_with("tell me a story", max_tokens=200)
+    assert spec.stats.hits == 0
+    assert spec.stats.misses == 1
@@ -0,0 +1,80 @@
+import json
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from jetvoice.streams.streams import FairSTTScheduler, Segmenter, parse_streams
+
+
+class FakeRecognizer:
+    """Returns the fed bytes' first character as the transcript."""
+
+    def __init__(self, *args):
+        self.data = b""
+
+    def SetWords(self, enabled):
+        pass
+
+    def AcceptWaveform(self, chunk):
+        self.data += chunk
+        return False
+
+    def FinalResult(self):
+        return json.dumps({"text": self.data[:1].decode()})
+
+
+def test_parse_streams():
+    specs = parse_streams("kitchen:2:speak, office:5:print,garage:7")
+
+    assert [(s.name, s.device, s.route) for s in specs] == [
+        ("kitchen", 2, "speak"), ("office", 5, "print"), ("garage", 7, "speak"),
+    ]
+
+
+@pytest.mark.parametrize("value", ["kitchen", "kitchen:2:shout", "a:1,a:2"])
+def test_parse_streams_rejects_invalid(value):
+    with pytest.raises(ValueError):
+        parse_streams(value)
+
+
+def test_segmenter_emits_utterance_after_silence():
+    """Same policy as the main loop: n_streak to start, n_silence to end."""
+    seg = Segmenter(n_streak=2, n_silence=3)
+    speech, silence = b"s" * 4, b"_" * 4
+
+    outputs = [seg.feed(speech, True) for _ in range(3)]
+    outputs += [seg.feed(silence, False) for _ in range(3)]
+
+    assert outputs[:-1] == [None] * 5
+    assert outputs[-1] == speech * 3 + silence * 3
+    assert not seg.in_speech
+
+
+def test_segmenter_ignores_short_blips():
+    seg = Segmenter(n_streak=3, n_silence=2)
+    assert seg.feed(b"s", True) is None
+    assert seg.feed(b"_", False) is None
+    assert not seg.in_speech
+
+
+def test_scheduler_interleaves_streams_fairly():
+    """A short utterance is not stuck behind a long one from another stream."""
+    results = []
+    done = threading.Event()
+
+    def on_result(stream, transcript):
+        results.append((stream, transcript.text))
+        if len(results) == 2:
+            done.set()
+
+    with patch("jetvoice.streams.streams.vosk.KaldiRecognizer", FakeRecognizer):
+        scheduler = FairSTTScheduler(16000, on_result=on_result, chunk_bytes=10)
+        # Hold the lock so both jobs are queued before the worker picks one
+        with scheduler._cond:
+            scheduler.submit("long", b"L" * 100)
+            scheduler.submit("short", b"S" * 10)
+        assert done.wait(timeout=5)
+        scheduler.close(timeout=5)
+
+    assert results == [("short", "S"), ("long", "L")]
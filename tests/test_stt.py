@@ -3,7 +3,8 @@
 import os
 import pytest
 import jiwer
-from jetvoice.stt.stt import transcribe_file
+from unittest.mock import MagicMock, patch
+from jetvoice.stt.stt import transcribe_file, StreamingTranscriber, Transcript
 
 # Define the path to the test audio file. This makes the test runnable from anywhere.
 TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -63,4 +64,144 @@ def test_transcribe_from_file(audio_file_path):
     print(f"Threshold     : {WER_THRESHOLD:.2%} ({WER_THRESHOLD})")
     print("------------------------")
     
-    assert wer <= WER_THRESHOLD, f"Word Error Rate ({wer:.2%}) is higher than the threshold ({WER_THRESHOLD:.2%})."
\ No newline at end of file
+    assert wer <= WER_THRESHOLD, f"Word Error Rate ({wer:.2%}) is higher than the threshold ({WER_THRESHOLD:.2%})."
+
+def test_transcript_from_vosk_result():
+    """
+    Word-level results from Vosk are exposed with timings and confidences.
+    """
+    result = {
+        "result": [
+            {"word": "hello", "start": 0.5, "end": 0.9, "conf": 0.8},
+            {"word": "there", "start": 1.0, "end": 1.4, "conf": 0.6},
+        ],
+        "text": "hello there",
+    }
+
+    transcript = Transcript.from_result(result)
+
+    assert transcript.text == "hello there"
+    assert [w.word for w in transcript.words] == ["hello", "there"]
+    assert transcript.confidence == pytest.approx(0.7)
+    assert transcript.duration == pytest.approx(0.9)
+    assert Transcript().confidence == 0.0
+
+def test_streaming_transcriber_times_decoding():
+    """
+    accept() time is accumulated per utterance so streaming STT has a real RTF.
+    """
+    with patch("jetvoice.stt.stt.vosk.KaldiRecognizer") as mock_cls:
+        recognizer = MagicMock()
+        recognizer.AcceptWaveform.return_value = False
+        recognizer.PartialResult.return_value = '{"partial": "hello"}'
+        recognizer.FinalResult.return_value = '{"text": "hello"}'
+        mock_cls.return_value = recognizer
+
+        streamer = StreamingTranscriber()
+        assert streamer.decode_s == 0.0
+        streamer.accept(b"\x00" * 640)
+        streamer.accept(b"\x00" * 640)
+        assert streamer.decode_s > 0.0
+
+        streamer.finish_result()
+        assert streamer.decode_s == 0.0
+
+def _wait_for_loader(stt):
+    loader = stt._loader
+    if loader is not None:
+        loader.join(timeout=5)
+
+@pytest.fixture
+def current_model():
+    """
+    Installs a stand-in model as the active one and restores the real one afterwards.
+    """
+    import jetvoice.stt.stt as stt
+
+    saved = (stt.model, stt._model_name, stt._wanted_name)
+    stt.model, stt._model_name, stt._wanted_name = MagicMock(name="base"), "base", "base"
+    yield stt
+    _wait_for_loader(stt)
+    stt.model, stt._model_name, stt._wanted_name = saved
+
+def test_use_model_releases_previous_model(current_model):
+    """
+    Only the model in use stays referenced after a switch.
+    """
+    import gc
+    import weakref
+
+    stt = current_model
+    old = weakref.ref(stt.model)
+    with patch("jetvoice.stt.stt.vosk.Model", return_value=MagicMock(name="small")) as mock_model:
+        stt.use_model("small")
+
+    assert mock_model.call_args[0][0].endswith(os.path.join("models", "small"))
+    assert stt.get_model() is mock_model.return_value
+    gc.collect()
+    assert old() is None
+
+def test_use_model_async_swaps_once_loaded(current_model):
+    """
+    The current model keeps serving while the new one loads off-thread.
+    """
+    import threading
+
+    stt = current_model
+    base = stt.model
+    loading, release = threading.Event(), threading.Event()
+    small = MagicMock(name="small")
+
+    def load(path):
+        loading.set()
+        release.wait(5)
+        return small
+
+    with patch("jetvoice.stt.stt.vosk.Model", side_effect=load):
+        stt.use_model_async("small")
+        assert loading.wait(5)
+        assert stt.get_model() is base
+        release.set()
+        _wait_for_loader(stt)
+
+    assert stt.get_model() is small
+    assert stt._loader is None
+
+def test_use_model_async_last_request_wins(current_model):
+    """
+    A switch requested mid-load is applied after the load finishes.
+    """
+    import threading
+
+    stt = current_model
+    loading, release = threading.Event(), threading.Event()
+    loaded = []
+
+    def load(path):
+        loading.set()
+        release.wait(5)
+        loaded.append(os.path.basename(path))
+        return MagicMock(name=loaded[-1])
+
+    with patch("jetvoice.stt.stt.vosk.Model", side_effect=load):
+        stt.use_model_async("small")
+        assert loading.wait(5)
+        stt.use_model_async("tiny")
+        release.set()
+        _wait_for_loader(stt)
+
+    assert loaded == ["small", "tiny"]
+    assert stt._model_name == "tiny"
+
+def test_use_model_async_keeps_model_when_load_fails(current_model):
+    """
+    A missing model leaves the current one in place.
+    """
+    stt = current_model
+    base = stt.model
+    with patch("jetvoice.stt.stt.vosk.Model", side_effect=Exception("missing")):
+        stt.use_model_async("small")
+        _wait_for_loader(stt)
+
+    assert stt.get_model() is base
+    assert stt._wanted_name == "base"
@@ -0,0 +1,124 @@
+import json
+import os
+import shutil
+import subprocess
+import sys
+import wave
+from unittest.mock import patch
+
+from jetvoice.vad.sweep import replay_segments, summarize, sweep, vad_decisions, word_errors, _new_totals
+from jetvoice.vad.vad import WebRTCVAD
+
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+TEST_WAV = os.path.join(BASE_DIR, "assets", "test_speech.wav")
+
+
+def _labeled_copy(tmp_path, text="hello world"):
+    wav_path = str(tmp_path / "speech.wav")
+    shutil.copy(TEST_WAV, wav_path)
+    with wave.open(wav_path, "rb") as wf:
+        duration = wf.getnframes() / wf.getframerate()
+    with open(tmp_path / "speech.json", "w") as f:
+        json.dump({"speech": [[0.0, duration]], "text": text}, f)
+    return wav_path
+
+
+def test_word_errors():
+    assert word_errors("turn the lights on", "turn the lights on") == (0, 4)
+    assert word_errors("turn the lights on", "turn lights off") == (2, 4)
+    assert word_errors("hello", "") == (1, 1)
+
+
+def test_replay_segments_matches_main_loop_policy():
+    s, n = True, False
+    decisions = [n, s, n, s, s, s, n, n, s, n, n, n, s]
+
+    utterances = replay_segments(decisions, n_streak=3, n_silence=3)
+
+    # The lone frame before the streak stays in the segment, as in main.main
+    assert utterances == [(1, 3, 4, 5, 6, 7, 8, 9, 10, 11)]
+    # A longer silence timeout leaves the utterance open at end of file
+    assert replay_segments(decisions, n_streak=3, n_silence=5) == []
+
+
+def test_vad_decisions_are_cached(tmp_path):
+    wav_path = _labeled_copy(tmp_path)
+    cache_dir = str(tmp_path / "cache")
+
+    first = vad_decisions(wav_path, 2, cache_dir=cache_dir)
+    with patch.object(WebRTCVAD, "classify_frames", side_effect=AssertionError("VAD re-run")):
+        second = vad_decisions(wav_path, 2, cache_dir=cache_dir)
+
+    assert first == second
+    assert any(first)
+
+
+def test_vad_decisions_cache_tells_same_named_files_apart(tmp_path):
+    speech_dir, silent_dir = tmp_path / "speech", tmp_path / "silent"
+    speech_dir.mkdir()
+    silent_dir.mkdir()
+    speech_path = _labeled_copy(speech_dir)
+    silent_path = str(silent_dir / "speech.wav")
+    with wave.open(silent_path, "wb") as wf:
+        wf.setnchannels(1)
+        wf.setsampwidth(2)
+        wf.setframerate(16000)
+        wf.writeframes(b"\x00\x00" * 16000)
+    # Same name and mtime, so only the path tells the cache entries apart
+    mtime_ns = os.stat(speech_path).st_mtime_ns
+    os.utime(silent_path, ns=(mtime_ns, mtime_ns))
+    cache_dir = str(tmp_path / "cache")
+
+    speech = vad_decisions(speech_path, 2, cache_dir=cache_dir)
+    silent = vad_decisions(silent_path, 2, cache_dir=cache_dir)
+
+    assert any(speech)
+    assert not any(silent)
+    assert len(os.listdir(cache_dir)) == 2
+
+
+def test_sweep_import_does_not_load_stt():
+    """A --no-stt sweep must not pay for loading the Vosk model."""
+    code = "import sys, jetvoice.vad.sweep; print('jetvoice.stt' in sys.modules)"
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert out.stdout.strip() == "False"
+
+
+def test_sweep_reports_metrics_per_configuration(tmp_path):
+    wav_path = _labeled_copy(tmp_path)
+    calls = []
+
+    def fake_transcriber(pcm, sample_rate):
+        calls.append(len(pcm))
+        return "hello world"
+
+    grid = [(2, 3, 5), (2, 3, 10), (3, 3, 5)]
+    results = sweep(
+        [wav_path],
+        grid=grid,
+        cache_dir=str(tmp_path / "cache"),
+        transcriber=fake_transcriber,
+        workers=1,
+    )
+
+    assert set(results) == set(grid)
+    for r in results.values():
+        assert r["files"] == 1
+        assert r["false_triggers"] == 0
+        assert 0.0 <= r["clipped_onset_rate"] <= 1.0
+    detected = [r for r in results.values() if r["utterances"]]
+    assert detected and all(r["wer"] is not None for r in detected)
+    assert len(calls) <= sum(r["utterances"] for r in results.values())
+
+
+def test_summarize_without_references():
+    totals = _new_totals()
+    totals.update(labeled=2, missed=1, clipped=1, delays_s=[0.2, 0.4], audio_s=120.0, false_triggers=3)
+
+    r = summarize(totals)
+
+    assert r["wer"] is None
+    assert r["missed_rate"] == 0.5
+    assert abs(r["eos_delay_mean_s"] - 0.3) < 1e-9
+    assert r["false_triggers_per_min"] == 1.5
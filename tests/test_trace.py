@@ -0,0 +1,113 @@
+import json
+import os
+import signal
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from jetvoice.trace.trace import Tracer, tracer as global_tracer
+
+
+def test_disabled_tracer_records_nothing():
+    tracer = Tracer()
+
+    with tracer.span("stt"):
+        pass
+    tracer.complete("queue", time.perf_counter_ns())
+    tracer.instant("resync")
+    tracer.counter("lag", 1.0)
+
+    assert tracer.events() == []
+    assert tracer._ring == []
+
+
+def test_span_records_complete_event_with_thread():
+    tracer = Tracer()
+    tracer.enable(16)
+
+    with tracer.span("llm", cat="stage", model="m"):
+        time.sleep(0.002)
+
+    (phase, name, cat, _, dur_ns, tid, args), = tracer.events()
+    assert (phase, name, cat) == ("X", "llm", "stage")
+    assert dur_ns >= 2_000_000
+    assert tid == threading.get_native_id()
+    assert args == {"model": "m"}
+
+
+def test_ring_keeps_newest_events_in_order():
+    tracer = Tracer()
+    tracer.enable(4)
+
+    for i in range(10):
+        tracer.instant(f"e{i}")
+
+    assert [e[1] for e in tracer.events()] == ["e6", "e7", "e8", "e9"]
+
+
+def test_cross_thread_queue_wait():
+    tracer = Tracer()
+    tracer.enable(16)
+    submitted = time.perf_counter_ns()
+
+    worker = threading.Thread(target=lambda: tracer.complete("tts.queue_wait", submitted, cat="queue"),
+                              name="jetvoice-tts")
+    worker.start()
+    worker.join()
+
+    chrome = tracer.to_chrome()
+    names = {e["args"]["name"] for e in chrome["traceEvents"] if e["ph"] == "M"}
+    assert "jetvoice-tts" in names
+
+
+def test_dump_writes_chrome_trace(tmp_path):
+    tracer = Tracer()
+    tracer.enable(16)
+    with tracer.span("turn", cat="turn"):
+        tracer.counter("capture_lag_ms", 12.5)
+
+    path = tracer.dump(str(tmp_path / "trace.json"))
+    with open(path) as f:
+        data = json.load(f)
+
+    events = {e["name"]: e for e in data["traceEvents"] if e["ph"] != "M"}
+    assert events["turn"]["ph"] == "X" and events["turn"]["dur"] >= 0
+    assert events["capture_lag_ms"]["args"] == {"capture_lag_ms": 12.5}
+    assert all(e["pid"] == os.getpid() for e in data["traceEvents"])
+
+
+@pytest.mark.skipif(not hasattr(signal, "SIGUSR1"), reason="SIGUSR1 not available")
+def test_signal_dumps_trace(tmp_path):
+    tracer = Tracer()
+    tracer.enable(16)
+    tracer.instant("hello")
+    previous = signal.getsignal(signal.SIGUSR1)
+    try:
+        tracer.install_signal_handler(str(tmp_path))
+        os.kill(os.getpid(), signal.SIGUSR1)
+        time.sleep(0.05)
+    finally:
+        signal.signal(signal.SIGUSR1, previous)
+
+    assert [p.suffix for p in tmp_path.iterdir()] == [".json"]
+
+
+def test_enable_rejects_zero_capacity():
+    with pytest.raises(ValueError):
+        Tracer().enable(0)
+
+
+def test_singleflight_reports_queue_wait():
+    from jetvoice.llm.singleflight import SingleFlightLLM
+
+    inner = SimpleNamespace(system_prompt="s", model="m", max_tokens=None, ask=lambda prompt: "ok")
+    global_tracer.enable(16)
+    try:
+        SingleFlightLLM(inner).ask("hello")
+        names = [e[1] for e in global_tracer.events()]
+    finally:
+        global_tracer.disable()
+
+    assert "llm.queue_wait" in names
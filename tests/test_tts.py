@@ -30,7 +30,9 @@ def mock_subprocess():
     """
     Prevents any actual shell commands (espeak/mpg123) from running.
     """
-    with patch("jetvoice.tts.tts.subprocess.run") as mock_sub:
+    with patch("jetvoice.tts.tts.subprocess.run"), \
+         patch("jetvoice.tts.tts.subprocess.Popen") as mock_sub:
+        mock_sub.return_value.wait.return_value = 0
         yield mock_sub
 
 def test_tts_init_configure(mock_environment, mock_pyttsx3_module):
@@ -138,4 +140,55 @@ def test_online_mode_logic(mock_pyttsx3_module, mock_subprocess):
             # Should call mpg123 via subprocess
             mock_subprocess.assert_called_once()
             args = mock_subprocess.call_args[0][0]
-            assert args[0] == "mpg123"
\ No newline at end of file
+            assert args[0] == "mpg123"
+
+def test_set_online_inits_offline_engine(mock_pyttsx3_module, mock_subprocess):
+    """
+    Switching an online instance to offline initializes pyttsx3 lazily.
+    """
+    mock_module, mock_engine = mock_pyttsx3_module
+    with patch.dict(os.environ, {"TTS_ONLINE": "true"}):
+        tts = JetVoiceTTS()
+
+    assert tts.engine is None
+    tts.set_online(False)
+
+    assert tts.use_online is False
+    assert tts.engine == mock_engine
+    mock_module.init.assert_called_once()
+
+def test_synthesize_renders_to_pcm(mock_environment, mock_pyttsx3_module, mock_subprocess):
+    """
+    synthesize() renders through pyttsx3's save_to_file instead of playing.
+    """
+    _, mock_engine = mock_pyttsx3_module
+    with patch("jetvoice.tts.tts.load_wav", return_value=b"pcm") as mock_load:
+        tts = JetVoiceTTS()
+        assert tts.synthesize("hello", sample_rate=16000) == b"pcm"
+
+    mock_engine.save_to_file.assert_called_once()
+    mock_engine.runAndWait.assert_called_once()
+    assert mock_load.call_args.kwargs["out_rate"] == 16000
+    mock_subprocess.assert_not_called()
+
+def test_player_terminated_when_cancelled(mock_environment, mock_pyttsx3_module, mock_subprocess):
+    """
+    A running espeak/mpg123 player is terminated once should_stop() turns True.
+    """
+    import subprocess
+    process = mock_subprocess.return_value
+    process.wait.side_effect = [subprocess.TimeoutExpired("mpg123", 0.05), subprocess.TimeoutExpired("mpg123", 0.05), 0]
+    stop = iter([False, False, True])
+
+    tts = JetVoiceTTS()
+    tts.should_stop = lambda: next(stop)
+
+    assert tts._run_player(["mpg123", "-q", "reply.mp3"]) is False
+    process.terminate.assert_called_once()
+
+def test_player_skipped_when_already_cancelled(mock_environment, mock_pyttsx3_module, mock_subprocess):
+    tts = JetVoiceTTS()
+    tts.should_stop = lambda: True
+
+    assert tts._run_player(["espeak", "hello"]) is False
+    mock_subprocess.assert_not_called()
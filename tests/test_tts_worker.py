@@ -0,0 +1,217 @@
+import threading
+import time
+from unittest.mock import MagicMock
+
+from jetvoice.tts.worker import (
+    CANCELLED, DONE, FAILED, PRIORITY_HIGH, PRIORITY_LOW, CancelToken, TTSWorker,
+)
+
+
+class FakeTTS:
+    """
+    Records what was spoken and on which thread; blocks on `gate` while speaking.
+    """
+
+    def __init__(self):
+        self.engine = None
+        self.use_online = False
+        self.spoken = []
+        self.threads = set()
+        self.gate = threading.Event()
+        self.gate.set()
+        self.started = threading.Event()
+
+    def speak(self, text):
+        self.threads.add(threading.get_ident())
+        self.started.set()
+        self.gate.wait(5)
+        if text == "explode":
+            raise RuntimeError("driver lost")
+        self.spoken.append(text)
+
+    def synthesize(self, text, sample_rate=16000):
+        self.threads.add(threading.get_ident())
+        return b"\x00\x01" * len(text)
+
+    def set_online(self, online):
+        self.use_online = online
+
+
+def _worker(**kwargs):
+    fake = FakeTTS()
+    inits = []
+
+    def make_tts():
+        inits.append(threading.get_ident())
+        return fake
+
+    return TTSWorker(make_tts=make_tts, **kwargs), fake, inits
+
+
+def test_worker_initializes_engine_once_on_its_thread():
+    worker, fake, inits = _worker()
+    worker.speak("one")
+    worker.speak("two")
+    worker.close(timeout=2)
+
+    assert len(inits) == 1
+    assert fake.threads == set(inits)
+    assert threading.get_ident() not in inits
+    assert fake.spoken == ["one", "two"]
+
+
+def test_submit_does_not_block_and_reports_completion():
+    events = []
+    worker, fake, _ = _worker(on_event=events.append)
+    fake.gate.clear()
+
+    job = worker.submit("hello")
+    assert fake.started.wait(2)
+    assert not job.done
+
+    fake.gate.set()
+    assert job.wait(2)
+    worker.close(timeout=2)
+
+    assert job.status == DONE
+    assert [(e.job_id, e.status) for e in events] == [(job.id, DONE)]
+
+
+def test_jobs_run_by_priority():
+    worker, fake, _ = _worker()
+    fake.gate.clear()
+    first = worker.submit("busy")
+    assert fake.started.wait(2)
+
+    low = worker.submit("low", priority=PRIORITY_LOW)
+    high = worker.submit("high", priority=PRIORITY_HIGH)
+    fake.gate.set()
+    for job in (first, low, high):
+        job.wait(2)
+    worker.close(timeout=2)
+
+    assert fake.spoken == ["busy", "high", "low"]
+
+
+def test_cancelled_jobs_are_skipped():
+    worker, fake, _ = _worker()
+    fake.gate.clear()
+    worker.submit("busy")
+    assert fake.started.wait(2)
+
+    token = CancelToken()
+    a = worker.submit("a", token=token)
+    b = worker.submit("b", token=token)
+    c = worker.submit("c")
+    token.cancel()
+    fake.gate.set()
+    c.wait(2)
+    worker.close(timeout=2)
+
+    assert a.status == CANCELLED and b.status == CANCELLED
+    assert c.status == DONE
+    assert fake.spoken == ["busy", "c"]
+
+
+def test_close_cancels_pending_jobs():
+    worker, fake, _ = _worker()
+    fake.gate.clear()
+    worker.submit("busy")
+    assert fake.started.wait(2)
+    queued = worker.submit("queued")
+
+    threading.Timer(0.05, fake.gate.set).start()
+    worker.close(timeout=2)
+
+    assert queued.done and queued.status == CANCELLED
+
+
+def test_failed_job_does_not_stop_worker():
+    worker, fake, _ = _worker()
+    bad = worker.submit("explode")
+    good = worker.submit("fine")
+    good.wait(2)
+    worker.close(timeout=2)
+
+    assert bad.status == FAILED
+    assert good.status == DONE
+
+
+def test_synthesize_returns_pcm():
+    worker, _, _ = _worker()
+    assert worker.synthesize("abc") == b"\x00\x01" * 3
+    worker.close(timeout=2)
+
+
+def test_set_online_applies_on_worker_thread():
+    worker, fake, _ = _worker()
+    worker.set_online(True)
+    assert worker.use_online is True
+    worker.speak("hi")
+    worker.close(timeout=2)
+
+    assert fake.use_online is True
+
+
+def test_cancel_stops_pyttsx3_at_word_boundary():
+    worker, fake, _ = _worker()
+    fake.engine = MagicMock()
+    worker._tts = fake
+    job = worker.submit("long reply")
+    job.wait(2)
+
+    worker._current = job
+    worker._on_word("utterance", 0, 4)
+    fake.engine.stop.assert_not_called()
+    job.cancel()
+    worker._on_word("utterance", 5, 5)
+    fake.engine.stop.assert_called_once()
+    worker.close(timeout=2)
+
+
+
+def test_lazily_created_engine_gets_cancel_hook():
+    worker, fake, _ = _worker()
+    engine = MagicMock()
+
+    def set_online(online):
+        fake.use_online = online
+        fake.engine = engine
+
+    fake.use_online = True
+    fake.set_online = set_online
+    worker.set_online(False)
+    worker.speak("offline now")
+    worker.close(timeout=2)
+
+    engine.connect.assert_called_once_with("started-word", worker._on_word)
+
+
+def test_worker_lets_tts_stop_players_on_cancel():
+    worker, fake, _ = _worker()
+    fake.gate.clear()
+    job = worker.submit("long reply")
+    fake.started.wait(2)
+
+    assert fake.should_stop() is False
+    job.cancel()
+    assert fake.should_stop() is True
+    fake.gate.set()
+    worker.close(timeout=2)
+
+
+def test_playback_timed_from_audio_start():
+    worker, fake, _ = _worker()
+
+    def speak_after_download(text):
+        time.sleep(0.1)  # gTTS download / player startup
+        fake.audio_started_at = time.monotonic()
+        fake.spoken.append(text)
+
+    fake.speak = speak_after_download
+    job = worker.submit("hello")
+    job.wait(2)
+    worker.close(timeout=2)
+
+    assert job.elapsed_s >= 0.1
+    assert job.audio_s is not None and job.audio_s < 0.05
@@ -1,9 +1,13 @@
 import os
 import wave
 
+import numpy as np
 import pytest
+from unittest.mock import MagicMock
 
-from jetvoice.vad.vad import WebRTCVAD
+from jetvoice.vad.vad import WebRTCVAD, VADBackend, create_vad
+from jetvoice.vad.onnx_vad import OnnxVAD
+from jetvoice.vad.compare import frame_labels, score
 
 
 ASSETS_DIR = os.path.join(os.path.dirname(__file__), "assets")
@@ -64,3 +68,96 @@ def test_vad_does_not_flag_pure_silence():
 
     assert not vad.has_speech(silence)
     assert vad.count_speech_frames(silence) == 0
+
+
+def test_webrtc_is_backend_and_batch_matches_single():
+    """
+    classify_frames gives the same answers as the per-chunk API.
+    WebRTC VAD keeps internal state, so each pass uses a fresh instance.
+    """
+    vad = create_vad("webrtc", sample_rate=16000, frame_duration_ms=20, aggressiveness=2)
+    reference = WebRTCVAD(sample_rate=16000, frame_duration_ms=20, aggressiveness=2)
+    assert isinstance(vad, VADBackend)
+
+    with wave.open(TEST_WAV, "rb") as wf:
+        audio = wf.readframes(wf.getnframes())
+
+    frames = list(vad._iter_frames(audio))
+    flags = vad.classify_frames(frames)
+
+    assert len(flags) == len(frames)
+    assert sum(flags) == reference.count_speech_frames(audio)
+
+
+def test_create_vad_rejects_unknown_backend():
+    with pytest.raises(ValueError):
+        create_vad("silero-gpu")
+    with pytest.raises(ValueError):
+        create_vad("onnx", model_path=None)
+
+
+TINY_VAD = os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets", "tiny_vad.onnx")
+
+
+@pytest.fixture
+def tiny_vad():
+    """OnnxVAD on a checked-in model with the Silero v5 interface (make_tiny_vad.py)."""
+    pytest.importorskip("onnxruntime")
+    return OnnxVAD(TINY_VAD, sample_rate=16000, frame_duration_ms=20, threshold=0.5)
+
+
+def _frames(level, seconds):
+    frame = np.full(320, level, dtype="<i2").tobytes()
+    return [frame] * int(seconds * 50)
+
+
+def test_onnx_vad_runs_silero_windows_in_order(tiny_vad):
+    """20 ms frames map onto 32 ms windows; the state carries a loud window into the next."""
+    loud = _frames(8000, 0.32)    # 16 frames = 10 windows
+    quiet = _frames(0, 0.32)
+
+    probs = tiny_vad.speech_probabilities(loud + quiet)
+
+    assert len(probs) == 32
+    assert probs[0] == 0.0          # no window completed yet
+    assert probs[1] > 0.99          # frame 2 ends past the first 512-sample window
+    # First quiet windows still read as speech through the recurrent state, then decay
+    assert probs[17] > 0.5
+    assert probs[-1] < 0.1
+    assert len(tiny_vad._pending) == (32 * 320) % 512
+
+
+def test_onnx_vad_state_spans_calls(tiny_vad):
+    """Classifying in pieces matches one call; reset() forgets the state."""
+    frames = _frames(8000, 0.2) + _frames(0, 0.3)
+    whole = tiny_vad.classify_frames(frames)
+
+    tiny_vad.reset()
+    pieces = []
+    for i in range(0, len(frames), 3):
+        pieces.extend(tiny_vad.classify_frames(frames[i:i + 3]))
+
+    assert pieces == whole
+    tiny_vad.reset()
+    assert tiny_vad.classify_frames(_frames(0, 0.1)) == [False] * 5
+
+
+def test_onnx_vad_rejects_unsupported_rate():
+    with pytest.raises(ValueError):
+        OnnxVAD("unused.onnx", sample_rate=48000, session=MagicMock())
+
+
+def test_compare_scoring():
+    """Frame labels come from segment times and feed precision/recall."""
+    truth = frame_labels([(0.0, 0.1)], n_frames=10, frame_duration_ms=20)
+    assert truth == [True] * 5 + [False] * 5
+
+    result = score([True] * 4 + [False] * 5 + [True], truth)
+    assert result["precision"] == pytest.approx(0.8)
+    assert result["recall"] == pytest.approx(0.8)
+
+
+def test_vad_backend_is_abstract():
+    """Backends must implement classify_frames."""
+    with pytest.raises(TypeError):
+        VADBackend()
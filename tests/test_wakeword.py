@@ -0,0 +1,70 @@
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from jetvoice.stt.wakeword import WakeWordSpotter, contains_phrase, strip_phrase
+
+
+FRAME = b"\x00" * 640
+
+
+@pytest.fixture
+def mock_recognizer():
+    """
+    Replaces the Vosk recognizer so partial results can be scripted.
+    """
+    with patch("jetvoice.stt.wakeword.vosk.KaldiRecognizer") as mock_cls:
+        recognizer = MagicMock()
+        recognizer.AcceptWaveform.return_value = False
+        mock_cls.return_value = recognizer
+        yield mock_cls, recognizer
+
+
+def test_phrase_helpers():
+    """Phrase matching is word-based and case-insensitive."""
+    assert contains_phrase("uh Hey Jetson what time is it", "hey jetson")
+    assert not contains_phrase("hey jet son", "hey jetson")
+    assert strip_phrase("hey jetson what time is it", "hey jetson") == "what time is it"
+    assert strip_phrase("what time is it", "hey jetson") == "what time is it"
+
+
+def test_spotter_empty_phrase_raises(mock_recognizer):
+    with pytest.raises(ValueError):
+        WakeWordSpotter("   ")
+
+
+def test_spotter_uses_restricted_grammar(mock_recognizer):
+    """The recognizer is built with only the wake phrase and [unk]."""
+    mock_cls, _ = mock_recognizer
+    WakeWordSpotter("Hey Jetson", sample_rate=16000)
+
+    grammar = json.loads(mock_cls.call_args[0][2])
+    assert grammar == ["hey jetson", "[unk]"]
+
+
+def test_spotter_uses_model_selected_by_use_model(mock_recognizer):
+    """The model is looked up at construction, not pinned at import."""
+    mock_cls, _ = mock_recognizer
+    smaller = object()
+    with patch("jetvoice.stt.stt.model", smaller):
+        WakeWordSpotter("hey jetson")
+
+    assert mock_cls.call_args[0][0] is smaller
+
+
+def test_spotter_detects_phrase_once(mock_recognizer):
+    """Detection fires on the partial containing the phrase and resets the decoder."""
+    _, recognizer = mock_recognizer
+    recognizer.PartialResult.side_effect = [
+        json.dumps({"partial": "[unk]"}),
+        json.dumps({"partial": "hey jetson"}),
+        json.dumps({"partial": ""}),
+    ]
+    spotter = WakeWordSpotter("hey jetson")
+
+    results = [spotter.accept(FRAME) for _ in range(3)]
+
+    assert results == [False, True, False]
+    assert spotter.detections == 1
+    recognizer.Reset.assert_called_once()